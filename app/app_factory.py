@@ -1,17 +1,25 @@
 from flask import Flask
 from datetime import datetime
+from functools import partial
+import threading
+import atexit
 
 from app.config import AppConfig
 from app.extensions import init_csrf, init_login_manager, load_jwt_manager, init_migrate
 from app.frontend.routes import register_routes
 from app.infrastructure.database.db_config import init_db, db
+from app.infrastructure.database.buffer_progreso import BufferProgreso
+from app.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from app.infrastructure.cache import CacheEntidades, CacheMemoria, CacheRedis
 from app.infrastructure.database.repositories import (
     SQLAlchemyLibroRepository,
     SQLAlchemyAutorRepository,
     SQLAlchemySerieRepository,
     SQLAlchemyMarcadorRepository,
     SQLAlchemyProgresoRepository,
-    SQLAlchemyUsuarioRepository
+    SQLAlchemyUsuarioRepository,
+    SQLAlchemyArchivoEscaneadoRepository,
+    SQLAlchemyBusquedaRepository
 )
 from app.infrastructure.services import (
     LibroServiceImpl,
@@ -19,7 +27,8 @@ from app.infrastructure.services import (
     SerieServiceImpl,
     MarcadorServiceImpl,
     ProgresoServiceImpl,
-    UsuarioServiceImpl
+    UsuarioServiceImpl,
+    BusquedaServiceImpl
 )
 from app.application.services.metadata import (
     FolderMetadataBuilder,
@@ -29,6 +38,12 @@ from app.application.services.metadata import (
     OpenLibraryAuthorAdapter,
     OpenLibraryCoverAdapter,
     GoogleBooksAdapter,
+    HttpClient,
+    ResponseCache,
+    ExtractionCache,
+    LocalMetadataExtractor,
+    AsyncEnrichmentEngine,
+    EnrichmentQueue,
 )
 from app.application.services import ScannerService
 
@@ -39,6 +54,7 @@ def create_app():
         static_folder="../frontend/static"
     )
     application.config.from_object(AppConfig)
+    application.config["SQLALCHEMY_DATABASE_URI"] = AppConfig().get_database_url()
 
     # Inicializar extensiones
     init_db(application)
@@ -47,29 +63,96 @@ def create_app():
     init_migrate(application, db)
 
     # Repositorios
-    libro_repo = SQLAlchemyLibroRepository()
-    autor_repo = SQLAlchemyAutorRepository()
-    serie_repo = SQLAlchemySerieRepository()
-    marcador_repo = SQLAlchemyMarcadorRepository()
-    progreso_repo = SQLAlchemyProgresoRepository()
-    usuario_repo = SQLAlchemyUsuarioRepository()
+    libro_repo = SQLAlchemyLibroRepository(db.session)
+    autor_repo = SQLAlchemyAutorRepository(db.session)
+    serie_repo = SQLAlchemySerieRepository(db.session)
+    marcador_repo = SQLAlchemyMarcadorRepository(db.session)
+    progreso_repo = SQLAlchemyProgresoRepository(db.session)
+    usuario_repo = SQLAlchemyUsuarioRepository(db.session)
+    manifest_repo = SQLAlchemyArchivoEscaneadoRepository(db.session)
+    busqueda_repo = SQLAlchemyBusquedaRepository(db.session)
+
+    # Caché de entidades
+    entidades_cache = CacheEntidades()
+    if AppConfig.ENTITY_CACHE_TTL:
+        if AppConfig.ENTITY_CACHE_REDIS_URL:
+            cache_backend = CacheRedis.desde_url(AppConfig.ENTITY_CACHE_REDIS_URL)
+        else:
+            cache_backend = CacheMemoria(max_entradas=AppConfig.ENTITY_CACHE_MAX_ENTRIES)
+        entidades_cache = CacheEntidades(cache_backend, ttl=AppConfig.ENTITY_CACHE_TTL, session=db.session)
 
     # Servicios
-    libro_service = LibroServiceImpl(libro_repo)
-    autor_service = AutorServiceImpl(autor_repo)
-    serie_service = SerieServiceImpl(serie_repo)
+    libro_service = LibroServiceImpl(libro_repo, cache=entidades_cache)
+    autor_service = AutorServiceImpl(autor_repo, cache=entidades_cache)
+    serie_service = SerieServiceImpl(serie_repo, cache=entidades_cache)
     marcador_service = MarcadorServiceImpl(marcador_repo)
-    progreso_service = ProgresoServiceImpl(progreso_repo)
-    usuario_service = UsuarioServiceImpl(usuario_repo)
+    progreso_buffer = None
+    if AppConfig.PROGRESS_FLUSH_INTERVAL:
+        progreso_buffer = BufferProgreso(
+            progreso_repo,
+            intervalo=AppConfig.PROGRESS_FLUSH_INTERVAL,
+            max_pendientes=AppConfig.PROGRESS_BUFFER_MAX,
+            contexto=application.app_context
+        )
+    progreso_service = ProgresoServiceImpl(progreso_repo, buffer=progreso_buffer)
+    usuario_service = UsuarioServiceImpl(usuario_repo, cache=entidades_cache)
+    busqueda_service = BusquedaServiceImpl(busqueda_repo)
     folder_builder = FolderMetadataBuilder()
     epub_extractor = EpubMetadataExtractor()
-    pdf_extractor = PdfMetadataExtractor()
+    pdf_extractor = PdfMetadataExtractor(
+        lazy=AppConfig.PDF_LAZY,
+        max_bytes=AppConfig.PDF_MAX_BYTES,
+        timeout=AppConfig.PDF_TIMEOUT
+    )
+    extraction_cache = None
+    if AppConfig.EXTRACTION_CACHE_PATH:
+        extraction_cache = ExtractionCache(
+            path=AppConfig.EXTRACTION_CACHE_PATH,
+            version=LocalMetadataExtractor.VERSION,
+            max_bytes=AppConfig.EXTRACTION_CACHE_MAX_MB * 1024 * 1024 or None
+        )
+    response_cache = None
+    if AppConfig.HTTP_CACHE_PATH:
+        response_cache = ResponseCache(
+            path=AppConfig.HTTP_CACHE_PATH,
+            ttl_acierto=AppConfig.HTTP_CACHE_TTL_ACIERTO * 3600,
+            ttl_fallo=AppConfig.HTTP_CACHE_TTL_FALLO * 3600,
+            max_entradas=AppConfig.HTTP_CACHE_MAX_ENTRADAS
+        )
+    http_client = HttpClient(
+        connect_timeout=AppConfig.HTTP_CONNECT_TIMEOUT,
+        read_timeout=AppConfig.HTTP_READ_TIMEOUT,
+        retries=AppConfig.HTTP_RETRIES,
+        backoff=AppConfig.HTTP_BACKOFF,
+        pool_size=AppConfig.HTTP_POOL_SIZE,
+        user_agent=f"{AppConfig.APP_NAME}/{AppConfig.APP_VERSION} ({AppConfig.APP_URL})",
+        cache=response_cache,
+        rate_limit=AppConfig.HTTP_RATE_LIMIT,
+        rate_limits=AppConfig.HTTP_RATE_LIMITS,
+        rate_burst=AppConfig.HTTP_RATE_BURST,
+        breaker_threshold=AppConfig.HTTP_BREAKER_THRESHOLD,
+        breaker_cooldown=AppConfig.HTTP_BREAKER_COOLDOWN
+    )
     book_providers = [
-        OpenLibraryBookAdapter(),
-        GoogleBooksAdapter()
+        OpenLibraryBookAdapter(http_client),
+        GoogleBooksAdapter(http_client)
     ]
-    author_provider = OpenLibraryAuthorAdapter()
+    enrichment_engine = AsyncEnrichmentEngine(
+        providers=book_providers,
+        estrategia=AppConfig.ENRICH_STRATEGY,
+        deadline=AppConfig.ENRICH_DEADLINE,
+        max_concurrencia=AppConfig.ENRICH_CONCURRENCY
+    )
+    author_provider = OpenLibraryAuthorAdapter(http_client)
     cover_provider = OpenLibraryCoverAdapter()
+    enrichment_queue = None
+    if AppConfig.ENRICH_DEFERRED:
+        enrichment_queue = EnrichmentQueue(
+            path=AppConfig.ENRICH_QUEUE_PATH,
+            max_intentos=AppConfig.ENRICH_MAX_RETRIES,
+            espera_reintento=AppConfig.ENRICH_RETRY_DELAY,
+            concesion=AppConfig.ENRICH_LEASE
+        )
 
     # Scanner
     scanner = ScannerService(
@@ -81,7 +164,19 @@ def create_app():
         cover_provider=cover_provider,
         libro_service=libro_service,
         autor_service=autor_service,
-        serie_service=serie_service
+        serie_service=serie_service,
+        manifest_repo=manifest_repo,
+        extraction_cache=extraction_cache,
+        enrichment_engine=enrichment_engine,
+        workers=AppConfig.SCANNER_WORKERS,
+        io_workers=AppConfig.SCANNER_IO_WORKERS,
+        queue_size=AppConfig.SCANNER_QUEUE_SIZE,
+        enrich_batch_size=AppConfig.SCANNER_ENRICH_BATCH,
+        enrichment_queue=enrichment_queue,
+        enrich_workers=AppConfig.ENRICH_WORKERS,
+        enrichment_context=application.app_context,
+        unit_of_work=SQLAlchemyUnitOfWork(db.session),
+        write_batch_size=AppConfig.SCANNER_WRITE_BATCH
     )
 
     # Registrar rutas
@@ -90,6 +185,30 @@ def create_app():
     with application.app_context():
         db.create_all()
 
+    # Hilos en segundo plano: arrancan con la primera petición, no al crear la aplicación,
+    # para que los comandos de la CLI (flask db upgrade, flask shell...) no reclamen
+    # trabajos de la cola ni toquen la base de datos antes de las migraciones. Al cerrar,
+    # el worker termina su lote y el buffer guarda los progresos pendientes
+    segundo_plano = []
+    if scanner.enrichment_worker:
+        segundo_plano.append((scanner.enrichment_worker, partial(scanner.enrichment_worker.detener, AppConfig.ENRICH_DEADLINE * 2)))
+    if progreso_buffer:
+        segundo_plano.append((progreso_buffer, progreso_buffer.detener))
+    arranque = threading.Lock()
+    iniciados = threading.Event()
+
+    @application.before_request
+    def iniciar_segundo_plano():
+        if iniciados.is_set():
+            return
+        with arranque:
+            if iniciados.is_set():
+                return
+            for servicio, detener in segundo_plano:
+                servicio.iniciar()
+                atexit.register(detener)
+            iniciados.set()
+
     @application.context_processor
     def inject_app_variables():
         return {
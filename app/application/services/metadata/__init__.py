@@ -2,9 +2,22 @@ from app.application.services.metadata.external.openlibrary_book_adapter import
 from app.application.services.metadata.external.openlibrary_author_adapter import OpenLibraryAuthorAdapter
 from app.application.services.metadata.external.openlibrary_cover_adapter import OpenLibraryCoverAdapter
 from app.application.services.metadata.external.google_books_adapter import GoogleBooksAdapter
+from app.application.services.metadata.external.http_client import HttpClient, ProveedorNoDisponible
+from app.application.services.metadata.external.response_cache import ResponseCache
+from app.application.services.metadata.external.token_bucket import TokenBucket
+from app.application.services.metadata.external.circuit_breaker import CircuitBreaker, EstadoCircuito
 from app.application.services.metadata.folder_metadata_builder import FolderMetadataBuilder
 from app.application.services.metadata.epub_metadata_extractor import EpubMetadataExtractor
 from app.application.services.metadata.pdf_metadata_extractor import PdfMetadataExtractor
+from app.application.services.metadata.bounded_reader import BoundedReader, ReadBudgetExceeded
+from app.application.services.metadata.extraction_cache import ExtractionCache
+from app.application.services.metadata.local_metadata_extractor import LocalMetadataExtractor
+from app.application.services.metadata.async_enrichment_engine import AsyncEnrichmentEngine, EstrategiaEnriquecimiento
+from app.application.services.metadata.external.async_book_provider import AsyncBookProvider
+from app.application.services.metadata.enrichment_queue import EnrichmentQueue, EstadoTrabajo, SinResultados
+from app.application.services.metadata.enrichment_worker import EnrichmentWorker
+from app.application.services.metadata.file_fingerprinter import FileFingerprinter
+from app.application.services.metadata.fingerprinting_extractor import FingerprintingExtractor
 
 from app.application.services.metadata.external.book_metadata_provider import BookMetadataProvider
 from app.application.services.metadata.external.author_metadata_provider import AuthorMetadataProvider
@@ -15,9 +28,28 @@ __all__ = [
     "OpenLibraryAuthorAdapter",
     "OpenLibraryCoverAdapter",
     "GoogleBooksAdapter",
+    "HttpClient",
+    "ProveedorNoDisponible",
+    "ResponseCache",
+    "TokenBucket",
+    "CircuitBreaker",
+    "EstadoCircuito",
     "FolderMetadataBuilder",
     "EpubMetadataExtractor",
     "PdfMetadataExtractor",
+    "BoundedReader",
+    "ReadBudgetExceeded",
+    "ExtractionCache",
+    "LocalMetadataExtractor",
+    "AsyncEnrichmentEngine",
+    "EstrategiaEnriquecimiento",
+    "AsyncBookProvider",
+    "EnrichmentQueue",
+    "EstadoTrabajo",
+    "SinResultados",
+    "EnrichmentWorker",
+    "FileFingerprinter",
+    "FingerprintingExtractor",
     "BookMetadataProvider",
     "AuthorMetadataProvider",
     "CoverProvider",
@@ -0,0 +1,220 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from enum import Enum
+import asyncio
+import logging
+import time
+
+from app.application.services.metadata.external.book_metadata_provider import BookMetadataProvider
+from app.application.services.metadata.external.async_book_provider import AsyncBookProvider
+
+
+class EstrategiaEnriquecimiento(str, Enum):
+    PRIMERO = "primero"      # La primera respuesta aceptable, de cualquier proveedor
+    PRIORIDAD = "prioridad"  # Todas las respuestas, combinadas campo a campo por prioridad
+
+
+def _es_aceptable(resultado: Optional[Dict]) -> bool:
+    return bool(resultado and resultado.get("titulo"))
+
+
+class AsyncEnrichmentEngine:
+    """
+    Consulta a la vez a todos los proveedores de metadatos de libros, con un plazo
+    máximo por libro, y cancela las consultas que ya no hacen falta.
+
+    El orden de `providers` es su prioridad. Los libros de un lote se enriquecen
+    concurrentemente dentro de un mismo bucle de eventos.
+    """
+    def __init__(
+        self,
+        providers: List[BookMetadataProvider],
+        estrategia: EstrategiaEnriquecimiento = EstrategiaEnriquecimiento.PRIMERO,
+        deadline: float = 10.0,
+        max_concurrencia: int = 16,
+        aceptable: Callable[[Optional[Dict]], bool] = _es_aceptable,
+    ):
+        """
+        Args:
+            providers (List[BookMetadataProvider]): Proveedores, de mayor a menor prioridad.
+            estrategia (EstrategiaEnriquecimiento): Cómo elegir entre las respuestas.
+            deadline (float): Segundos máximos de cada búsqueda: la de los ISBN del lote y,
+                después, la de cada libro por título (y por ISBN en los proveedores que no
+                respondieron a tiempo a la del lote).
+            max_concurrencia (int): Consultas simultáneas como máximo.
+            aceptable (Callable[[Optional[Dict]], bool]): Indica si una respuesta sirve.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrencia, thread_name_prefix="enriquecimiento")
+        self.providers = [AsyncBookProvider(provider, self.executor) for provider in providers]
+        self.estrategia = EstrategiaEnriquecimiento(estrategia)
+        self.deadline = deadline
+        self.aceptable = aceptable
+
+    def buscar_lote(self, lote: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Busca los metadatos externos de un lote de libros.
+
+        Primero resuelve todos los ISBN del lote con una consulta por lotes a cada
+        proveedor, y después busca por título los libros que sigan sin resultado.
+
+        Args:
+            lote (List[Dict]): Metadatos locales de cada libro.
+
+        Returns:
+            List[Optional[Dict]]: Metadatos externos de cada libro, en el mismo orden: vacíos si
+            todos los proveedores respondieron sin encontrarlo, o None si alguno no respondió
+            (error, plazo agotado o circuito abierto) y no hay resultado.
+        """
+        if not lote:
+            return []
+        return asyncio.run(self._buscar_lote(lote))
+
+    async def _buscar_lote(self, lote: List[Dict]) -> List[Optional[Dict]]:
+        isbns = list(dict.fromkeys(m["isbn"] for m in lote if m.get("isbn")))
+        encontrados, resueltos = await self._buscar_isbns(isbns) if isbns else ({}, set())
+
+        resultados = await asyncio.gather(
+            *(self.buscar(metadata, encontrados, resueltos) for metadata in lote),
+            return_exceptions=True
+        )
+        salida = []
+        for metadata, resultado in zip(lote, resultados):
+            if isinstance(resultado, BaseException):
+                self.logger.warning(f"Error al enriquecer '{metadata.get('titulo')}': {resultado}")
+                resultado = None
+            salida.append(resultado)
+        return salida
+
+    async def buscar_isbns(self, isbns: List[str]) -> Dict[str, Dict]:
+        """
+        Busca varios ISBN en todos los proveedores a la vez, dentro del plazo.
+
+        Args:
+            isbns (List[str]): ISBN a resolver.
+
+        Returns:
+            Dict[str, Dict]: ISBN -> metadatos, combinados por prioridad, de los encontrados.
+        """
+        encontrados, _ = await self._buscar_isbns(isbns)
+        return encontrados
+
+    async def _buscar_isbns(self, isbns: List[str]) -> Tuple[Dict[str, Dict], Set[int]]:
+        """
+        Returns:
+            Tuple[Dict[str, Dict], Set[int]]: Los ISBN encontrados y la prioridad de los
+            proveedores que respondieron a tiempo; los demás se consultan luego libro a libro.
+        """
+        tareas = [asyncio.create_task(provider.search_by_isbns(isbns)) for provider in self.providers]
+        hechas, pendientes = await asyncio.wait(tareas, timeout=self.deadline)
+        for tarea in pendientes:
+            # Retira también las consultas que el proveedor aún no había empezado
+            tarea.cancel()
+        if pendientes:
+            await asyncio.wait(pendientes)
+
+        por_isbn: Dict[str, Dict[int, Dict]] = {}
+        resueltos: Set[int] = set()
+        for prioridad, tarea in enumerate(tareas):
+            if tarea not in hechas:
+                self.logger.debug(f"Plazo agotado en {self.providers[prioridad].nombre} para {len(isbns)} ISBN")
+                continue
+            if tarea.exception():
+                self.logger.warning(f"Error en {self.providers[prioridad].nombre}: {tarea.exception()}")
+                continue
+            resueltos.add(prioridad)
+            for isbn, resultado in tarea.result().items():
+                if self.aceptable(resultado):
+                    por_isbn.setdefault(isbn, {})[prioridad] = resultado
+
+        return {isbn: self._elegir(respuestas) for isbn, respuestas in por_isbn.items()}, resueltos
+
+    async def buscar(
+        self,
+        metadata: Dict,
+        encontrados: Optional[Dict[str, Dict]] = None,
+        resueltos: Optional[Set[int]] = None
+    ) -> Optional[Dict]:
+        """
+        Busca los metadatos externos de un libro en todos los proveedores a la vez.
+
+        Args:
+            metadata (Dict): Metadatos locales del libro.
+            encontrados (Optional[Dict[str, Dict]]): Resultados ya resueltos por ISBN.
+            resueltos (Optional[Set[int]]): Prioridad de los proveedores que ya buscaron los
+                ISBN; por defecto, todos si se pasan `encontrados` y ninguno si no.
+
+        Returns:
+            Optional[Dict]: Los metadatos encontrados; un diccionario vacío si todos los
+            proveedores respondieron sin encontrarlo, o None si alguno no respondió.
+        """
+        isbn = metadata.get("isbn")
+        if isbn and encontrados and encontrados.get(isbn):
+            return encontrados[isbn]
+
+        if resueltos is None:
+            resueltos = set(range(len(self.providers))) if encontrados is not None else set()
+        buscar_isbn = {prioridad: bool(isbn) and prioridad not in resueltos for prioridad in range(len(self.providers))}
+        if not any(buscar_isbn.values()) and not metadata.get("titulo"):
+            return {}
+
+        tareas = {
+            asyncio.create_task(self._consultar(provider, metadata, buscar_isbn[prioridad])): prioridad
+            for prioridad, provider in enumerate(self.providers)
+        }
+        respuestas: Dict[int, Dict] = {}
+        respondieron: Set[int] = set()
+        limite = time.monotonic() + self.deadline
+        try:
+            pendientes = set(tareas)
+            while pendientes:
+                restante = limite - time.monotonic()
+                if restante <= 0:
+                    self.logger.debug(f"Plazo agotado para '{metadata.get('titulo')}'")
+                    break
+                hechas, pendientes = await asyncio.wait(pendientes, timeout=restante, return_when=asyncio.FIRST_COMPLETED)
+                for tarea in hechas:
+                    if tarea.exception():
+                        self.logger.warning(f"Error en {self.providers[tareas[tarea]].nombre}: {tarea.exception()}")
+                        continue
+                    respondieron.add(tareas[tarea])
+                    if self.aceptable(tarea.result()):
+                        respuestas[tareas[tarea]] = tarea.result()
+
+                if respuestas and self.estrategia == EstrategiaEnriquecimiento.PRIMERO:
+                    break
+        finally:
+            for tarea in tareas:
+                tarea.cancel()
+
+        if not respuestas and len(respondieron) < len(tareas):
+            return None
+        return self._elegir(respuestas)
+
+    async def _consultar(self, provider: AsyncBookProvider, metadata: Dict, buscar_isbn: bool) -> Optional[Dict]:
+        if buscar_isbn:
+            resultado = await provider.search_by_isbn(metadata["isbn"])
+            if self.aceptable(resultado):
+                return resultado
+        if metadata.get("titulo"):
+            return await provider.search_by_title(metadata["titulo"])
+        return None
+
+    def _elegir(self, respuestas: Dict[int, Dict]) -> Dict:
+        """
+        Reduce las respuestas aceptables a una según la estrategia: la del proveedor de mayor
+        prioridad, o la combinación en la que cada campo se toma del de mayor prioridad que lo tenga.
+        """
+        if not respuestas:
+            return {}
+        if self.estrategia == EstrategiaEnriquecimiento.PRIMERO:
+            return respuestas[min(respuestas)]
+
+        combinado: Dict = {}
+        for prioridad in sorted(respuestas, reverse=True):
+            combinado.update({clave: valor for clave, valor in respuestas[prioridad].items() if valor})
+        return combinado
+
+    def cerrar(self) -> None:
+        """Libera los hilos de consulta."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,50 @@
+from typing import BinaryIO, Optional
+import time
+import io
+
+class ReadBudgetExceeded(Exception):
+    """Se superó el presupuesto de bytes o de tiempo asignado a la lectura de un archivo."""
+    pass
+
+
+class BoundedReader(io.RawIOBase):
+    """
+    Envuelve un archivo binario y corta la lectura al superar un máximo de bytes
+    leídos o de tiempo transcurrido desde su apertura.
+
+    Solo limita la E/S: un procesamiento largo sin lecturas no se interrumpe.
+    """
+    def __init__(self, archivo: BinaryIO, max_bytes: Optional[int] = None, timeout: Optional[float] = None):
+        """
+        Args:
+            archivo (BinaryIO): Archivo abierto en modo binario.
+            max_bytes (Optional[int]): Bytes máximos a leer; None para no limitar.
+            timeout (Optional[float]): Segundos máximos de lectura; None para no limitar.
+        """
+        self.archivo = archivo
+        self.max_bytes = max_bytes
+        self.limite = time.monotonic() + timeout if timeout else None
+        self.leidos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self.archivo.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.archivo.tell()
+
+    def readinto(self, buffer) -> int:
+        if self.limite is not None and time.monotonic() > self.limite:
+            raise ReadBudgetExceeded("tiempo de lectura agotado")
+        if self.max_bytes is not None and self.leidos >= self.max_bytes:
+            raise ReadBudgetExceeded(f"se leyeron más de {self.max_bytes} bytes")
+
+        datos = self.archivo.read(len(buffer))
+        buffer[:len(datos)] = datos
+        self.leidos += len(datos)
+        return len(datos)
@@ -0,0 +1,238 @@
+from pathlib import Path
+from typing import Dict, List, Optional
+from uuid import UUID
+from enum import Enum
+import threading
+import sqlite3
+import logging
+import json
+import time
+
+
+class EstadoTrabajo(str, Enum):
+    PENDIENTE = "pendiente"            # Espera a un worker (o a que venza su reintento)
+    EN_CURSO = "en_curso"              # Reclamado por un worker hasta que venza su concesión
+    HECHO = "hecho"                    # Enriquecido y aplicado
+    SIN_RESULTADOS = "sin_resultados"  # Ningún proveedor conoce el libro
+    FALLIDO = "fallido"                # Agotó los reintentos
+
+
+class SinResultados(LookupError):
+    """Ningún proveedor devolvió metadatos del libro: el trabajo termina sin reintentarse."""
+
+
+class EnrichmentQueue:
+    """
+    Cola persistente (SQLite) de libros pendientes de enriquecer con los proveedores externos.
+
+    Hay como mucho un trabajo por libro: volver a encolarlo actualiza sus datos y lo deja
+    pendiente con la mayor de las dos prioridades. Los trabajos fallidos se reintentan con
+    espera exponencial hasta `max_intentos`.
+
+    Un trabajo reclamado queda en curso durante `concesion` segundos, guardados en
+    `disponible_en`; si el worker no lo termina antes (porque su proceso se cerró), otro
+    puede volver a reclamarlo. Así varios procesos comparten la cola sin quitarse los
+    trabajos que tienen en curso.
+    """
+    def __init__(self, path: Path, max_intentos: int = 5, espera_reintento: float = 30.0, concesion: float = 600.0):
+        """
+        Args:
+            path (Path): Archivo SQLite de la cola.
+            max_intentos (int): Intentos de un trabajo antes de marcarlo como fallido.
+            espera_reintento (float): Segundos antes del primer reintento; se duplican en cada fallo.
+            concesion (float): Segundos que un trabajo reclamado queda reservado a su worker.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.max_intentos = max(1, max_intentos)
+        self.espera_reintento = espera_reintento
+        self.concesion = concesion
+        self._conexion: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _conectar(self) -> sqlite3.Connection:
+        if self._conexion is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conexion = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conexion.execute("PRAGMA journal_mode=WAL")
+            conexion.execute("PRAGMA synchronous=NORMAL")
+            conexion.execute(
+                """CREATE TABLE IF NOT EXISTS trabajos (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    libro_id TEXT NOT NULL UNIQUE,
+                    datos TEXT NOT NULL,
+                    prioridad INTEGER NOT NULL DEFAULT 0,
+                    estado TEXT NOT NULL,
+                    intentos INTEGER NOT NULL DEFAULT 0,
+                    disponible_en REAL NOT NULL,
+                    error TEXT
+                )"""
+            )
+            conexion.execute(
+                "CREATE INDEX IF NOT EXISTS ix_trabajos_siguiente ON trabajos (estado, prioridad DESC, disponible_en, id)"
+            )
+            self._conexion = conexion
+        return self._conexion
+
+    def encolar(self, libro_id: UUID, datos: Dict, prioridad: int = 0) -> None:
+        """
+        Añade (o reactiva) el trabajo de enriquecimiento de un libro.
+
+        Args:
+            libro_id (UUID): El ID del libro registrado.
+            datos (Dict): Metadatos locales y autores del libro, serializables en JSON.
+            prioridad (int): Los trabajos de mayor prioridad se atienden antes.
+        """
+        with self._lock:
+            self._conectar().execute(
+                """INSERT INTO trabajos (libro_id, datos, prioridad, estado, intentos, disponible_en)
+                VALUES (?, ?, ?, ?, 0, ?)
+                ON CONFLICT (libro_id) DO UPDATE SET
+                    datos = excluded.datos,
+                    prioridad = MAX(prioridad, excluded.prioridad),
+                    estado = excluded.estado,
+                    intentos = 0,
+                    disponible_en = excluded.disponible_en,
+                    error = NULL""",
+                (str(libro_id), json.dumps(datos), prioridad, EstadoTrabajo.PENDIENTE.value, time.time())
+            )
+
+    def reclamar(self, limite: int = 1) -> List[Dict]:
+        """
+        Toma los siguientes trabajos disponibles, por prioridad y antigüedad, y los marca en
+        curso. Incluye los que quedaron en curso con la concesión vencida.
+
+        Args:
+            limite (int): Trabajos máximos a tomar.
+
+        Returns:
+            List[Dict]: Trabajos con 'id', 'libro_id', 'datos' e 'intentos'.
+        """
+        with self._lock:
+            conexion = self._conectar()
+            conexion.execute("BEGIN IMMEDIATE")
+            try:
+                ahora = time.time()
+                filas = conexion.execute(
+                    """SELECT id, libro_id, datos, intentos, estado FROM trabajos
+                    WHERE estado IN (?, ?) AND disponible_en <= ?
+                    ORDER BY prioridad DESC, disponible_en, id
+                    LIMIT ?""",
+                    (EstadoTrabajo.PENDIENTE.value, EstadoTrabajo.EN_CURSO.value, ahora, limite)
+                ).fetchall()
+                conexion.executemany(
+                    "UPDATE trabajos SET estado = ?, disponible_en = ? WHERE id = ?",
+                    [(EstadoTrabajo.EN_CURSO.value, ahora + self.concesion, fila[0]) for fila in filas]
+                )
+                conexion.execute("COMMIT")
+            except sqlite3.Error:
+                conexion.execute("ROLLBACK")
+                raise
+
+        recuperados = sum(1 for fila in filas if fila[4] == EstadoTrabajo.EN_CURSO.value)
+        if recuperados:
+            self.logger.info(f"🔁 {recuperados} trabajos de enriquecimiento con la concesión vencida vuelven a reclamarse")
+        return [
+            {"id": id, "libro_id": UUID(libro_id), "datos": json.loads(datos), "intentos": intentos}
+            for id, libro_id, datos, intentos, _ in filas
+        ]
+
+    def completar(self, trabajo_id: int, estado: EstadoTrabajo = EstadoTrabajo.HECHO) -> None:
+        """
+        Marca un trabajo como terminado.
+
+        Args:
+            trabajo_id (int): El ID del trabajo.
+            estado (EstadoTrabajo): HECHO, o SIN_RESULTADOS si ningún proveedor conoce el libro.
+        """
+        with self._lock:
+            self._conectar().execute(
+                "UPDATE trabajos SET estado = ?, error = NULL WHERE id = ? AND estado = ?",
+                (estado.value, trabajo_id, EstadoTrabajo.EN_CURSO.value)
+            )
+
+    def fallar(self, trabajo_id: int, error: str) -> bool:
+        """
+        Registra el fallo de un trabajo y lo reprograma con espera exponencial.
+
+        Args:
+            trabajo_id (int): El ID del trabajo.
+            error (str): Descripción del error.
+
+        Returns:
+            bool: True si se reintentará, False si agotó los intentos.
+        """
+        with self._lock:
+            conexion = self._conectar()
+            fila = conexion.execute(
+                "SELECT intentos FROM trabajos WHERE id = ? AND estado = ?",
+                (trabajo_id, EstadoTrabajo.EN_CURSO.value)
+            ).fetchone()
+            if not fila:
+                return False
+
+            intentos = fila[0] + 1
+            reintentar = intentos < self.max_intentos
+            conexion.execute(
+                "UPDATE trabajos SET estado = ?, intentos = ?, disponible_en = ?, error = ? WHERE id = ?",
+                (
+                    (EstadoTrabajo.PENDIENTE if reintentar else EstadoTrabajo.FALLIDO).value,
+                    intentos,
+                    time.time() + self.espera_reintento * 2 ** (intentos - 1),
+                    error,
+                    trabajo_id
+                )
+            )
+        return reintentar
+
+    def reintentar_fallidos(self, sin_resultados: bool = False) -> int:
+        """
+        Devuelve a la cola los trabajos que agotaron sus intentos.
+
+        Args:
+            sin_resultados (bool): Reactivar también los que ningún proveedor conocía.
+
+        Returns:
+            int: Número de trabajos reactivados.
+        """
+        estados = [EstadoTrabajo.FALLIDO.value]
+        if sin_resultados:
+            estados.append(EstadoTrabajo.SIN_RESULTADOS.value)
+        with self._lock:
+            return self._conectar().execute(
+                f"UPDATE trabajos SET estado = ?, intentos = 0, disponible_en = ? WHERE estado IN ({', '.join('?' * len(estados))})",
+                (EstadoTrabajo.PENDIENTE.value, time.time(), *estados)
+            ).rowcount
+
+    def purgar_completados(self) -> int:
+        """
+        Elimina los trabajos terminados.
+
+        Returns:
+            int: Número de trabajos eliminados.
+        """
+        with self._lock:
+            return self._conectar().execute(
+                "DELETE FROM trabajos WHERE estado = ?", (EstadoTrabajo.HECHO.value,)
+            ).rowcount
+
+    def progreso(self) -> Dict[str, int]:
+        """
+        Resume el estado de la cola.
+
+        Returns:
+            Dict[str, int]: Número de trabajos en cada estado, más 'total'.
+        """
+        with self._lock:
+            filas = self._conectar().execute("SELECT estado, COUNT(*) FROM trabajos GROUP BY estado").fetchall()
+        resumen = {estado.value: 0 for estado in EstadoTrabajo}
+        resumen.update(dict(filas))
+        resumen["total"] = sum(resumen.values())
+        return resumen
+
+    def cerrar(self) -> None:
+        """Cierra la conexión con la base de datos de la cola."""
+        with self._lock:
+            if self._conexion is not None:
+                self._conexion.close()
+                self._conexion = None
@@ -0,0 +1,131 @@
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Dict, List, Optional
+import threading
+import logging
+
+from app.application.services.metadata.enrichment_queue import EnrichmentQueue, EstadoTrabajo, SinResultados
+
+
+class EnrichmentWorker:
+    """
+    Pool de hilos en segundo plano que vacía la cola de enriquecimiento.
+
+    Cada hilo reclama un lote de trabajos, lo procesa con `procesar` dentro del contexto
+    indicado (por ejemplo, el de la aplicación Flask, para acceder a la base de datos) y
+    marca cada trabajo como hecho, sin resultados o fallido según el resultado.
+    """
+    def __init__(
+        self,
+        cola: EnrichmentQueue,
+        procesar: Callable[[List[Dict]], List[Optional[Exception]]],
+        hilos: int = 2,
+        lote: int = 20,
+        intervalo: float = 2.0,
+        contexto: Optional[Callable[[], ContextManager]] = None,
+    ):
+        """
+        Args:
+            cola (EnrichmentQueue): Cola de trabajos.
+            procesar (Callable[[List[Dict]], List[Optional[Exception]]]): Enriquece y aplica un lote
+                de trabajos; devuelve, en el mismo orden, None o el error de cada uno
+                (SinResultados si ningún proveedor conoce el libro).
+            hilos (int): Hilos del pool.
+            lote (int): Trabajos que reclama cada hilo de una vez.
+            intervalo (float): Segundos de espera cuando la cola está vacía.
+            contexto (Optional[Callable[[], ContextManager]]): Fábrica del contexto en el que se procesa cada lote.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.cola = cola
+        self.procesar = procesar
+        self.hilos = max(1, hilos)
+        self.lote = max(1, lote)
+        self.intervalo = intervalo
+        self.contexto = contexto or nullcontext
+        self._detener = threading.Event()
+        self._despertar = threading.Event()
+        self._hilos: List[threading.Thread] = []
+
+    def iniciar(self) -> None:
+        """Arranca los hilos del pool, si no estaban ya en marcha."""
+        if any(hilo.is_alive() for hilo in self._hilos):
+            return
+        self._detener.clear()
+        self._hilos = [
+            threading.Thread(target=self._trabajar, name=f"enriquecimiento-diferido-{i}", daemon=True)
+            for i in range(self.hilos)
+        ]
+        for hilo in self._hilos:
+            hilo.start()
+        self.logger.info(f"Enriquecimiento en segundo plano iniciado con {self.hilos} hilos")
+
+    def avisar(self) -> None:
+        """Despierta a los hilos en espera porque hay trabajos nuevos."""
+        self._despertar.set()
+
+    def detener(self, timeout: Optional[float] = None) -> None:
+        """
+        Detiene los hilos tras el lote en curso.
+
+        Args:
+            timeout (Optional[float]): Segundos máximos de espera por cada hilo.
+        """
+        self._detener.set()
+        self._despertar.set()
+        for hilo in self._hilos:
+            hilo.join(timeout)
+
+    def progreso(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: Número de trabajos de la cola en cada estado.
+        """
+        return self.cola.progreso()
+
+    def procesar_pendientes(self) -> int:
+        """
+        Procesa en el hilo actual todos los trabajos disponibles ahora mismo.
+
+        Returns:
+            int: Número de trabajos procesados.
+        """
+        procesados = 0
+        while True:
+            trabajos = self.cola.reclamar(self.lote)
+            if not trabajos:
+                return procesados
+            self._procesar_lote(trabajos)
+            procesados += len(trabajos)
+
+    def _trabajar(self) -> None:
+        while not self._detener.is_set():
+            try:
+                trabajos = self.cola.reclamar(self.lote)
+            except Exception as e:
+                self.logger.warning(f"Error al leer la cola de enriquecimiento: {e}")
+                trabajos = []
+
+            if not trabajos:
+                self._despertar.wait(self.intervalo)
+                self._despertar.clear()
+                continue
+            self._procesar_lote(trabajos)
+
+    def _procesar_lote(self, trabajos: List[Dict]) -> None:
+        try:
+            with self.contexto():
+                errores = self.procesar(trabajos)
+        except Exception as e:
+            errores = [e] * len(trabajos)
+
+        for trabajo, error in zip(trabajos, errores):
+            if error is None:
+                self.cola.completar(trabajo["id"])
+                continue
+            if isinstance(error, SinResultados):
+                self.cola.completar(trabajo["id"], EstadoTrabajo.SIN_RESULTADOS)
+                self.logger.debug(f"Sin resultados para el libro {trabajo['libro_id']}: no se reintenta")
+                continue
+            if self.cola.fallar(trabajo["id"], str(error)):
+                self.logger.debug(f"Enriquecimiento del libro {trabajo['libro_id']} reprogramado: {error}")
+            else:
+                self.logger.warning(f"❌ Enriquecimiento del libro {trabajo['libro_id']} descartado tras {trabajo['intentos'] + 1} intentos: {error}")
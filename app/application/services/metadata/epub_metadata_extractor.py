@@ -1,11 +1,17 @@
 import logging
+import zipfile
+import posixpath
 import ebooklib
 from pathlib import Path
 from ebooklib import epub
-from typing import Dict, Optional
+from lxml import etree
+from urllib.parse import unquote
+from typing import Dict, List, Optional
 
 from app.application.services.metadata.metadata_extractor import MetadataExtractor
 
+CONTAINER_PATH = "META-INF/container.xml"
+
 class EpubMetadataExtractor(MetadataExtractor):
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -14,14 +20,26 @@ class EpubMetadataExtractor(MetadataExtractor):
         """
         Extrae metadatos de un archivo EPUB.
 
+        Lee directamente del zip el `container.xml`, el OPF y la entrada de la portada,
+        sin cargar capítulos ni imágenes. Si el archivo está mal formado, recurre a ebooklib.
+
         Args:
             path (Path): Ruta al archivo EPUB.
 
         Returns:
             Dict: Diccionario con los metadatos extraídos.
         """
-        book = epub.read_epub(str(path))
-        metadata = {
+        try:
+            metadata = self._extract_from_opf(path)
+        except (zipfile.BadZipFile, KeyError, ValueError, etree.XMLSyntaxError) as e:
+            self.logger.debug(f"Lectura directa del OPF fallida en {path.name} ({e}); se usa ebooklib")
+            metadata = self._extract_with_ebooklib(path)
+
+        self.logger.debug(f"Metadatos EPUB extraídos de {path.name}: {metadata}")
+        return metadata
+
+    def _empty_metadata(self) -> Dict:
+        return {
             "titulo": None,
             "autores": [],
             "editorial": None,
@@ -34,33 +52,162 @@ class EpubMetadataExtractor(MetadataExtractor):
             "portada_hash": None
         }
 
-        if 'DC:title' in book.metadata:
-            metadata['titulo'] = book.metadata['DC:title'][0][0]
+    def _extract_from_opf(self, path: Path) -> Dict:
+        """
+        Extrae los metadatos leyendo solo el OPF y la portada del zip.
+
+        Args:
+            path (Path): Ruta al archivo EPUB.
+
+        Returns:
+            Dict: Diccionario con los metadatos extraídos.
+
+        Raises:
+            zipfile.BadZipFile: Si el archivo no es un zip válido.
+            KeyError: Si falta el `container.xml` o el OPF.
+            ValueError: Si el `container.xml` no declara el OPF.
+            etree.XMLSyntaxError: Si el XML está mal formado.
+        """
+        metadata = self._empty_metadata()
+
+        with zipfile.ZipFile(path) as archivo:
+            opf_path = self._find_opf_path(archivo)
+            opf_dir = posixpath.dirname(opf_path)
+            dc: Dict[str, List[etree._Element]] = {}
+            meta_cover = None
+            items: List[Dict[str, str]] = []
+
+            with archivo.open(opf_path) as opf:
+                for _, elem in etree.iterparse(opf, events=("end",), resolve_entities=False, no_network=True):
+                    if not isinstance(elem.tag, str):
+                        continue
+                    namespace, _, tag = elem.tag.rpartition("}")
+                    if namespace.endswith("/elements/1.1/"):
+                        dc.setdefault(tag, []).append(elem)
+                        continue
+                    if tag == "meta" and elem.get("name") == "cover":
+                        meta_cover = elem.get("content")
+                    elif tag == "item":
+                        items.append(dict(elem.attrib))
+                    elif tag == "manifest":
+                        # La spine y la guía no aportan nada
+                        break
+
+            if dc.get("title"):
+                metadata["titulo"] = dc["title"][0].text
+            metadata["autores"] = [e.text for e in dc.get("creator", []) if e.text]
+            if dc.get("publisher"):
+                metadata["editorial"] = dc["publisher"][0].text
+            if dc.get("date") and dc["date"][0].text:
+                metadata["year"] = dc["date"][0].text[:4]
+            if dc.get("description"):
+                metadata["descripcion"] = dc["description"][0].text
+
+            for identifier in dc.get("identifier", []):
+                scheme = next((v for k, v in identifier.attrib.items() if k.rpartition("}")[2] == "scheme"), "")
+                if "isbn" in scheme.lower():
+                    metadata["isbn"] = identifier.text
+                    break
 
-        if 'DC:creator' in book.metadata:
-            metadata['autores'] = [creator[0] for creator in book.metadata['DC:creator']]
+            cover_href = self._find_cover_href(items, meta_cover)
+            if cover_href:
+                portada = self._read_entry(archivo, posixpath.normpath(posixpath.join(opf_dir, unquote(cover_href))))
+                if portada:
+                    metadata["portada_bytes"] = portada
+                    metadata["portada_hash"] = self._hash_bytes(portada)
 
-        if 'DC:publisher' in book.metadata:
-            metadata['editorial'] = book.metadata['DC:publisher'][0][0]
+        return metadata
 
-        if 'DC:date' in book.metadata:
-            metadata['year'] = book.metadata['DC:date'][0][0][:4]
+    def _find_opf_path(self, archivo: zipfile.ZipFile) -> str:
+        """
+        Obtiene la ruta del OPF declarada en `META-INF/container.xml`.
 
-        if 'DC:description' in book.metadata:
-            metadata['descripcion'] = book.metadata['DC:description'][0][0]
+        Args:
+            archivo (zipfile.ZipFile): EPUB abierto.
 
-        if 'DC:identifier' in book.metadata:
-            for identifier in book.metadata['DC:identifier']:
-                if 'isbn' in identifier[1].get('scheme', '').lower():
-                    metadata['isbn'] = identifier[0]
-                    break
+        Returns:
+            str: Ruta del OPF dentro del zip.
+        """
+        with archivo.open(CONTAINER_PATH) as container:
+            for _, elem in etree.iterparse(container, events=("end",), resolve_entities=False, no_network=True):
+                if isinstance(elem.tag, str) and elem.tag.rpartition("}")[2] == "rootfile" and elem.get("full-path"):
+                    return elem.get("full-path")
+        raise ValueError("container.xml no declara ningún OPF")
+
+    def _find_cover_href(self, items: List[Dict[str, str]], meta_cover: Optional[str]) -> Optional[str]:
+        """
+        Localiza la portada en el manifiesto del OPF.
+
+        Se prueba, en orden, la imagen con id 'cover', la declaración EPUB3 (`cover-image`),
+        la EPUB2 (`<meta name="cover">`) y cualquier imagen con 'cover' en el nombre.
+
+        Args:
+            items (List[Dict[str, str]]): Atributos de los items del manifiesto.
+            meta_cover (Optional[str]): Id indicado por `<meta name="cover">`, si existe.
+
+        Returns:
+            Optional[str]: El href de la portada, o None si no hay portada.
+        """
+        criterios = [
+            lambda item: item.get("id") == "cover" and item.get("media-type", "").startswith("image/"),
+            lambda item: "cover-image" in item.get("properties", "").split(),
+            lambda item: meta_cover is not None and item.get("id") == meta_cover,
+            lambda item: item.get("media-type", "").startswith("image/") and "cover" in item.get("href", "").lower(),
+        ]
+        for criterio in criterios:
+            for item in items:
+                if item.get("href") and criterio(item):
+                    return item["href"]
+        return None
+
+    def _read_entry(self, archivo: zipfile.ZipFile, nombre: str) -> Optional[bytes]:
+        try:
+            return archivo.read(nombre)
+        except KeyError:
+            self.logger.debug(f"La portada declarada no existe en el EPUB: {nombre}")
+            return None
+
+    def _extract_with_ebooklib(self, path: Path) -> Dict:
+        """
+        Extrae los metadatos cargando el libro completo con ebooklib.
+
+        Args:
+            path (Path): Ruta al archivo EPUB.
+
+        Returns:
+            Dict: Diccionario con los metadatos extraídos.
+        """
+        book = epub.read_epub(str(path))
+        metadata = self._empty_metadata()
+
+        def dc(nombre: str) -> List:
+            return book.get_metadata('DC', nombre)
+
+        if dc('title'):
+            metadata['titulo'] = dc('title')[0][0]
+
+        metadata['autores'] = [creator[0] for creator in dc('creator') if creator[0]]
+
+        if dc('publisher'):
+            metadata['editorial'] = dc('publisher')[0][0]
+
+        if dc('date') and dc('date')[0][0]:
+            metadata['year'] = dc('date')[0][0][:4]
+
+        if dc('description'):
+            metadata['descripcion'] = dc('description')[0][0]
+
+        for identifier, atributos in dc('identifier'):
+            scheme = next((v for k, v in atributos.items() if k.rpartition('}')[2] == 'scheme'), '')
+            if 'isbn' in scheme.lower():
+                metadata['isbn'] = identifier
+                break
 
         portada = self._get_cover(book)
         if portada:
             metadata['portada_bytes'] = portada
             metadata['portada_hash'] = self._hash_bytes(portada)
 
-        self.logger.debug(f"Metadatos EPUB extraídos de {path.name}: {metadata}")
         return metadata
 
     def _get_cover(self, book: epub.EpubBook) -> Optional[bytes]:
@@ -74,9 +221,12 @@ class EpubMetadataExtractor(MetadataExtractor):
             Optional[bytes]: Datos de la imagen de portada, o None si no hay portada.
         """
         cover_item = book.get_item_with_id('cover')
-        if cover_item:
+        if cover_item and cover_item.get_type() in (ebooklib.ITEM_IMAGE, ebooklib.ITEM_COVER):
             return cover_item.content
 
+        for item in book.get_items_of_type(ebooklib.ITEM_COVER):
+            return item.content
+
         for item in book.get_items_of_type(ebooklib.ITEM_IMAGE):
             if 'cover' in item.get_name().lower():
                 return item.content
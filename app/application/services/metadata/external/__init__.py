@@ -1,4 +1,9 @@
 from app.application.services.metadata.external.openlibrary_book_adapter import OpenLibraryBookAdapter
 from app.application.services.metadata.external.openlibrary_author_adapter import OpenLibraryAuthorAdapter
 from app.application.services.metadata.external.openlibrary_cover_adapter import OpenLibraryCoverAdapter
-from app.application.services.metadata.external.google_books_adapter import GoogleBooksAdapter
\ No newline at end of file
+from app.application.services.metadata.external.google_books_adapter import GoogleBooksAdapter
+from app.application.services.metadata.external.http_client import HttpClient, ProveedorNoDisponible
+from app.application.services.metadata.external.response_cache import ResponseCache
+from app.application.services.metadata.external.async_book_provider import AsyncBookProvider
+from app.application.services.metadata.external.token_bucket import TokenBucket
+from app.application.services.metadata.external.circuit_breaker import CircuitBreaker, EstadoCircuito
@@ -0,0 +1,59 @@
+from concurrent.futures import Executor
+from typing import Dict, List, Optional
+import functools
+import asyncio
+
+from app.application.services.metadata.external.book_metadata_provider import BookMetadataProvider
+
+class AsyncBookProvider:
+    """
+    Versión asíncrona de un `BookMetadataProvider`.
+
+    Cada consulta se ejecuta en el executor indicado sobre el adaptador síncrono, que
+    reutiliza las conexiones del `HttpClient` compartido. Cancelar la corrutina deja de
+    esperar la respuesta y retira del executor las consultas que aún no empezaron; la
+    petición en curso termina (acotada por sus timeouts).
+    """
+    def __init__(self, provider: BookMetadataProvider, executor: Optional[Executor] = None):
+        """
+        Args:
+            provider (BookMetadataProvider): Adaptador síncrono.
+            executor (Optional[Executor]): Executor de las consultas; por defecto, el del bucle de eventos.
+        """
+        self.provider = provider
+        self.executor = executor
+
+    @property
+    def nombre(self) -> str:
+        return self.provider.__class__.__name__
+
+    async def _ejecutar(self, funcion, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(funcion, *args))
+
+    async def search_by_isbn(self, isbn: str) -> Optional[Dict]:
+        return await self._ejecutar(self.provider.search_by_isbn, isbn)
+
+    @property
+    def por_lotes(self) -> bool:
+        """Indica si el adaptador tiene una consulta propia de varios ISBN."""
+        return type(self.provider).search_by_isbns is not BookMetadataProvider.search_by_isbns
+
+    async def search_by_isbns(self, isbns: List[str]) -> Dict[str, Dict]:
+        if self.por_lotes:
+            return await self._ejecutar(self.provider.search_by_isbns, isbns)
+
+        # Sin API por lotes, una consulta por ISBN, todas a la vez en lugar de una tras otra
+        isbns = list(dict.fromkeys(isbns))
+        resultados = await asyncio.gather(*(self.search_by_isbn(isbn) for isbn in isbns), return_exceptions=True)
+        encontrados = {}
+        for isbn, resultado in zip(isbns, resultados):
+            if isinstance(resultado, BaseException):
+                # Si una consulta falló, el proveedor no respondió por todo el lote
+                raise resultado
+            if resultado:
+                encontrados[isbn] = resultado
+        return encontrados
+
+    async def search_by_title(self, title: str) -> Optional[Dict]:
+        return await self._ejecutar(self.provider.search_by_title, title)
@@ -5,6 +5,21 @@ class BookMetadataProvider(ABC):
     @abstractmethod
     def search_by_isbn(self, isbn: str) -> Optional[Dict]: ...
 
+    def search_by_isbns(self, isbns: List[str]) -> Dict[str, Dict]:
+        """
+        Busca varios libros por ISBN. Por defecto hace una consulta por ISBN; los
+        proveedores con una API por lotes deben sobrescribirlo.
+
+        Returns:
+            Diccionario ISBN -> metadatos, solo con los ISBN encontrados.
+        """
+        resultados = {}
+        for isbn in dict.fromkeys(isbns):
+            libro = self.search_by_isbn(isbn)
+            if libro:
+                resultados[isbn] = libro
+        return resultados
+
     @abstractmethod
     def search_by_title(self, title: str) -> Optional[Dict]: ...
 
@@ -0,0 +1,103 @@
+from collections import deque
+from enum import Enum
+import threading
+import logging
+import time
+
+
+class EstadoCircuito(str, Enum):
+    CERRADO = "cerrado"          # Las peticiones pasan con normalidad
+    ABIERTO = "abierto"          # Se omiten las peticiones hasta que pase el enfriamiento
+    SEMIABIERTO = "semiabierto"  # Se deja pasar una petición de prueba
+
+
+class CircuitBreaker:
+    """
+    Corta las peticiones a un proveedor cuando su tasa de errores reciente supera un umbral.
+
+    Tras el enfriamiento se permite una petición de prueba: si tiene éxito el circuito
+    se cierra y, si falla, vuelve a abrirse.
+    """
+    def __init__(
+        self,
+        nombre: str,
+        umbral: float = 0.5,
+        ventana: int = 20,
+        min_peticiones: int = 10,
+        enfriamiento: float = 60.0,
+    ):
+        """
+        Args:
+            nombre (str): Identificador del proveedor, para los logs.
+            umbral (float): Proporción de errores (0-1) que abre el circuito.
+            ventana (int): Número de peticiones recientes consideradas.
+            min_peticiones (int): Peticiones mínimas en la ventana antes de evaluar el umbral.
+            enfriamiento (float): Segundos que el circuito permanece abierto.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.nombre = nombre
+        self.umbral = umbral
+        self.min_peticiones = min_peticiones
+        self.enfriamiento = enfriamiento
+        self._resultados = deque(maxlen=ventana)
+        self._estado = EstadoCircuito.CERRADO
+        self._abierto_desde = 0.0
+        self._prueba_en_curso = False
+        self._lock = threading.Lock()
+
+    @property
+    def estado(self) -> EstadoCircuito:
+        return self._estado
+
+    def permitir(self) -> bool:
+        """
+        Indica si puede hacerse una petición ahora.
+
+        Returns:
+            bool: False si el circuito está abierto o ya hay una petición de prueba en curso.
+        """
+        with self._lock:
+            if self._estado == EstadoCircuito.CERRADO:
+                return True
+            if self._estado == EstadoCircuito.ABIERTO:
+                if time.monotonic() - self._abierto_desde < self.enfriamiento:
+                    return False
+                self._estado = EstadoCircuito.SEMIABIERTO
+            if self._prueba_en_curso:
+                return False
+            self._prueba_en_curso = True
+            return True
+
+    def registrar(self, exito: bool) -> None:
+        """
+        Registra el resultado de una petición permitida.
+
+        Args:
+            exito (bool): Si la petición tuvo éxito.
+        """
+        with self._lock:
+            if self._estado == EstadoCircuito.SEMIABIERTO:
+                self._prueba_en_curso = False
+                if exito:
+                    self._resultados.clear()
+                    self._estado = EstadoCircuito.CERRADO
+                    self.logger.info(f"Circuito de {self.nombre} cerrado")
+                else:
+                    self._abrir()
+                return
+
+            self._resultados.append(exito)
+            errores = self._resultados.count(False)
+            if len(self._resultados) >= self.min_peticiones and errores / len(self._resultados) >= self.umbral:
+                self._abrir()
+
+    def cancelar(self) -> None:
+        """Devuelve el permiso de una petición que finalmente no se hizo, sin registrar resultado."""
+        with self._lock:
+            if self._estado == EstadoCircuito.SEMIABIERTO:
+                self._prueba_en_curso = False
+
+    def _abrir(self) -> None:
+        self._estado = EstadoCircuito.ABIERTO
+        self._abierto_desde = time.monotonic()
+        self.logger.warning(f"Circuito de {self.nombre} abierto durante {self.enfriamiento}s por exceso de errores")
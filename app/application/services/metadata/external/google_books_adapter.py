@@ -1,13 +1,16 @@
-import requests
 import logging
 from typing import Dict, List, Optional
 
 from app.application.services.metadata.external.book_metadata_provider import BookMetadataProvider
+from app.application.services.metadata.external.http_client import HttpClient
 
 class GoogleBooksAdapter(BookMetadataProvider):
     BASE_URL = "https://www.googleapis.com/books/v1"
     logger = logging.getLogger(__name__)
 
+    def __init__(self, http_client: Optional[HttpClient] = None):
+        self.http = http_client or HttpClient()
+
     def search_by_isbn(self, isbn: str) -> Optional[Dict]:
         return self._search(f"isbn:{isbn}")
 
@@ -21,28 +24,21 @@ class GoogleBooksAdapter(BookMetadataProvider):
         return self._search_raw(query)
 
     def get_work_details(self, work_key: str) -> Dict:
-        url = f"{self.BASE_URL}/volumes/{work_key}"
-        response = requests.get(url)
-        if response.status_code != 200:
-            self.logger.warning(f"Error al obtener detalles de volumen '{work_key}': {response.status_code}")
-            return {}
-        return response.json()
+        return self.http.get_json(f"{self.BASE_URL}/volumes/{work_key}") or {}
 
     def get_edition_details(self, edition_key: str) -> Dict:
         return self.get_work_details(edition_key)
 
     def _search(self, query: str) -> Optional[Dict]:
-        results = self._search_raw(query)
+        results = self._search_raw(query, estricto=True)
         return results[0] if results else None
 
-    def _search_raw(self, query: str) -> List[Dict]:
-        url = f"{self.BASE_URL}/volumes?q={query}"
-        response = requests.get(url)
-        if response.status_code != 200:
-            self.logger.warning(f"Error en búsqueda Google Books '{query}': {response.status_code}")
+    def _search_raw(self, query: str, estricto: bool = False) -> List[Dict]:
+        data = self.http.get_json(f"{self.BASE_URL}/volumes", {"q": query}, vacio=lambda d: not d.get("items"), estricto=estricto)
+        if not data:
             return []
 
-        items = response.json().get("items", [])
+        items = data.get("items", [])
         libros = []
         for item in items:
             info = item.get("volumeInfo", {})
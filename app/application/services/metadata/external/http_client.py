@@ -0,0 +1,318 @@
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.application.services.metadata.external.response_cache import ResponseCache
+from app.application.services.metadata.external.token_bucket import TokenBucket
+from app.application.services.metadata.external.circuit_breaker import CircuitBreaker
+
+
+class ProveedorNoDisponible(Exception):
+    """El proveedor no respondió: error de red, respuesta no válida, límite agotado o circuito abierto."""
+
+
+class HttpClient:
+    """
+    Transporte HTTP compartido por los adaptadores de metadatos.
+
+    Mantiene un pool de conexiones keep-alive por host, aplica timeouts de conexión
+    y lectura, pide las respuestas comprimidas y reintenta con backoff exponencial
+    los errores de red y las respuestas 429/5xx (respetando `Retry-After`).
+    Los errores de conexión se reintentan en el pool; el resto, aquí, para que cada
+    intento pase por el limitador y cuente en el circuit breaker.
+    Con una `ResponseCache`, las respuestas JSON se sirven desde disco mientras
+    estén vigentes. Puede compartirse entre hilos.
+
+    Las peticiones a cada host pasan por un limitador de tasa y un circuit breaker
+    compartidos por todos los hilos: si un proveedor acumula errores, sus peticiones
+    se omiten durante el enfriamiento y los adaptadores devuelven resultados vacíos.
+    """
+    STATUS_REINTENTABLES = (429, 500, 502, 503, 504)
+    # Espera máxima entre reintentos, aunque `Retry-After` pida más
+    ESPERA_MAXIMA = 120.0
+
+    def __init__(
+        self,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 15.0,
+        retries: int = 3,
+        backoff: float = 0.5,
+        pool_size: int = 16,
+        user_agent: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limit: Optional[float] = None,
+        rate_limits: Optional[Dict[str, float]] = None,
+        rate_burst: Optional[int] = None,
+        breaker_threshold: float = 0.5,
+        breaker_cooldown: float = 60.0,
+    ):
+        """
+        Args:
+            connect_timeout (float): Segundos máximos para establecer la conexión.
+            read_timeout (float): Segundos máximos de espera entre bytes de la respuesta.
+            retries (int): Reintentos ante errores de red o respuestas 429/5xx; cada uno pasa
+                por el limitador y el circuit breaker del host, salvo los de conexión.
+            backoff (float): Factor del backoff exponencial entre reintentos.
+            pool_size (int): Conexiones abiertas que se conservan por host.
+            user_agent (Optional[str]): Cabecera User-Agent de las peticiones.
+            cache (Optional[ResponseCache]): Caché persistente de respuestas JSON.
+            rate_limit (Optional[float]): Peticiones por segundo por host; None para no limitar.
+            rate_limits (Optional[Dict[str, float]]): Límites específicos por host.
+            rate_burst (Optional[int]): Peticiones seguidas permitidas por host.
+            breaker_threshold (float): Proporción de errores que abre el circuito de un host.
+            breaker_cooldown (float): Segundos que un host permanece sin peticiones tras abrirse.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = cache
+        self.rate_limit = rate_limit
+        self.rate_limits = rate_limits or {}
+        self.rate_burst = rate_burst
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self._limitadores: Dict[str, Optional[TokenBucket]] = {}
+        self._circuitos: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+        # Solo errores de conexión: la petición no llegó al proveedor y no gasta su cuota
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,
+            status=0,
+            other=0,
+            backoff_factor=backoff,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate", "Accept": "application/json"})
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[requests.Response]:
+        """
+        Realiza una petición GET.
+
+        Args:
+            url (str): URL a consultar.
+            params (Optional[Dict[str, Any]]): Parámetros de la query string.
+            headers (Optional[Dict[str, str]]): Cabeceras adicionales.
+
+        Returns:
+            Optional[requests.Response]: La respuesta, o None si falló la conexión tras los reintentos,
+            se agotó la espera del limitador o el circuito del host está abierto. Si todos los
+            intentos terminan en 429/5xx, se devuelve la última respuesta.
+        """
+        host = urlparse(url).netloc
+        limitador, circuito = self._controles(host)
+
+        for intento in range(self.retries + 1):
+            # Primero el circuito: una petición que no se va a enviar no espera ni gasta turno del limitador
+            if not circuito.permitir():
+                self.logger.debug(f"Circuito de {host} abierto; se omite '{url}'")
+                return None
+            if limitador and not limitador.adquirir(timeout=self.timeout[1]):
+                circuito.cancelar()
+                self.logger.warning(f"Límite de peticiones a {host} agotado; se omite '{url}'")
+                return None
+
+            ultimo = intento == self.retries
+            try:
+                response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+            except requests.RequestException as e:
+                circuito.registrar(False)
+                # Los errores de conexión ya se reintentaron en el pool
+                if ultimo or isinstance(e, requests.ConnectionError):
+                    self.logger.warning(f"Error de red en '{url}': {e}")
+                    return None
+                self.logger.debug(f"Error de red en '{url}' (intento {intento + 1}): {e}")
+                time.sleep(self._espera(intento))
+                continue
+
+            reintentable = response.status_code in self.STATUS_REINTENTABLES
+            circuito.registrar(not reintentable)
+            if not reintentable or ultimo:
+                return response
+            self.logger.debug(f"Respuesta {response.status_code} de '{url}' (intento {intento + 1})")
+            espera = self._espera(intento, response.headers.get("Retry-After"))
+            response.close()
+            time.sleep(espera)
+
+    def _espera(self, intento: int, retry_after: Optional[str] = None) -> float:
+        if retry_after:
+            try:
+                segundos = float(retry_after)
+            except ValueError:
+                try:
+                    segundos = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    segundos = None
+            if segundos is not None:
+                return min(max(segundos, 0.0), self.ESPERA_MAXIMA)
+        return min(self.backoff * (2 ** intento), self.ESPERA_MAXIMA)
+
+    def _controles(self, host: str) -> Tuple[Optional[TokenBucket], CircuitBreaker]:
+        with self._lock:
+            if host not in self._circuitos:
+                tasa = self.rate_limits.get(host, self.rate_limit)
+                self._limitadores[host] = TokenBucket(tasa, self.rate_burst) if tasa else None
+                self._circuitos[host] = CircuitBreaker(
+                    host,
+                    umbral=self.breaker_threshold,
+                    enfriamiento=self.breaker_cooldown
+                )
+            return self._limitadores[host], self._circuitos[host]
+
+    def circuitos(self) -> Dict[str, str]:
+        """
+        Obtiene el estado del circuito de cada host consultado.
+
+        Returns:
+            Dict[str, str]: Host -> estado ('cerrado', 'abierto' o 'semiabierto').
+        """
+        with self._lock:
+            return {host: circuito.estado.value for host, circuito in self._circuitos.items()}
+
+    def get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        vacio: Optional[Callable[[Any], bool]] = None,
+        usar_cache: bool = True,
+        estricto: bool = False,
+    ) -> Optional[Any]:
+        """
+        Realiza una petición GET y decodifica la respuesta JSON, pasando por la caché si existe.
+
+        Args:
+            url (str): URL a consultar.
+            params (Optional[Dict[str, Any]]): Parámetros de la query string.
+            vacio (Optional[Callable[[Any], bool]]): Indica si una respuesta 200 no contiene
+                resultados, para guardarla en caché como negativa.
+            usar_cache (bool): Si es False, la petición no lee ni escribe la caché.
+            estricto (bool): Si es True, un fallo sin copia en caché lanza ProveedorNoDisponible
+                en lugar de devolver None, para distinguirlo de un 404.
+
+        Returns:
+            Optional[Any]: El cuerpo decodificado, o None si la petición falló o no devolvió 200.
+
+        Raises:
+            ProveedorNoDisponible: Con `estricto`, si el proveedor no respondió.
+        """
+        if not self.cache or not usar_cache:
+            return self._descargar_json(url, params, estricto)
+
+        clave = requests.Request("GET", url, params=params).prepare().url
+        entrada = self.cache.obtener(clave)
+        if entrada and entrada["vigente"]:
+            self.cache.registrar("aciertos")
+            return entrada["datos"]
+
+        headers = {}
+        if entrada and entrada["etag"]:
+            headers["If-None-Match"] = entrada["etag"]
+        if entrada and entrada["last_modified"]:
+            headers["If-Modified-Since"] = entrada["last_modified"]
+
+        response = self.get(clave, headers=headers or None)
+        if response is not None and response.status_code == 304 and entrada:
+            self.cache.registrar("revalidados")
+            self.cache.renovar(clave, entrada["negativa"])
+            return entrada["datos"]
+
+        self.cache.registrar("fallos")
+        if response is not None and response.status_code == 404:
+            self.cache.guardar(clave, None, negativa=True)
+            return None
+
+        datos = self._decodificar(response)
+        if datos is None:
+            # Error transitorio: se sirve la copia caducada, si la hay
+            if entrada:
+                return entrada["datos"]
+            if estricto:
+                raise ProveedorNoDisponible(f"Sin respuesta válida de '{url}'")
+            return None
+
+        self.cache.guardar(
+            clave,
+            datos,
+            negativa=bool(vacio and vacio(datos)),
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return datos
+
+    def cached_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[bool, Optional[Any]]:
+        """
+        Consulta solo la caché, sin acceder a la red.
+
+        Args:
+            url (str): URL de la petición.
+            params (Optional[Dict[str, Any]]): Parámetros de la query string.
+
+        Returns:
+            Tuple[bool, Optional[Any]]: Si había una respuesta vigente y su cuerpo decodificado.
+        """
+        if not self.cache:
+            return False, None
+        entrada = self.cache.obtener(requests.Request("GET", url, params=params).prepare().url)
+        if not entrada or not entrada["vigente"]:
+            return False, None
+        self.cache.registrar("aciertos")
+        return True, entrada["datos"]
+
+    def store_json(self, url: str, params: Optional[Dict[str, Any]], datos: Any, negativa: bool) -> None:
+        """
+        Guarda en caché una respuesta obtenida por otra vía, p. ej. desglosando una consulta por lotes.
+
+        Args:
+            url (str): URL de la petición.
+            params (Optional[Dict[str, Any]]): Parámetros de la query string.
+            datos (Any): Cuerpo que habría devuelto la petición.
+            negativa (bool): Si la respuesta no contiene resultados.
+        """
+        if self.cache:
+            self.cache.guardar(requests.Request("GET", url, params=params).prepare().url, datos, negativa)
+
+    def _descargar_json(self, url: str, params: Optional[Dict[str, Any]] = None, estricto: bool = False) -> Optional[Any]:
+        response = self.get(url, params)
+        datos = self._decodificar(response)
+        if datos is None and estricto and (response is None or response.status_code != 404):
+            raise ProveedorNoDisponible(f"Sin respuesta válida de '{url}'")
+        return datos
+
+    def _decodificar(self, response: Optional[requests.Response]) -> Optional[Any]:
+        if response is None:
+            return None
+        if response.status_code != 200:
+            self.logger.warning(f"Respuesta {response.status_code} de '{response.url}'")
+            return None
+        try:
+            return response.json()
+        except ValueError as e:
+            self.logger.warning(f"Respuesta no válida de '{response.url}': {e}")
+            return None
+
+    def close(self) -> None:
+        """Cierra las conexiones del pool."""
+        self.session.close()
@@ -1,48 +1,33 @@
-import requests
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from app.application.services.metadata.external.author_metadata_provider import AuthorMetadataProvider
+from app.application.services.metadata.external.http_client import HttpClient
 
 
 class OpenLibraryAuthorAdapter(AuthorMetadataProvider):
     BASE_URL = "https://openlibrary.org"
     logger = logging.getLogger(__name__)
 
+    def __init__(self, http_client: Optional[HttpClient] = None):
+        self.http = http_client or HttpClient()
+
     def search_author(self, name: str) -> List[Dict]:
-        url = f"{self.BASE_URL}/search/authors.json?q={name}"
-        response = requests.get(url)
-        if response.status_code != 200:
-            self.logger.warning(f"Error al buscar autor '{name}': {response.status_code}")
+        data = self.http.get_json(f"{self.BASE_URL}/search/authors.json", {"q": name}, vacio=lambda d: not d.get("docs"))
+        if not data:
             return []
 
-        data = response.json()
         return data.get("docs", [])
 
     def get_author_details(self, author_key: str) -> Dict:
-        url = f"{self.BASE_URL}/authors/{author_key}.json"
-        response = requests.get(url)
-        if response.status_code != 200:
-            self.logger.warning(f"Error al obtener detalles de autor '{author_key}': {response.status_code}")
-            return {}
-
-        return response.json()
+        return self.http.get_json(f"{self.BASE_URL}/authors/{author_key}.json") or {}
 
     def get_author_works(self, author_key: str, limit: int = 100) -> List[Dict]:
-        url = f"{self.BASE_URL}/authors/{author_key}/works.json?limit={limit}"
-        response = requests.get(url)
-        if response.status_code != 200:
-            self.logger.warning(f"Error al obtener obras de autor '{author_key}': {response.status_code}")
+        data = self.http.get_json(f"{self.BASE_URL}/authors/{author_key}/works.json", {"limit": limit}, vacio=lambda d: not d.get("entries"))
+        if not data:
             return []
 
-        data = response.json()
         return data.get("entries", [])
 
     def get_work_details(self, work_key: str) -> Dict:
-        url = f"{self.BASE_URL}/works/{work_key}.json"
-        response = requests.get(url)
-        if response.status_code != 200:
-            self.logger.warning(f"Error al obtener detalles de obra: {response.status_code}")
-            return {}
-
-        return response.json()  
\ No newline at end of file
+        return self.http.get_json(f"{self.BASE_URL}/works/{work_key}.json") or {}
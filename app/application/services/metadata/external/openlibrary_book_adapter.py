@@ -1,22 +1,66 @@
-import requests
 import logging
 from typing import Dict, List, Optional
 
 from app.application.services.metadata.external.book_metadata_provider import BookMetadataProvider
+from app.application.services.metadata.external.http_client import HttpClient
 
 class OpenLibraryBookAdapter(BookMetadataProvider):
     BASE_URL = "https://openlibrary.org"
+    # ISBN por petición a /api/books, para no exceder la longitud de la URL
+    MAX_BIBKEYS = 50
     logger = logging.getLogger(__name__)
 
+    def __init__(self, http_client: Optional[HttpClient] = None):
+        self.http = http_client or HttpClient()
+
     def search_by_isbn(self, isbn: str) -> Optional[Dict]:
-        url = f"{self.BASE_URL}/api/books?bibkeys=ISBN:{isbn}&format=json&jscmd=data"
-        response = requests.get(url)
-        if response.status_code != 200:
-            self.logger.warning(f"Error al buscar libro por ISBN '{isbn}': {response.status_code}")
+        data = self.http.get_json(
+            f"{self.BASE_URL}/api/books",
+            self._bibkeys_params([isbn]),
+            vacio=lambda d: not d.get(f"ISBN:{isbn}"),
+            estricto=True
+        )
+        if not data:
             return None
 
-        data = response.json()
-        book_data = data.get(f"ISBN:{isbn}")
+        return self._parse_book_data(data.get(f"ISBN:{isbn}"), isbn)
+
+    def search_by_isbns(self, isbns: List[str]) -> Dict[str, Dict]:
+        resultados = {}
+        pendientes = []
+        for isbn in dict.fromkeys(isbns):
+            en_cache, data = self.http.cached_json(f"{self.BASE_URL}/api/books", self._bibkeys_params([isbn]))
+            if not en_cache:
+                pendientes.append(isbn)
+                continue
+            libro = self._parse_book_data((data or {}).get(f"ISBN:{isbn}"), isbn)
+            if libro:
+                resultados[isbn] = libro
+
+        for inicio in range(0, len(pendientes), self.MAX_BIBKEYS):
+            grupo = pendientes[inicio:inicio + self.MAX_BIBKEYS]
+            data = self.http.get_json(f"{self.BASE_URL}/api/books", self._bibkeys_params(grupo), usar_cache=False, estricto=True)
+            if data is None:
+                continue
+
+            for isbn in grupo:
+                book_data = data.get(f"ISBN:{isbn}")
+                # Se guarda como la respuesta individual para que search_by_isbn también la aproveche
+                self.http.store_json(
+                    f"{self.BASE_URL}/api/books",
+                    self._bibkeys_params([isbn]),
+                    {f"ISBN:{isbn}": book_data} if book_data else {},
+                    negativa=not book_data
+                )
+                libro = self._parse_book_data(book_data, isbn)
+                if libro:
+                    resultados[isbn] = libro
+        return resultados
+
+    def _bibkeys_params(self, isbns: List[str]) -> Dict[str, str]:
+        return {"bibkeys": ",".join(f"ISBN:{isbn}" for isbn in isbns), "format": "json", "jscmd": "data"}
+
+    def _parse_book_data(self, book_data: Optional[Dict], isbn: str) -> Optional[Dict]:
         if not book_data:
             return None
 
@@ -31,13 +75,11 @@ class OpenLibraryBookAdapter(BookMetadataProvider):
         }
 
     def search_by_title(self, title: str) -> Optional[Dict]:
-        url = f"{self.BASE_URL}/search.json?title={title}"
-        response = requests.get(url)
-        if response.status_code != 200:
-            self.logger.warning(f"Error al buscar libro por título '{title}': {response.status_code}")
+        data = self.http.get_json(f"{self.BASE_URL}/search.json", {"title": title}, vacio=self._sin_docs, estricto=True)
+        if not data:
             return None
 
-        docs = response.json().get("docs", [])
+        docs = data.get("docs", [])
         if not docs:
             return None
 
@@ -51,37 +93,24 @@ class OpenLibraryBookAdapter(BookMetadataProvider):
         }
 
     def search_by_author(self, author_name: str) -> List[Dict]:
-        url = f"{self.BASE_URL}/search.json?author={author_name}"
-        response = requests.get(url)
-        if response.status_code != 200:
-            self.logger.warning(f"Error al buscar libros por autor '{author_name}': {response.status_code}")
+        data = self.http.get_json(f"{self.BASE_URL}/search.json", {"author": author_name}, vacio=self._sin_docs)
+        if not data:
             return []
 
-        return response.json().get("docs", [])
+        return data.get("docs", [])
 
     def search_by_query(self, query: str) -> List[Dict]:
-        url = f"{self.BASE_URL}/search.json?q={query}"
-        response = requests.get(url)
-        if response.status_code != 200:
-            self.logger.warning(f"Error en búsqueda libre '{query}': {response.status_code}")
+        data = self.http.get_json(f"{self.BASE_URL}/search.json", {"q": query}, vacio=self._sin_docs)
+        if not data:
             return []
 
-        return response.json().get("docs", [])
+        return data.get("docs", [])
 
     def get_work_details(self, work_key: str) -> Dict:
-        url = f"{self.BASE_URL}/works/{work_key}.json"
-        response = requests.get(url)
-        if response.status_code != 200:
-            self.logger.warning(f"Error al obtener detalles de obra '{work_key}': {response.status_code}")
-            return {}
-
-        return response.json()
+        return self.http.get_json(f"{self.BASE_URL}/works/{work_key}.json") or {}
 
     def get_edition_details(self, edition_key: str) -> Dict:
-        url = f"{self.BASE_URL}/books/{edition_key}.json"
-        response = requests.get(url)
-        if response.status_code != 200:
-            self.logger.warning(f"Error al obtener detalles de edición '{edition_key}': {response.status_code}")
-            return {}
+        return self.http.get_json(f"{self.BASE_URL}/books/{edition_key}.json") or {}
 
-        return response.json()
+    def _sin_docs(self, data: Dict) -> bool:
+        return not data.get("docs")
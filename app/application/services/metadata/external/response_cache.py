@@ -0,0 +1,182 @@
+from pathlib import Path
+from typing import Any, Dict, Optional
+import threading
+import sqlite3
+import logging
+import json
+import time
+
+class ResponseCache:
+    """
+    Caché persistente (SQLite) de las respuestas JSON de los proveedores de metadatos.
+
+    Las respuestas vacías (p. ej. una búsqueda sin resultados o un 404) se guardan
+    como negativas con un TTL propio, más corto, para no repetir la consulta en cada
+    escaneo. Al expirar, una entrada con ETag o Last-Modified se revalida con una
+    petición condicional. El número de entradas está acotado con expulsión LRU.
+    """
+    INTERVALO_PODA = 256
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_acierto: float = 30 * 24 * 3600,
+        ttl_fallo: float = 24 * 3600,
+        max_entradas: Optional[int] = 50000,
+    ):
+        """
+        Args:
+            path (Path): Archivo SQLite de la caché.
+            ttl_acierto (float): Segundos de validez de una respuesta con resultados.
+            ttl_fallo (float): Segundos de validez de una respuesta vacía.
+            max_entradas (Optional[int]): Entradas máximas; None para no limitar.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.ttl_acierto = ttl_acierto
+        self.ttl_fallo = ttl_fallo
+        self.max_entradas = max_entradas
+        self._lock = threading.Lock()
+        self._conexion: Optional[sqlite3.Connection] = None
+        self._escrituras = 0
+        self._contadores = {"aciertos": 0, "fallos": 0, "revalidados": 0}
+
+    def _conectar(self) -> sqlite3.Connection:
+        if self._conexion is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conexion = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conexion.execute("PRAGMA journal_mode=WAL")
+            conexion.execute("PRAGMA synchronous=NORMAL")
+            conexion.execute(
+                """CREATE TABLE IF NOT EXISTS respuestas (
+                    url TEXT PRIMARY KEY,
+                    datos TEXT NOT NULL,
+                    negativa INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    expira REAL NOT NULL,
+                    ultimo_acceso REAL NOT NULL
+                )"""
+            )
+            conexion.execute("CREATE INDEX IF NOT EXISTS ix_respuestas_acceso ON respuestas (ultimo_acceso)")
+            self._conexion = conexion
+        return self._conexion
+
+    def obtener(self, url: str) -> Optional[Dict]:
+        """
+        Busca la respuesta guardada para una URL, vigente o no.
+
+        Args:
+            url (str): URL completa de la petición.
+
+        Returns:
+            Optional[Dict]: Entrada con 'datos', 'negativa', 'etag', 'last_modified' y
+            'vigente', o None si la URL no está en caché.
+        """
+        try:
+            with self._lock:
+                conexion = self._conectar()
+                fila = conexion.execute(
+                    "SELECT datos, negativa, etag, last_modified, expira FROM respuestas WHERE url = ?",
+                    (url,)
+                ).fetchone()
+                if not fila:
+                    return None
+                ahora = time.time()
+                conexion.execute("UPDATE respuestas SET ultimo_acceso = ? WHERE url = ?", (ahora, url))
+        except sqlite3.Error as e:
+            self.logger.warning(f"Error al leer la caché HTTP: {e}")
+            return None
+
+        return {
+            "datos": json.loads(fila[0]),
+            "negativa": bool(fila[1]),
+            "etag": fila[2],
+            "last_modified": fila[3],
+            "vigente": fila[4] > ahora,
+        }
+
+    def guardar(
+        self,
+        url: str,
+        datos: Any,
+        negativa: bool,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """
+        Guarda la respuesta de una URL.
+
+        Args:
+            url (str): URL completa de la petición.
+            datos (Any): Cuerpo JSON decodificado.
+            negativa (bool): Si la respuesta no contiene resultados.
+            etag (Optional[str]): Cabecera ETag de la respuesta.
+            last_modified (Optional[str]): Cabecera Last-Modified de la respuesta.
+        """
+        ahora = time.time()
+        expira = ahora + (self.ttl_fallo if negativa else self.ttl_acierto)
+        try:
+            with self._lock:
+                self._conectar().execute(
+                    "INSERT OR REPLACE INTO respuestas VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (url, json.dumps(datos), int(negativa), etag, last_modified, expira, ahora)
+                )
+                self._escrituras += 1
+                if self.max_entradas and self._escrituras % self.INTERVALO_PODA == 0:
+                    self._podar()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self.logger.warning(f"Error al guardar en la caché HTTP: {e}")
+
+    def renovar(self, url: str, negativa: bool) -> None:
+        """
+        Extiende la validez de una entrada revalidada por el servidor (304).
+
+        Args:
+            url (str): URL completa de la petición.
+            negativa (bool): Si la entrada guardada es negativa.
+        """
+        expira = time.time() + (self.ttl_fallo if negativa else self.ttl_acierto)
+        try:
+            with self._lock:
+                self._conectar().execute("UPDATE respuestas SET expira = ? WHERE url = ?", (expira, url))
+        except sqlite3.Error as e:
+            self.logger.warning(f"Error al renovar la caché HTTP: {e}")
+
+    def _podar(self) -> None:
+        self._conectar().execute(
+            """DELETE FROM respuestas WHERE url IN (
+                SELECT url FROM respuestas ORDER BY ultimo_acceso DESC LIMIT -1 OFFSET ?
+            )""",
+            (self.max_entradas,)
+        )
+
+    def registrar(self, evento: str) -> None:
+        """
+        Cuenta un acceso a la caché.
+
+        Args:
+            evento (str): 'aciertos', 'fallos' o 'revalidados'.
+        """
+        with self._lock:
+            self._contadores[evento] += 1
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Obtiene las estadísticas de uso desde el arranque del proceso.
+
+        Returns:
+            Dict[str, float]: Aciertos, fallos, revalidaciones, ratio de aciertos y entradas guardadas.
+        """
+        with self._lock:
+            contadores = dict(self._contadores)
+            entradas = self._conectar().execute("SELECT COUNT(*) FROM respuestas").fetchone()[0]
+
+        total = sum(contadores.values())
+        aciertos = contadores["aciertos"] + contadores["revalidados"]
+        return {**contadores, "ratio": aciertos / total if total else 0.0, "entradas": entradas}
+
+    def limpiar(self) -> None:
+        """Elimina todas las entradas de la caché."""
+        with self._lock:
+            self._conectar().execute("DELETE FROM respuestas")
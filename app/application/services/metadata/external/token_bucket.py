@@ -0,0 +1,50 @@
+from typing import Optional
+import threading
+import time
+
+class TokenBucket:
+    """
+    Limitador de tasa por cubo de fichas, compartido entre hilos.
+
+    Se reponen `tasa` fichas por segundo hasta un máximo de `rafaga`; cada petición
+    consume una y, si no quedan, espera a que se reponga.
+    """
+    def __init__(self, tasa: float, rafaga: Optional[int] = None):
+        """
+        Args:
+            tasa (float): Peticiones por segundo sostenidas.
+            rafaga (Optional[int]): Peticiones que pueden hacerse seguidas; por defecto, `tasa`.
+        """
+        self.tasa = tasa
+        self.capacidad = max(1, rafaga if rafaga is not None else int(tasa))
+        self._fichas = float(self.capacidad)
+        self._ultima = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reponer(self, ahora: float) -> None:
+        self._fichas = min(self.capacidad, self._fichas + (ahora - self._ultima) * self.tasa)
+        self._ultima = ahora
+
+    def adquirir(self, timeout: Optional[float] = None) -> bool:
+        """
+        Consume una ficha, esperando si es necesario.
+
+        Args:
+            timeout (Optional[float]): Segundos máximos de espera; None para esperar sin límite.
+
+        Returns:
+            bool: True si se obtuvo la ficha, False si se agotó la espera.
+        """
+        limite = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                ahora = time.monotonic()
+                self._reponer(ahora)
+                if self._fichas >= 1:
+                    self._fichas -= 1
+                    return True
+                espera = (1 - self._fichas) / self.tasa
+
+            if limite is not None and ahora + espera > limite:
+                return False
+            time.sleep(espera)
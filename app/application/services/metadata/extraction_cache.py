@@ -0,0 +1,183 @@
+from pathlib import Path
+from typing import Any, Dict, Optional
+import sqlite3
+import logging
+import base64
+import json
+import time
+
+from app.application.services.metadata.file_fingerprinter import FileFingerprinter
+
+class ExtractionCache:
+    """
+    Caché en disco (SQLite) de los metadatos extraídos del contenido de los archivos.
+
+    La clave es la huella parcial del archivo (tamaño, inicio y final) junto con su
+    fecha de modificación, más la versión del extractor: la huella parcial sola no
+    detecta una edición en mitad del archivo que conserve el tamaño. Subir la versión
+    invalida las entradas anteriores, que se purgan al abrir la caché.
+
+    La conexión se abre en el primer uso dentro de cada proceso, por lo que la caché
+    puede enviarse a los procesos de extracción.
+    """
+    INTERVALO_PODA = 64
+    REFRESCO_ACCESO = 3600
+
+    def __init__(self, path: Path, version: int, max_bytes: Optional[int] = None, fingerprinter: Optional[FileFingerprinter] = None):
+        """
+        Args:
+            path (Path): Archivo SQLite de la caché.
+            version (int): Versión de la lógica de extracción.
+            max_bytes (Optional[int]): Tamaño máximo de los datos almacenados; None para no limitar.
+            fingerprinter (Optional[FileFingerprinter]): Calculador de huellas.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.version = version
+        self.max_bytes = max_bytes
+        self.fingerprinter = fingerprinter or FileFingerprinter()
+        self._conexion: Optional[sqlite3.Connection] = None
+        self._escrituras = 0
+
+    def __getstate__(self) -> Dict:
+        estado = self.__dict__.copy()
+        estado["_conexion"] = None
+        estado["_escrituras"] = 0
+        return estado
+
+    def _conectar(self) -> sqlite3.Connection:
+        if self._conexion is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conexion = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conexion.execute("PRAGMA journal_mode=WAL")
+            conexion.execute("PRAGMA synchronous=NORMAL")
+            conexion.execute(
+                """CREATE TABLE IF NOT EXISTS extracciones (
+                    huella TEXT NOT NULL,
+                    version INTEGER NOT NULL,
+                    datos TEXT NOT NULL,
+                    tamano INTEGER NOT NULL,
+                    ultimo_acceso REAL NOT NULL,
+                    PRIMARY KEY (huella, version)
+                )"""
+            )
+            conexion.execute("CREATE INDEX IF NOT EXISTS ix_extracciones_acceso ON extracciones (ultimo_acceso)")
+            conexion.execute("DELETE FROM extracciones WHERE version != ?", (self.version,))
+            self._conexion = conexion
+        return self._conexion
+
+    def clave(self, path: Path, hash_parcial: Optional[str] = None) -> str:
+        """
+        Calcula la clave de un archivo en la caché.
+
+        Args:
+            path (Path): Ruta al archivo.
+            hash_parcial (Optional[str]): Huella parcial ya calculada, para no volver a leer el archivo.
+
+        Returns:
+            str: Huella parcial y fecha de modificación en nanosegundos.
+        """
+        mtime_ns = path.stat().st_mtime_ns
+        return f"{hash_parcial or self.fingerprinter.hash_parcial(path)}:{mtime_ns}"
+
+    def obtener(self, path: Path, hash_parcial: Optional[str] = None) -> Optional[Dict]:
+        """
+        Busca los metadatos de un archivo en la caché.
+
+        Args:
+            path (Path): Ruta al archivo.
+            hash_parcial (Optional[str]): Huella parcial ya calculada.
+
+        Returns:
+            Optional[Dict]: Los metadatos guardados, o None si no están en caché.
+        """
+        try:
+            huella = self.clave(path, hash_parcial)
+            conexion = self._conectar()
+            fila = conexion.execute(
+                "SELECT datos, ultimo_acceso FROM extracciones WHERE huella = ? AND version = ?",
+                (huella, self.version)
+            ).fetchone()
+            if not fila:
+                return None
+
+            ahora = time.time()
+            if ahora - fila[1] > self.REFRESCO_ACCESO:
+                conexion.execute(
+                    "UPDATE extracciones SET ultimo_acceso = ? WHERE huella = ? AND version = ?",
+                    (ahora, huella, self.version)
+                )
+            return json.loads(fila[0], object_hook=self._decodificar)
+        except (OSError, sqlite3.Error, ValueError) as e:
+            self.logger.warning(f"Error al leer la caché de extracción para '{path.name}': {e}")
+            return None
+
+    def guardar(self, path: Path, metadata: Dict, hash_parcial: Optional[str] = None) -> None:
+        """
+        Guarda los metadatos extraídos de un archivo.
+
+        Args:
+            path (Path): Ruta al archivo.
+            metadata (Dict): Metadatos del contenido.
+            hash_parcial (Optional[str]): Huella parcial ya calculada.
+        """
+        try:
+            huella = self.clave(path, hash_parcial)
+            datos = json.dumps(metadata, default=self._codificar)
+            conexion = self._conectar()
+            conexion.execute(
+                "INSERT OR REPLACE INTO extracciones (huella, version, datos, tamano, ultimo_acceso) VALUES (?, ?, ?, ?, ?)",
+                (huella, self.version, datos, len(datos), time.time())
+            )
+            self._escrituras += 1
+            if self._escrituras % self.INTERVALO_PODA == 0:
+                self.podar()
+        except (OSError, sqlite3.Error, TypeError, ValueError) as e:
+            self.logger.warning(f"Error al guardar en la caché de extracción '{path.name}': {e}")
+
+    def podar(self) -> int:
+        """
+        Elimina las entradas usadas hace más tiempo hasta dejar la caché por debajo
+        del 90 % de su tamaño máximo.
+
+        Returns:
+            int: Número de entradas eliminadas.
+        """
+        if not self.max_bytes:
+            return 0
+
+        conexion = self._conectar()
+        total = conexion.execute("SELECT COALESCE(SUM(tamano), 0) FROM extracciones").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        exceso = total - int(self.max_bytes * 0.9)
+        eliminadas = 0
+        filas = conexion.execute("SELECT huella, version, tamano FROM extracciones ORDER BY ultimo_acceso").fetchall()
+        conexion.execute("BEGIN")
+        for huella, version, tamano in filas:
+            if exceso <= 0:
+                break
+            conexion.execute("DELETE FROM extracciones WHERE huella = ? AND version = ?", (huella, version))
+            exceso -= tamano
+            eliminadas += 1
+        conexion.execute("COMMIT")
+
+        self.logger.info(f"Caché de extracción podada: {eliminadas} entradas eliminadas")
+        return eliminadas
+
+    def limpiar(self) -> None:
+        """Elimina todas las entradas de la caché."""
+        self._conectar().execute("DELETE FROM extracciones")
+
+    @staticmethod
+    def _codificar(valor: Any) -> Any:
+        if isinstance(valor, (bytes, bytearray)):
+            return {"__bytes__": base64.b64encode(valor).decode("ascii")}
+        raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+    @staticmethod
+    def _decodificar(valor: Dict) -> Any:
+        if set(valor) == {"__bytes__"}:
+            return base64.b64decode(valor["__bytes__"])
+        return valor
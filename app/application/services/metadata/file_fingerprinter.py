@@ -0,0 +1,50 @@
+from pathlib import Path
+import hashlib
+
+class FileFingerprinter:
+    """
+    Calcula huellas de contenido de un archivo leyéndolo por bloques.
+
+    La huella parcial (tamaño, inicio y final del archivo) es barata y sirve para
+    descartar candidatos; la completa recorre todo el archivo y solo se calcula
+    cuando la parcial coincide con la de otro libro.
+    """
+    TAMANO_MUESTRA = 64 * 1024
+    TAMANO_BLOQUE = 1024 * 1024
+
+    def hash_parcial(self, path: Path) -> str:
+        """
+        Calcula la huella parcial de un archivo.
+
+        Args:
+            path (Path): Ruta al archivo.
+
+        Returns:
+            str: Hash BLAKE2b en formato hexadecimal.
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        with open(path, "rb") as archivo:
+            tamano = archivo.seek(0, 2)
+            digest.update(tamano.to_bytes(8, "little"))
+            archivo.seek(0)
+            digest.update(archivo.read(self.TAMANO_MUESTRA))
+            if tamano > self.TAMANO_MUESTRA:
+                archivo.seek(max(self.TAMANO_MUESTRA, tamano - self.TAMANO_MUESTRA))
+                digest.update(archivo.read(self.TAMANO_MUESTRA))
+        return digest.hexdigest()
+
+    def hash_completo(self, path: Path) -> str:
+        """
+        Calcula la huella de todo el contenido de un archivo.
+
+        Args:
+            path (Path): Ruta al archivo.
+
+        Returns:
+            str: Hash BLAKE2b en formato hexadecimal.
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        with open(path, "rb") as archivo:
+            while bloque := archivo.read(self.TAMANO_BLOQUE):
+                digest.update(bloque)
+        return digest.hexdigest()
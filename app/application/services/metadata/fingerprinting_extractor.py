@@ -0,0 +1,87 @@
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+import os
+
+from app.application.services.metadata.metadata_extractor import MetadataExtractor
+from app.application.services.metadata.file_fingerprinter import FileFingerprinter
+from app.application.services.metadata.local_metadata_extractor import LocalMetadataExtractor
+
+class FingerprintingExtractor(MetadataExtractor):
+    """
+    Añade la huella de contenido a los metadatos y omite la extracción de los
+    archivos cuyo contenido ya corresponde a un libro registrado.
+    """
+    def __init__(
+        self,
+        extractor: LocalMetadataExtractor,
+        fingerprinter: FileFingerprinter,
+        conocidos: Optional[Dict[str, List[Dict]]] = None,
+    ):
+        """
+        Args:
+            extractor (LocalMetadataExtractor): Extractor al que se delega si el contenido es nuevo.
+            fingerprinter (FileFingerprinter): Calculador de huellas.
+            conocidos (Optional[Dict[str, List[Dict]]]): Libros registrados por huella parcial,
+                con claves 'id', 'path' y 'hash_contenido'.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.extractor = extractor
+        self.fingerprinter = fingerprinter
+        self.conocidos = conocidos or {}
+
+    def extract_metadata(self, path: Path) -> Dict:
+        """
+        Extrae los metadatos de un archivo junto con sus huellas.
+
+        Returns:
+            Dict: Metadatos con 'hash_parcial' y, si se calculó, 'hash_contenido'. Si el
+            contenido ya está registrado, solo las huellas y 'libro_existente'.
+        """
+        huellas = {"hash_parcial": self.fingerprinter.hash_parcial(path)}
+
+        # Incluye el libro registrado en la misma ruta: si el archivo solo cambió de
+        # fecha, su huella completa coincide y no hace falta volver a extraerlo
+        candidatos = self.conocidos.get(huellas["hash_parcial"], [])
+        if candidatos:
+            huellas["hash_contenido"] = self.fingerprinter.hash_completo(path)
+            existente = self.identificar(huellas["hash_contenido"], candidatos, path)
+            if existente:
+                self.logger.debug(f"Contenido ya registrado: {path.name} -> {existente['path']}")
+                return {**huellas, "libro_existente": existente}
+
+        # La huella parcial ya calculada sirve de clave en la caché de extracción
+        return {**self.extractor.extract_metadata(path, huellas["hash_parcial"]), **huellas}
+
+    def identificar(self, hash_contenido: str, candidatos: List[Dict], path: Optional[Path] = None) -> Optional[Dict]:
+        """
+        Busca entre los candidatos con la misma huella parcial el que tiene el mismo contenido.
+
+        Si el archivo de un candidato ya no existe y no se conoce su huella completa,
+        la coincidencia parcial se da por buena: es el caso de un archivo movido. El
+        candidato de la propia ruta tiene preferencia, pero solo coincide si se conoce su
+        huella completa: el archivo que había en ella ya no se puede leer.
+
+        Args:
+            hash_contenido (str): Huella completa del archivo.
+            candidatos (List[Dict]): Libros con la misma huella parcial.
+            path (Optional[Path]): Ruta del archivo.
+
+        Returns:
+            Optional[Dict]: El candidato coincidente, o None si el contenido es nuevo.
+        """
+        ruta = str(path) if path is not None else None
+        for candidato in candidatos:
+            if candidato["path"] == ruta and candidato.get("hash_contenido") == hash_contenido:
+                return candidato
+
+        for candidato in candidatos:
+            if candidato["path"] == ruta:
+                continue
+            completo = candidato.get("hash_contenido")
+            if completo is None and os.path.exists(candidato["path"]):
+                completo = self.fingerprinter.hash_completo(Path(candidato["path"]))
+                candidato["hash_contenido"] = completo
+            if completo is None or completo == hash_contenido:
+                return candidato
+        return None
@@ -0,0 +1,77 @@
+from pathlib import Path
+from typing import Dict, Optional
+import logging
+
+from app.application.services.metadata.metadata_extractor import MetadataExtractor
+from app.application.services.metadata.folder_metadata_builder import FolderMetadataBuilder
+from app.application.services.metadata.epub_metadata_extractor import EpubMetadataExtractor
+from app.application.services.metadata.pdf_metadata_extractor import PdfMetadataExtractor
+from app.application.services.metadata.extraction_cache import ExtractionCache
+
+class LocalMetadataExtractor(MetadataExtractor):
+    """
+    Combina los metadatos inferidos de la ruta con los extraídos del contenido del archivo.
+
+    No accede a la red ni a la base de datos, por lo que puede ejecutarse en un proceso aparte.
+    Los metadatos de la ruta no se guardan en caché: dependen de dónde esté el archivo,
+    no de su contenido, y calcularlos no requiere leerlo.
+    """
+    # Subir al cambiar la lógica de extracción o la clave de la caché para invalidarla
+    VERSION = 2
+
+    def __init__(
+        self,
+        folder_builder: FolderMetadataBuilder,
+        epub_extractor: EpubMetadataExtractor,
+        pdf_extractor: PdfMetadataExtractor,
+        cache: Optional[ExtractionCache] = None,
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.folder_builder = folder_builder
+        self.epub_extractor = epub_extractor
+        self.pdf_extractor = pdf_extractor
+        self.cache = cache
+
+    def extract_metadata(self, path: Path, hash_parcial: Optional[str] = None) -> Dict:
+        """
+        Extrae los metadatos locales de un libro.
+
+        Args:
+            path (Path): Ruta al archivo EPUB o PDF.
+            hash_parcial (Optional[str]): Huella parcial ya calculada, para la clave de la caché.
+
+        Returns:
+            Dict: Metadatos de carpeta y nombre de archivo, sobrescritos por los del contenido.
+        """
+        folder_meta = self.folder_builder.build_metadata(path)
+        content_meta = self.extract_content_metadata(path, hash_parcial)
+        return {**folder_meta, **content_meta}
+
+    def extract_content_metadata(self, path: Path, hash_parcial: Optional[str] = None) -> Dict:
+        """
+        Extrae los metadatos embebidos en el archivo según su extensión.
+
+        Args:
+            path (Path): Ruta al archivo.
+            hash_parcial (Optional[str]): Huella parcial ya calculada, para la clave de la caché.
+
+        Returns:
+            Dict: Metadatos del contenido, o un diccionario vacío si el formato no es soportado.
+        """
+        if path.suffix.lower() not in (".epub", ".pdf"):
+            return {}
+
+        if self.cache:
+            metadata = self.cache.obtener(path, hash_parcial)
+            if metadata is not None:
+                self.logger.debug(f"Metadatos de {path.name} obtenidos de la caché")
+                return metadata
+
+        if path.suffix.lower() == ".epub":
+            metadata = self.epub_extractor.extract_metadata(path)
+        else:
+            metadata = self.pdf_extractor.extract_metadata(path)
+
+        if self.cache:
+            self.cache.guardar(path, metadata, hash_parcial)
+        return metadata
@@ -2,12 +2,24 @@ from pathlib import Path
 from typing import Dict, Optional
 from PyPDF2 import PdfReader
 import logging
+import io
 
 from app.application.services.metadata.metadata_extractor import MetadataExtractor
+from app.application.services.metadata.bounded_reader import BoundedReader
 
 class PdfMetadataExtractor(MetadataExtractor):
-    def __init__(self):
+    def __init__(self, lazy: bool = True, max_bytes: Optional[int] = None, timeout: Optional[float] = None):
+        """
+        Args:
+            lazy (bool): Si es True, lee solo el trailer, el diccionario Info, el XMP y el
+                `/Count` del árbol de páginas, sin cargar el archivo completo.
+            max_bytes (Optional[int]): Bytes máximos a leer por archivo en modo lazy.
+            timeout (Optional[float]): Segundos máximos de lectura por archivo en modo lazy.
+        """
         self.logger = logging.getLogger(__name__)
+        self.lazy = lazy
+        self.max_bytes = max_bytes
+        self.timeout = timeout
 
     def extract_metadata(self, file_path: Path) -> Dict[str, Optional[str]]:
         """
@@ -23,6 +35,9 @@ class PdfMetadataExtractor(MetadataExtractor):
             "num_paginas": None
         }
 
+        if self.lazy:
+            return self._extract_lazy(file_path, metadata)
+
         try:
             reader = PdfReader(str(file_path))
             doc_info = reader.metadata
@@ -36,10 +51,61 @@ class PdfMetadataExtractor(MetadataExtractor):
 
         return metadata
 
+    def _extract_lazy(self, file_path: Path, metadata: Dict) -> Dict:
+        """
+        Extrae los metadatos resolviendo solo los objetos necesarios, con lecturas
+        acotadas por el presupuesto de bytes y tiempo.
+
+        Si el presupuesto se agota, se devuelve lo que se haya extraído hasta entonces.
+
+        Args:
+            file_path (Path): Ruta al archivo PDF.
+            metadata (Dict): Metadatos vacíos a completar.
+
+        Returns:
+            Dict: Los metadatos extraídos.
+        """
+        try:
+            with open(file_path, "rb") as archivo:
+                stream = io.BufferedReader(BoundedReader(archivo, self.max_bytes, self.timeout))
+                reader = PdfReader(stream)
+
+                doc_info = reader.metadata
+                if doc_info:
+                    metadata["titulo"] = doc_info.title
+                    if doc_info.author:
+                        metadata["autores"] = [doc_info.author]
+                    metadata["year"] = self._extract_year(doc_info)
+
+                if not metadata["titulo"] or not metadata["autores"] or not metadata["year"]:
+                    self._merge_xmp(reader, metadata)
+
+                # El /Count del nodo raíz evita recorrer el árbol de páginas
+                metadata["num_paginas"] = str(int(reader.trailer["/Root"]["/Pages"]["/Count"]))
+        except Exception as e:
+            self.logger.warning(f"Error al extraer metadatos de PDF '{file_path.name}': {e}")
+
+        return metadata
+
+    def _merge_xmp(self, reader: PdfReader, metadata: Dict) -> None:
+        """
+        Completa los campos que faltan con los metadatos XMP del documento, si existen.
+        """
+        xmp = reader.xmp_metadata
+        if not xmp:
+            return
+
+        if not metadata["titulo"] and xmp.dc_title:
+            metadata["titulo"] = next(iter(xmp.dc_title.values()), None)
+        if not metadata["autores"] and xmp.dc_creator:
+            metadata["autores"] = list(xmp.dc_creator)
+        if not metadata["year"] and xmp.xmp_create_date:
+            metadata["year"] = str(xmp.xmp_create_date.year)
+
     def _extract_year(self, doc_info) -> Optional[str]:
         # Intenta extraer el año desde la fecha de creación
-        date_str = getattr(doc_info, "creation_date", None)
+        date_str = getattr(doc_info, "creation_date_raw", None) or None
         if date_str and len(date_str) >= 6:
             # Formato típico: D:YYYYMMDD...
             return date_str[2:6]
-        return None
\ No newline at end of file
+        return None
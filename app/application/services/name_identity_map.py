@@ -0,0 +1,108 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+import unicodedata
+import logging
+
+from app.domain.entities import Autor, Serie
+from app.domain.services import AutorService, SerieService
+
+
+def normalizar_nombre(nombre: str) -> str:
+    """
+    Clave de comparación de un nombre: sin acentos, sin distinguir mayúsculas y con
+    los espacios colapsados, de modo que "José  Martí" y "jose marti" coinciden.
+    """
+    descompuesto = unicodedata.normalize("NFKD", nombre or "")
+    sin_acentos = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return " ".join(sin_acentos.casefold().split())
+
+
+class NameIdentityMap:
+    """
+    Mapa en memoria, durante un escaneo, de los nombres normalizados de autores y
+    series a sus IDs.
+
+    Se carga una sola vez con los nombres ya registrados y resuelve cada nombre en
+    O(1) y por coincidencia exacta: "Ana" no se confunde con "Ana María". Los que
+    faltan se crean en bloque por cada lote de escritura. Las altas de un lote cuya
+    transacción se deshace se descartan con `descartar`.
+    """
+    def __init__(self, autor_service: AutorService, serie_service: SerieService):
+        self.logger = logging.getLogger(__name__)
+        self.autor_service = autor_service
+        self.serie_service = serie_service
+        self._autores: Dict[str, UUID] = {}
+        self._series: Dict[str, UUID] = {}
+        self._nuevos: List[Tuple[Dict[str, UUID], str]] = []
+        self._cargado = False
+
+    def cargar(self) -> None:
+        """Carga los nombres de todos los autores y series registrados."""
+        for fila in self.autor_service.listar_nombres():
+            self._autores.setdefault(normalizar_nombre(fila["nombre"]), fila["id"])
+        for fila in self.serie_service.listar_nombres():
+            self._series.setdefault(normalizar_nombre(fila["nombre"]), fila["id"])
+        self._cargado = True
+        self.logger.debug(f"Mapa de nombres cargado: {len(self._autores)} autores, {len(self._series)} series")
+
+    def preparar(self, metadatas: Iterable[Dict]) -> None:
+        """
+        Registra, con una escritura por tabla, los autores y las series de los metadatos
+        que aún no existen. Cada serie nueva se asocia al primer autor de su libro.
+
+        Args:
+            metadatas (Iterable[Dict]): Metadatos de los libros de un lote.
+        """
+        if not self._cargado:
+            self.cargar()
+
+        metadatas = list(metadatas)
+        autores: Dict[str, Autor] = {}
+        for metadata in metadatas:
+            for nombre in metadata.get("autores") or []:
+                clave = normalizar_nombre(nombre)
+                if clave and clave not in self._autores and clave not in autores:
+                    autores[clave] = Autor(nombre=nombre.strip())
+        if autores:
+            self.autor_service.registrar_lote(list(autores.values()))
+            self._agregar(self._autores, {clave: autor.id for clave, autor in autores.items()})
+
+        series: Dict[str, Serie] = {}
+        for metadata in metadatas:
+            clave = normalizar_nombre(metadata.get("serie"))
+            if not clave or clave in self._series or clave in series:
+                continue
+            autor_ids = [a for a in map(self.autor_id, metadata.get("autores") or []) if a]
+            if autor_ids:
+                series[clave] = Serie(nombre=metadata["serie"].strip(), autor_ids=autor_ids[:1], libros=[])
+        if series:
+            self.serie_service.registrar_lote(list(series.values()))
+            self._agregar(self._series, {clave: serie.id for clave, serie in series.items()})
+
+    def _agregar(self, mapa: Dict[str, UUID], nuevos: Dict[str, UUID]) -> None:
+        mapa.update(nuevos)
+        self._nuevos.extend((mapa, clave) for clave in nuevos)
+
+    def autor_id(self, nombre: str) -> Optional[UUID]:
+        """
+        Returns:
+            Optional[UUID]: El ID del autor con ese nombre, o None si no está registrado.
+        """
+        return self._autores.get(normalizar_nombre(nombre))
+
+    def serie_id(self, nombre: str) -> Optional[UUID]:
+        """
+        Returns:
+            Optional[UUID]: El ID de la serie con ese nombre, o None si no está registrada.
+        """
+        return self._series.get(normalizar_nombre(nombre))
+
+    def confirmar(self) -> None:
+        """Da por guardadas las altas pendientes, tras confirmarse su transacción."""
+        self._nuevos.clear()
+
+    def descartar(self) -> None:
+        """Olvida las altas pendientes, cuya transacción se deshizo."""
+        for mapa, clave in self._nuevos:
+            mapa.pop(clave, None)
+        self._nuevos.clear()
@@ -0,0 +1,270 @@
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import threading
+import logging
+import queue
+import time
+import os
+
+from app.application.services.metadata.metadata_extractor import MetadataExtractor
+
+# Marca de fin de flujo entre etapas
+_FIN = object()
+
+# Extractor del proceso hijo, instalado por el inicializador del pool
+_extractor_proceso: Optional[MetadataExtractor] = None
+
+
+def _inicializar_proceso(extractor: MetadataExtractor) -> None:
+    global _extractor_proceso
+    _extractor_proceso = extractor
+
+
+def _extraer_en_proceso(file_path: Path) -> Dict:
+    return _extractor_proceso.extract_metadata(file_path)
+
+
+class ScanPipeline:
+    """
+    Pipeline de escaneo por etapas concurrentes conectadas por colas acotadas:
+
+    1. Descubrimiento de archivos (un hilo).
+    2. Extracción de metadatos locales, intensiva en CPU (pool de procesos).
+    3. Agrupación de los resultados en lotes (un hilo).
+    4. Enriquecimiento por lotes con proveedores externos, intensivo en E/S (pool de hilos).
+    5. Escritura en base de datos por lotes (hilo que invoca a `run`, único escritor).
+    """
+    def __init__(
+        self,
+        extractor: MetadataExtractor,
+        enrich: Callable[[List[Dict]], List[Dict]],
+        write: Callable[[List[Tuple[Path, Dict]]], List[bool]],
+        workers: Optional[int] = None,
+        io_workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        batch_size: int = 50,
+        batch_wait: float = 1.0,
+        write_batch_size: int = 200,
+    ):
+        """
+        Args:
+            extractor (MetadataExtractor): Extractor local; debe poder serializarse para enviarse a los procesos.
+            enrich (Callable[[List[Dict]], List[Dict]]): Función que enriquece un lote de metadatos, en el mismo orden.
+            write (Callable[[List[Tuple[Path, Dict]]], List[bool]]): Función que registra un lote de libros
+                en una transacción; devuelve, en el mismo orden, si cada uno se registró.
+            workers (Optional[int]): Procesos de extracción. Por defecto, uno por núcleo.
+            io_workers (Optional[int]): Hilos de enriquecimiento. Por defecto, cuatro por núcleo (máximo 32).
+            queue_size (Optional[int]): Capacidad de cada cola. Por defecto, cuatro por proceso de extracción.
+            batch_size (int): Libros máximos por lote de enriquecimiento.
+            batch_wait (float): Segundos máximos que un lote incompleto espera a llenarse.
+            write_batch_size (int): Libros máximos por transacción de escritura.
+        """
+        cpu = os.cpu_count() or 1
+        self.logger = logging.getLogger(__name__)
+        self.extractor = extractor
+        self.enrich = enrich
+        self.write = write
+        self.workers = workers or cpu
+        self.io_workers = io_workers or min(32, cpu * 4)
+        self.queue_size = queue_size or self.workers * 4
+        self.batch_size = max(1, batch_size)
+        self.batch_wait = batch_wait
+        self.write_batch_size = max(1, write_batch_size)
+        self._detener = threading.Event()
+        self._lock = threading.Lock()
+        self._estadisticas: Dict[str, int] = {}
+
+    def run(self, rutas: Iterable[Path]) -> Dict[str, int]:
+        """
+        Procesa las rutas dadas a través de todas las etapas.
+
+        Args:
+            rutas (Iterable[Path]): Archivos a procesar; se consume de forma perezosa.
+
+        Returns:
+            Dict[str, int]: Contadores de archivos descubiertos, registrados y con errores.
+        """
+        self._detener.clear()
+        self._estadisticas = {"descubiertos": 0, "registrados": 0, "errores": 0}
+
+        cola_rutas = queue.Queue(maxsize=self.queue_size)
+        cola_extraidos = queue.Queue(maxsize=self.queue_size)
+        cola_lotes = queue.Queue(maxsize=self.queue_size)
+        cola_enriquecidos = queue.Queue(maxsize=self.queue_size)
+
+        hilos = [
+            threading.Thread(target=self._descubrir, args=(rutas, cola_rutas), name="scan-descubrimiento", daemon=True),
+            threading.Thread(target=self._extraer, args=(cola_rutas, cola_extraidos), name="scan-extraccion", daemon=True),
+            threading.Thread(target=self._agrupar, args=(cola_extraidos, cola_lotes), name="scan-agrupacion", daemon=True),
+        ]
+        hilos += [
+            threading.Thread(target=self._enriquecer, args=(cola_lotes, cola_enriquecidos), name=f"scan-enriquecimiento-{i}", daemon=True)
+            for i in range(self.io_workers)
+        ]
+        for hilo in hilos:
+            hilo.start()
+
+        try:
+            self._escribir(cola_enriquecidos)
+        finally:
+            self._detener.set()
+            for hilo in hilos:
+                hilo.join()
+
+        return dict(self._estadisticas)
+
+    def _contar(self, clave: str) -> None:
+        with self._lock:
+            self._estadisticas[clave] += 1
+
+    def _poner(self, cola: queue.Queue, item) -> bool:
+        """
+        Encola un elemento esperando mientras la cola esté llena, salvo que el pipeline se detenga.
+        """
+        while not self._detener.is_set():
+            try:
+                cola.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _descubrir(self, rutas: Iterable[Path], cola_rutas: queue.Queue) -> None:
+        try:
+            for ruta in rutas:
+                if not self._poner(cola_rutas, ruta):
+                    return
+                self._contar("descubiertos")
+        except Exception as e:
+            self.logger.exception(f"Error al descubrir archivos: {e}")
+        finally:
+            self._poner(cola_rutas, _FIN)
+
+    def _extraer(self, cola_rutas: queue.Queue, cola_extraidos: queue.Queue) -> None:
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_inicializar_proceso,
+            initargs=(self.extractor,)
+        )
+        try:
+            pendientes = {}
+            fin = False
+            while (not fin or pendientes) and not self._detener.is_set():
+                # Mantener como mucho `queue_size` archivos en vuelo
+                while not fin and len(pendientes) < self.queue_size:
+                    try:
+                        ruta = cola_rutas.get_nowait() if pendientes else cola_rutas.get(timeout=0.1)
+                    except queue.Empty:
+                        break
+                    if ruta is _FIN:
+                        fin = True
+                        break
+                    pendientes[pool.submit(_extraer_en_proceso, ruta)] = ruta
+
+                if not pendientes:
+                    continue
+
+                hechos, _ = wait(pendientes, timeout=0.1, return_when=FIRST_COMPLETED)
+                for futuro in hechos:
+                    ruta = pendientes.pop(futuro)
+                    try:
+                        metadata = futuro.result()
+                    except Exception as e:
+                        self.logger.warning(f"❌ Error al extraer metadatos de '{ruta.name}': {e}")
+                        self._contar("errores")
+                        continue
+                    self._poner(cola_extraidos, (ruta, metadata))
+        except Exception as e:
+            self.logger.exception(f"Error en la etapa de extracción: {e}")
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+            self._poner(cola_extraidos, _FIN)
+
+    def _agrupar(self, cola_extraidos: queue.Queue, cola_lotes: queue.Queue) -> None:
+        """
+        Agrupa los archivos extraídos en lotes de hasta `batch_size`; un lote incompleto
+        se envía al cumplirse `batch_wait` desde su primer elemento.
+        """
+        lote: List = []
+        limite = 0.0
+        try:
+            while not self._detener.is_set():
+                try:
+                    item = cola_extraidos.get(timeout=max(0.0, limite - time.monotonic()) if lote else 0.1)
+                except queue.Empty:
+                    if lote and time.monotonic() >= limite:
+                        self._poner(cola_lotes, lote)
+                        lote = []
+                    continue
+                if item is _FIN:
+                    break
+
+                if not lote:
+                    limite = time.monotonic() + self.batch_wait
+                lote.append(item)
+                if len(lote) >= self.batch_size:
+                    self._poner(cola_lotes, lote)
+                    lote = []
+        finally:
+            if lote:
+                self._poner(cola_lotes, lote)
+            for _ in range(self.io_workers):
+                self._poner(cola_lotes, _FIN)
+
+    def _enriquecer(self, cola_lotes: queue.Queue, cola_enriquecidos: queue.Queue) -> None:
+        try:
+            while not self._detener.is_set():
+                try:
+                    lote = cola_lotes.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if lote is _FIN:
+                    break
+
+                rutas = [ruta for ruta, _ in lote]
+                metadatas = [metadata for _, metadata in lote]
+                try:
+                    metadatas = self.enrich(metadatas)
+                except Exception as e:
+                    # Sin enriquecimiento seguimos con los metadatos locales
+                    self.logger.warning(f"Error al enriquecer un lote de {len(lote)} libros: {e}")
+                for ruta, metadata in zip(rutas, metadatas):
+                    self._poner(cola_enriquecidos, (ruta, metadata))
+        finally:
+            self._poner(cola_enriquecidos, _FIN)
+
+    def _escribir(self, cola_enriquecidos: queue.Queue) -> None:
+        """
+        Registra los libros en lotes de hasta `write_batch_size`: toma lo que ya esté
+        en la cola y escribe en cuanto la cola se vacía, sin esperar a llenar el lote.
+        """
+        finalizados = 0
+        lote: List[Tuple[Path, Dict]] = []
+        while finalizados < self.io_workers:
+            try:
+                item = cola_enriquecidos.get_nowait() if lote else cola_enriquecidos.get()
+            except queue.Empty:
+                self._escribir_lote(lote)
+                lote = []
+                continue
+            if item is _FIN:
+                finalizados += 1
+                continue
+
+            lote.append(item)
+            if len(lote) >= self.write_batch_size:
+                self._escribir_lote(lote)
+                lote = []
+
+        if lote:
+            self._escribir_lote(lote)
+
+    def _escribir_lote(self, lote: List[Tuple[Path, Dict]]) -> None:
+        try:
+            registrados = self.write(lote)
+        except Exception as e:
+            self.logger.warning(f"❌ Error al registrar un lote de {len(lote)} libros: {e}")
+            registrados = [False] * len(lote)
+        for registrado in registrados:
+            self._contar("registrados" if registrado else "errores")
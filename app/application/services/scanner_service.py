@@ -1,9 +1,15 @@
 from pathlib import Path
-from typing import List, Dict
+from functools import partial
+from contextlib import nullcontext
+from typing import Callable, ContextManager, List, Dict, Iterable, Iterator, Optional, Tuple
+from uuid import UUID
 import logging
 import hashlib
+import os
 
-from app.domain.enums import Formato
+from app.domain.entities import ArchivoEscaneado, Libro
+from app.domain.enums import Formato, ResultadoEscaneo
+from app.domain.repositories import ArchivoEscaneadoRepository, UnitOfWork
 from app.domain.services import (
     LibroService, 
     AutorService, 
@@ -16,7 +22,27 @@ from app.application.services.metadata import (
     BookMetadataProvider,
     AuthorMetadataProvider,
     CoverProvider,
+    LocalMetadataExtractor,
+    ExtractionCache,
+    FileFingerprinter,
+    FingerprintingExtractor,
+    AsyncEnrichmentEngine,
+    EnrichmentQueue,
+    EnrichmentWorker,
+    SinResultados,
+    ProveedorNoDisponible,
 )
+from app.application.services.scan_pipeline import ScanPipeline
+from app.application.services.name_identity_map import NameIdentityMap
+
+SUPPORTED_EXTENSIONS = {".epub", ".pdf"}
+
+# Campos del libro que el enriquecimiento diferido puede completar
+CAMPOS_ENRIQUECIBLES = ["titulo", "descripcion", "paginas", "year", "isbn", "editorial"]
+
+# Prioridad en la cola de enriquecimiento: los cambios vistos por el vigilante van antes que un escaneo completo
+PRIORIDAD_ESCANEO = 0
+PRIORIDAD_VIGILANTE = 10
 
 class ScannerService:
     def __init__(
@@ -30,17 +56,52 @@ class ScannerService:
         libro_service: LibroService,
         autor_service: AutorService,
         serie_service: SerieService,
+        manifest_repo: Optional[ArchivoEscaneadoRepository] = None,
+        extraction_cache: Optional[ExtractionCache] = None,
+        enrichment_engine: Optional[AsyncEnrichmentEngine] = None,
+        workers: Optional[int] = None,
+        io_workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        enrich_batch_size: int = 50,
+        enrichment_queue: Optional[EnrichmentQueue] = None,
+        enrich_workers: int = 2,
+        enrichment_context: Optional[Callable[[], ContextManager]] = None,
+        unit_of_work: Optional[UnitOfWork] = None,
+        write_batch_size: int = 200,
     ):
         self.logger = logging.getLogger(f"[{self.__class__.__name__}]")
         self.folder_builder = folder_builder
         self.epub_extractor = epub_extractor
         self.pdf_extractor = pdf_extractor
         self.book_providers = book_providers
+        self.enrichment_engine = enrichment_engine or AsyncEnrichmentEngine(book_providers)
         self.author_provider = author_provider
         self.cover_provider = cover_provider
         self.libro_service = libro_service
         self.autor_service = autor_service
         self.serie_service = serie_service
+        self.manifest_repo = manifest_repo
+        self.local_extractor = LocalMetadataExtractor(folder_builder, epub_extractor, pdf_extractor, extraction_cache)
+        self.fingerprinter = FileFingerprinter()
+        self.workers = workers
+        self.io_workers = io_workers
+        self.queue_size = queue_size
+        self.enrich_batch_size = enrich_batch_size
+        # Con cola, los libros se registran solo con los metadatos locales y se enriquecen en segundo plano
+        self.enrichment_queue = enrichment_queue
+        self.enrichment_worker = None
+        if enrichment_queue:
+            self.enrichment_worker = EnrichmentWorker(
+                cola=enrichment_queue,
+                procesar=self.enriquecer_trabajos,
+                hilos=enrich_workers,
+                lote=enrich_batch_size,
+                contexto=enrichment_context
+            )
+        self._autores_enriquecidos = set()
+        # Cada lote de escritura se confirma en una sola transacción
+        self.unit_of_work = unit_of_work or nullcontext()
+        self.write_batch_size = write_batch_size
 
     def _determinar_formato(self, file_path: Path):
         ext = file_path.suffix.lower()
@@ -50,39 +111,128 @@ class ScannerService:
             return Formato.PDF
         return Formato.DESCONOCIDO
 
-    def _extract_content_metadata(self, file_path: Path) -> Dict:
-        if file_path.suffix.lower() == ".epub":
-            return self.epub_extractor.extract_metadata(file_path)
-        elif file_path.suffix.lower() == ".pdf":
-            return self.pdf_extractor.extract_metadata(file_path)
-        return {}
+    def _enriquecer_lote(self, lote: List[Dict]) -> List[Dict]:
+        """
+        Enriquece un lote de libros: resuelve todos sus ISBN con una consulta por proveedor
+        y busca el resto consultando a todos los proveedores a la vez.
+        """
+        pendientes = [m for m in lote if not m.get("libro_existente")]
+        externos = iter(self.enrichment_engine.buscar_lote(pendientes))
+        return [
+            metadata if metadata.get("libro_existente") else self._enrich_metadata(metadata, next(externos) or {})
+            for metadata in lote
+        ]
 
-    def _enrich_metadata(self, metadata: Dict) -> Dict:
+    def _enrich_metadata(self, metadata: Dict, enriched: Dict) -> Dict:
         isbn = metadata.get("isbn")
-        enriched = {}
-
-        for provider in self.book_providers:
-            if isbn:
-                enriched = provider.search_by_isbn(isbn)
-            if not enriched and metadata.get("titulo"):
-                enriched = provider.search_by_title(metadata["titulo"])
-            if enriched:
-                break
-
         portada_url = None
         if isbn:
             portada_url = self.cover_provider.get_cover_by_isbn(isbn)
         elif enriched.get("portada_url"):
             portada_url = enriched["portada_url"]
 
-        return {**metadata, **(enriched or {}), "portada_url": portada_url}
+        return {**metadata, **enriched, "portada_url": portada_url}
+
+    def _encolar_enriquecimiento(self, libro, metadata: Dict, prioridad: int) -> None:
+        locales = {
+            clave: valor for clave, valor in metadata.items()
+            if clave in ("titulo", "autores", "isbn", "year", "descripcion", "editorial", "paginas", "serie")
+            and isinstance(valor, (str, int, float, list))
+        }
+        autores = [
+            {"id": str(autor_id), "nombre": nombre}
+            for nombre, autor_id in zip(metadata.get("autores", []), libro.autores)
+        ]
+        try:
+            self.enrichment_queue.encolar(libro.id, {"metadata": locales, "autores": autores}, prioridad)
+            self.enrichment_worker.avisar()
+        except Exception as e:
+            self.logger.warning(f"No se pudo encolar el enriquecimiento de '{libro.titulo}': {e}")
+
+    def enriquecer_trabajos(self, trabajos: List[Dict]) -> List[Optional[Exception]]:
+        """
+        Enriquece un lote de trabajos de la cola y actualiza los libros y autores ya registrados.
+
+        Debe ejecutarse dentro del contexto de la aplicación.
+
+        Args:
+            trabajos (List[Dict]): Trabajos reclamados de la cola de enriquecimiento.
+
+        Returns:
+            List[Optional[Exception]]: None por cada trabajo aplicado o el error que impidió
+                aplicarlo; SinResultados solo si todos los proveedores respondieron sin
+                encontrar el libro, y ProveedorNoDisponible si alguno no respondió.
+        """
+        metadatas = [trabajo["datos"]["metadata"] for trabajo in trabajos]
+        externos = self.enrichment_engine.buscar_lote(metadatas)
+
+        errores = []
+        for trabajo, metadata, externo in zip(trabajos, metadatas, externos):
+            try:
+                if externo is None:
+                    raise ProveedorNoDisponible("Algún proveedor no respondió y no hay resultados")
+                if not externo:
+                    raise SinResultados("Sin resultados en los proveedores")
+                self._aplicar_enriquecimiento(trabajo["libro_id"], metadata, externo)
+                self._completar_autores(trabajo["datos"].get("autores", []))
+                errores.append(None)
+            except Exception as e:
+                errores.append(e)
+        return errores
+
+    def progreso_enriquecimiento(self) -> Dict[str, int]:
+        """
+        Resume el estado de la cola de enriquecimiento diferido.
+
+        Returns:
+            Dict[str, int]: Número de trabajos en cada estado; vacío si el enriquecimiento no es diferido.
+        """
+        return self.enrichment_worker.progreso() if self.enrichment_worker else {}
+
+    def _aplicar_enriquecimiento(self, libro_id: UUID, metadata: Dict, externo: Dict) -> None:
+        enriquecido = self._enrich_metadata(metadata, externo)
+        campos = {
+            campo: enriquecido[campo] for campo in CAMPOS_ENRIQUECIBLES
+            if enriquecido.get(campo) and enriquecido[campo] != metadata.get(campo)
+        }
+        if enriquecido.get("portada_url"):
+            campos["portada_hash"] = self._generar_hash_portada(enriquecido["portada_url"])
+
+        if campos and not self.libro_service.editar_metadata_libro(libro_id, campos):
+            raise RuntimeError(f"No se pudo actualizar el libro {libro_id}")
+        self.logger.info(f"✨ Libro enriquecido: {enriquecido.get('titulo')}")
+
+    def _completar_autores(self, autores: List[Dict]) -> None:
+        """
+        Añade la biografía a los autores que no la tienen; cada autor se consulta una vez por proceso.
+        """
+        for autor in autores:
+            autor_id = UUID(autor["id"])
+            if autor_id in self._autores_enriquecidos:
+                continue
+            self._autores_enriquecidos.add(autor_id)
+
+            if self.autor_service.obtener_por_id(autor_id).biografia:
+                continue
+            resultados = self.author_provider.search_author(autor["nombre"])
+            if not resultados or not resultados[0].get("key"):
+                continue
+            biografia = self.author_provider.get_author_details(resultados[0]["key"]).get("bio")
+            if isinstance(biografia, dict):
+                biografia = biografia.get("value")
+            if biografia:
+                self.autor_service.editar_metadata_autor(autor_id, {"biografia": biografia})
 
     def _generar_hash_portada(self, portada_url: str) -> str:
         if not portada_url:
             return "sin_portada"
         return hashlib.md5(portada_url.encode("utf-8")).hexdigest()
 
-    def _registrar_libro(self, file_path: Path, metadata: Dict):
+    def _preparar_libro(self, file_path: Path, metadata: Dict, nombres: NameIdentityMap) -> Optional[Libro]:
+        """
+        Construye la entidad de un libro nuevo con los autores y la serie ya resueltos
+        en `nombres`; se guarda después junto con el resto de su lote.
+        """
         try:
             titulo = metadata.get("titulo")
             autores_nombres = metadata.get("autores", [])
@@ -97,20 +247,14 @@ class ScannerService:
             formato = self._determinar_formato(file_path)
             portada_hash = self._generar_hash_portada(portada_url)
 
-            # 1. Registrar autores
-            autores_ids = []
-            for nombre in autores_nombres:
-                autor = self.autor_service.buscar_o_crear_por_nombre(nombre)
-                autores_ids.append(autor.id)
+            # 1. Resolver autores
+            autores_ids = list(dict.fromkeys(filter(None, map(nombres.autor_id, autores_nombres))))
 
-            # 2. Registrar serie si aplica
-            serie_id = None
-            if serie_nombre:
-                serie = self.serie_service.buscar_o_crear_por_nombre(serie_nombre)
-                serie_id = serie.id
+            # 2. Resolver serie si aplica
+            serie_id = nombres.serie_id(serie_nombre) if serie_nombre else None
 
-            # 3. Registrar libro
-            self.libro_service.registrar_libro(
+            # 3. Preparar libro
+            return self.libro_service.preparar_libro(
                 titulo=titulo,
                 autores=autores_ids,
                 path=str(file_path),
@@ -122,28 +266,493 @@ class ScannerService:
                 serie_id=serie_id,
                 descripcion=descripcion,
                 paginas=paginas,
-                year=year
+                year=year,
+                hash_parcial=metadata.get("hash_parcial"),
+                hash_contenido=metadata.get("hash_contenido")
             )
-
-            self.logger.info(f"✅ Libro registrado: {titulo}")
         except Exception as e:
             self.logger.warning(f"❌ Error al registrar libro '{file_path.name}': {e}")
+            return None
 
 
-    def escanear_directorio(self, base_path: Path):
+    def _descubrir_archivos(self, base_path: Path) -> Iterator[Path]:
         for file_path in base_path.rglob("*"):
-            if file_path.suffix.lower() not in {".epub", ".pdf"}:
+            if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+                continue
+            yield file_path
+
+    def _cargar_manifest(self) -> Dict[str, ArchivoEscaneado]:
+        if not self.manifest_repo:
+            return {}
+        return {entrada.path: entrada for entrada in self.manifest_repo.listar_todos()}
+
+    def _sin_cambios(self, entrada: ArchivoEscaneado, stat: os.stat_result) -> bool:
+        return (
+            entrada.tamano == stat.st_size
+            and entrada.mtime_ns == stat.st_mtime_ns
+            and entrada.inodo == stat.st_ino
+        )
+
+    def _descubrir_cambios(
+        self,
+        base_path: Path,
+        manifest: Dict[str, ArchivoEscaneado],
+        firmas: Dict[str, os.stat_result],
+        completo: bool = False
+    ) -> Iterator[Path]:
+        """
+        Recorre el directorio haciendo solo `stat` de cada archivo y devuelve los nuevos o modificados.
+
+        Args:
+            base_path (Path): Directorio raíz de la biblioteca.
+            manifest (Dict[str, ArchivoEscaneado]): Manifiesto del escaneo anterior, por ruta.
+            firmas (Dict[str, os.stat_result]): Se rellena con la firma de cada archivo visto.
+            completo (bool): Si es True, devuelve todos los archivos aunque no hayan cambiado.
+
+        Yields:
+            Path: Archivos que deben procesarse.
+        """
+        for file_path in self._descubrir_archivos(base_path):
+            path = str(file_path)
+            try:
+                stat = file_path.stat()
+            except OSError as e:
+                self.logger.warning(f"No se pudo leer '{file_path.name}': {e}")
+                continue
+
+            firmas[path] = stat
+            entrada = manifest.get(path)
+            if entrada and not completo and self._sin_cambios(entrada, stat):
+                continue
+
+            self.logger.info(f"📘 Escaneando: {file_path.name}")
+            yield file_path
+
+    def _cargar_indice_huellas(self) -> Dict[str, List[Dict]]:
+        indice: Dict[str, List[Dict]] = {}
+        for huella in self.libro_service.listar_huellas():
+            indice.setdefault(huella["hash_parcial"], []).append(huella)
+        return indice
+
+    def _buscar_contenido_registrado(self, file_path: Path, metadata: Dict, extractor: FingerprintingExtractor) -> Optional[Dict]:
+        """
+        Busca un libro con el mismo contenido entre los registrados durante este escaneo,
+        que los procesos de extracción no conocían.
+        """
+        existente = metadata.get("libro_existente")
+        if existente or not metadata.get("hash_parcial"):
+            return existente
+
+        candidatos = [
+            c for c in extractor.conocidos.get(metadata["hash_parcial"], [])
+            if c["path"] != str(file_path)
+        ]
+        if not candidatos:
+            return None
+        if not metadata.get("hash_contenido"):
+            metadata["hash_contenido"] = self.fingerprinter.hash_completo(file_path)
+        return extractor.identificar(metadata["hash_contenido"], candidatos)
+
+    def _repuntar_libro(self, file_path: Path, existente: Dict, metadata: Dict, extractor: FingerprintingExtractor, manifest: Dict[str, ArchivoEscaneado]) -> None:
+        """
+        Apunta un libro existente a la nueva ruta de su archivo, que se movió o renombró.
+        """
+        path = str(file_path)
+        ruta_anterior = existente["path"]
+        self.libro_service.actualizar_path(existente["id"], path)
+
+        for candidato in extractor.conocidos.get(metadata["hash_parcial"], []):
+            if candidato["id"] == existente["id"]:
+                candidato["path"] = path
+
+        # Evita que la ruta anterior se trate como un archivo eliminado
+        manifest.pop(ruta_anterior, None)
+        if self.manifest_repo:
+            self.manifest_repo.eliminar_por_path(ruta_anterior)
+        self.logger.info(f"🚚 Libro movido: {Path(ruta_anterior).name} -> {path}")
+
+    def _registrar_lote(
+        self,
+        lote: List[Tuple[Path, Dict]],
+        manifest: Dict[str, ArchivoEscaneado],
+        firmas: Dict[str, os.stat_result],
+        extractor: FingerprintingExtractor,
+        nombres: NameIdentityMap,
+        prioridad: int = PRIORIDAD_ESCANEO
+    ) -> List[bool]:
+        """
+        Registra un lote de archivos en una sola transacción. Si la transacción falla,
+        se reintenta archivo por archivo para aislar al que la hizo fallar.
+        """
+        conocidos: List[Dict] = []
+        try:
+            with self.unit_of_work:
+                registrados, nuevos, actualizados = self._registrar_cambios(lote, manifest, firmas, extractor, nombres, conocidos)
+        except Exception as e:
+            # Ni los libros ni los autores y series nuevos del lote llegaron a guardarse
+            for conocido in conocidos:
+                extractor.conocidos[conocido["hash_parcial"]].remove(conocido)
+            nombres.descartar()
+            if len(lote) == 1:
+                self.logger.warning(f"❌ Error al registrar '{lote[0][0].name}': {e}")
+                return [False]
+            self.logger.warning(f"Error al registrar un lote de {len(lote)} libros, se reintenta uno a uno: {e}")
+            return [
+                registrado
+                for item in lote
+                for registrado in self._registrar_lote([item], manifest, firmas, extractor, nombres, prioridad)
+            ]
+
+        nombres.confirmar()
+        for libro, _ in nuevos:
+            self.logger.info(f"✅ Libro registrado: {libro.titulo}")
+        for libro, _ in actualizados:
+            self.logger.info(f"🔄 Libro actualizado: {libro.titulo}")
+        if self.enrichment_queue:
+            for libro, metadata in nuevos + actualizados:
+                self._encolar_enriquecimiento(libro, metadata, prioridad)
+        return registrados
+
+    def _registrar_cambios(
+        self,
+        lote: List[Tuple[Path, Dict]],
+        manifest: Dict[str, ArchivoEscaneado],
+        firmas: Dict[str, os.stat_result],
+        extractor: FingerprintingExtractor,
+        nombres: NameIdentityMap,
+        conocidos: List[Dict]
+    ) -> Tuple[List[bool], List[Tuple[Libro, Dict]], List[Tuple[Libro, Dict]]]:
+        cambios = []
+        nuevos: List[Tuple[Libro, Dict]] = []
+        actualizados: List[Tuple[Libro, Dict]] = []
+        nombres.preparar(metadata for _, metadata in lote if not metadata.get("libro_existente"))
+        for file_path, metadata in lote:
+            path = str(file_path)
+            anterior = manifest.get(path)
+            # Libro registrado en esta ruta en el escaneo anterior
+            propio = anterior.libro_id if anterior and anterior.resultado == ResultadoEscaneo.REGISTRADO else None
+            existente = self._buscar_contenido_registrado(file_path, metadata, extractor)
+
+            if existente and (existente["id"] == propio or existente["path"] == path):
+                # Mismo contenido que ya tenía la ruta: solo cambió la fecha o el inodo
+                libro_id, resultado = existente["id"], ResultadoEscaneo.REGISTRADO
+            elif existente and os.path.exists(existente["path"]):
+                # La copia queda en el manifiesto con el libro del original, para sustituirlo si se borra
+                self.logger.info(f"♊ Copia de '{Path(existente['path']).name}' omitida: {file_path.name}")
+                libro_id, resultado = existente["id"], ResultadoEscaneo.DUPLICADO
+            elif existente:
+                self._repuntar_libro(file_path, existente, metadata, extractor, manifest)
+                libro_id, resultado = existente["id"], ResultadoEscaneo.REGISTRADO
+            else:
+                libro = self._preparar_libro(file_path, metadata, nombres)
+                if libro and propio:
+                    # El archivo modificado actualiza su libro, que conserva el ID y con él
+                    # los progresos y marcadores de los usuarios
+                    libro = libro.model_copy(update={"id": propio})
+                    if self.libro_service.actualizar_libro(libro):
+                        actualizados.append((libro, metadata))
+                        self._olvidar_huellas(extractor, propio)
+                        self._liberar_copias(propio, manifest)
+                    else:
+                        nuevos.append((libro, metadata))
+                elif libro:
+                    nuevos.append((libro, metadata))
+                libro_id = libro.id if libro else None
+                resultado = ResultadoEscaneo.REGISTRADO if libro else ResultadoEscaneo.ERROR
+                if libro and libro.hash_parcial:
+                    # Las copias posteriores del mismo lote deben reconocerlo
+                    conocido = {"id": libro.id, "path": path, "hash_parcial": libro.hash_parcial, "hash_contenido": libro.hash_contenido}
+                    extractor.conocidos.setdefault(libro.hash_parcial, []).append(conocido)
+                    conocidos.append(conocido)
+
+            # Un archivo cuyo contenido pasa a ser el de otro libro retira el que tenía
+            if resultado != ResultadoEscaneo.ERROR and propio and propio != libro_id:
+                self.libro_service.eliminar(propio)
+            cambios.append((path, libro_id, resultado))
+
+        self.libro_service.registrar_lote([libro for libro, _ in nuevos])
+        for path, libro_id, resultado in cambios:
+            self._actualizar_manifest(path, firmas.get(path), libro_id, resultado)
+        return [resultado != ResultadoEscaneo.ERROR for _, _, resultado in cambios], nuevos, actualizados
+
+    def _olvidar_huellas(self, extractor: FingerprintingExtractor, libro_id: UUID) -> None:
+        """Retira las huellas anteriores de un libro cuyo archivo cambió de contenido."""
+        for candidatos in extractor.conocidos.values():
+            candidatos[:] = [c for c in candidatos if c["id"] != libro_id]
+
+    def _liberar_copias(self, libro_id: UUID, manifest: Dict[str, ArchivoEscaneado]) -> None:
+        """
+        Quita del manifiesto las copias de un libro cuyo archivo cambió de contenido: ya
+        no son copias suyas, y el próximo escaneo las procesa como archivos nuevos.
+        """
+        if not self.manifest_repo:
+            return
+        for entrada in self.manifest_repo.listar_por_libro(libro_id):
+            if entrada.resultado == ResultadoEscaneo.DUPLICADO:
+                self.manifest_repo.eliminar_por_path(entrada.path)
+                manifest.pop(entrada.path, None)
+
+    def _buscar_copia(self, libro_id: UUID, excluidas: Iterable[str]) -> Optional[ArchivoEscaneado]:
+        """Busca en el manifiesto una copia del libro cuyo archivo siga existiendo."""
+        for entrada in self.manifest_repo.listar_por_libro(libro_id):
+            if (
+                entrada.resultado == ResultadoEscaneo.DUPLICADO
+                and entrada.path not in excluidas
+                and os.path.exists(entrada.path)
+            ):
+                return entrada
+        return None
+
+    def _actualizar_manifest(
+        self,
+        path: str,
+        stat: Optional[os.stat_result],
+        libro_id: Optional[UUID],
+        resultado: ResultadoEscaneo
+    ) -> None:
+        if not self.manifest_repo or not stat:
+            return
+        try:
+            self.manifest_repo.guardar(ArchivoEscaneado(
+                path=path,
+                tamano=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                inodo=stat.st_ino,
+                resultado=resultado,
+                libro_id=libro_id
+            ))
+        except Exception as e:
+            self.logger.warning(f"Error al actualizar el manifiesto de '{path}': {e}")
+
+    def _eliminar_rutas(self, paths: Iterable[str], manifest: Dict[str, ArchivoEscaneado]) -> None:
+        """
+        Retira del manifiesto los archivos eliminados y sus libros. Si el archivo de un
+        libro tenía una copia, el libro pasa a la copia en lugar de retirarse.
+        """
+        paths = list(paths)
+        excluidas = set(paths)
+        for path in paths:
+            entrada = manifest.get(path)
+            self.manifest_repo.eliminar_por_path(path)
+            if not entrada or not entrada.libro_id or entrada.resultado != ResultadoEscaneo.REGISTRADO:
+                self.logger.info(f"🗑️ Archivo retirado: {Path(path).name}")
                 continue
 
+            copia = self._buscar_copia(entrada.libro_id, excluidas)
+            if copia:
+                self.libro_service.actualizar_path(entrada.libro_id, copia.path)
+                copia = copia.model_copy(update={"resultado": ResultadoEscaneo.REGISTRADO})
+                self.manifest_repo.guardar(copia)
+                if copia.path in manifest:
+                    manifest[copia.path] = copia
+                self.logger.info(f"🚚 Libro movido a su copia: {Path(path).name} -> {copia.path}")
+                continue
+
+            self.libro_service.eliminar(entrada.libro_id)
+            self.logger.info(f"🗑️ Libro retirado: {Path(path).name}")
+
+    def _ejecutar_pipeline(
+        self,
+        rutas: Iterable[Path],
+        manifest: Dict[str, ArchivoEscaneado],
+        firmas: Dict[str, os.stat_result],
+        workers: Optional[int] = None,
+        prioridad: int = PRIORIDAD_ESCANEO
+    ) -> Dict[str, int]:
+        extractor = FingerprintingExtractor(self.local_extractor, self.fingerprinter, self._cargar_indice_huellas())
+        pipeline = ScanPipeline(
+            extractor=extractor,
+            # Con enriquecimiento diferido la etapa deja pasar los metadatos locales sin consultar a nadie
+            enrich=self._enriquecer_lote if self.enrichment_queue is None else (lambda lote: lote),
+            write=partial(
+                self._registrar_lote,
+                manifest=manifest,
+                firmas=firmas,
+                extractor=extractor,
+                nombres=NameIdentityMap(self.autor_service, self.serie_service),
+                prioridad=prioridad
+            ),
+            workers=workers or self.workers,
+            io_workers=self.io_workers,
+            queue_size=self.queue_size,
+            batch_size=self.enrich_batch_size,
+            write_batch_size=self.write_batch_size
+        )
+        return pipeline.run(rutas)
+
+    def escanear_directorio(
+        self,
+        base_path: Path,
+        workers: Optional[int] = None,
+        completo: bool = False
+    ) -> Dict[str, int]:
+        """
+        Escanea un directorio y registra los libros encontrados.
+
+        El descubrimiento, la extracción (en procesos), el enriquecimiento (en hilos)
+        y la escritura en base de datos se ejecutan en paralelo. Con un manifiesto
+        configurado, solo se procesan los archivos nuevos o modificados (según tamaño,
+        mtime e inodo) y se retiran los libros cuyos archivos ya no existen. Con una cola
+        de enriquecimiento, los libros se registran solo con los metadatos locales y se
+        enriquecen después en segundo plano.
+
+        Args:
+            base_path (Path): Directorio raíz de la biblioteca.
+            workers (Optional[int]): Procesos de extracción; por defecto, el valor configurado.
+            completo (bool): Si es True, reprocesa todos los archivos aunque no hayan cambiado.
+
+        Returns:
+            Dict[str, int]: Resumen del escaneo.
+        """
+        manifest = self._cargar_manifest()
+        firmas: Dict[str, os.stat_result] = {}
+
+        resumen = self._ejecutar_pipeline(self._descubrir_cambios(base_path, manifest, firmas, completo), manifest, firmas, workers)
+        resumen["sin_cambios"] = len(firmas) - resumen["descubiertos"]
+
+        eliminados = []
+        if self.manifest_repo:
+            eliminados = [
+                path for path in manifest
+                if path not in firmas and Path(path).is_relative_to(base_path) and not Path(path).exists()
+            ]
+            self._eliminar_rutas(eliminados, manifest)
+        resumen["eliminados"] = len(eliminados)
+
+        self.logger.info(f"Escaneo finalizado: {resumen}")
+        return resumen
+
+    def procesar_rutas(self, rutas: Iterable[Path], workers: Optional[int] = None) -> Dict[str, int]:
+        """
+        Extrae y registra únicamente los archivos indicados.
+
+        Args:
+            rutas (Iterable[Path]): Archivos nuevos o modificados.
+            workers (Optional[int]): Procesos de extracción; por defecto, el valor configurado.
+
+        Returns:
+            Dict[str, int]: Resumen del procesamiento.
+        """
+        manifest: Dict[str, ArchivoEscaneado] = {}
+        firmas: Dict[str, os.stat_result] = {}
+        pendientes = []
+
+        for file_path in rutas:
+            if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+                continue
+            path = str(file_path)
+            try:
+                firmas[path] = file_path.stat()
+            except OSError as e:
+                self.logger.warning(f"No se pudo leer '{file_path.name}': {e}")
+                continue
+            entrada = self.manifest_repo.obtener_por_path(path) if self.manifest_repo else None
+            if entrada:
+                manifest[path] = entrada
             self.logger.info(f"📘 Escaneando: {file_path.name}")
+            pendientes.append(file_path)
+
+        if not pendientes:
+            return {"descubiertos": 0, "registrados": 0, "errores": 0}
+        return self._ejecutar_pipeline(pendientes, manifest, firmas, workers, PRIORIDAD_VIGILANTE)
+
+    def eliminar_rutas(self, rutas: Iterable[Path]) -> int:
+        """
+        Retira los libros de los archivos o directorios eliminados.
+
+        Args:
+            rutas (Iterable[Path]): Archivos o directorios que ya no existen.
+
+        Returns:
+            int: Número de archivos retirados.
+        """
+        if not self.manifest_repo:
+            return 0
+
+        manifest: Dict[str, ArchivoEscaneado] = {}
+        for ruta in rutas:
+            entrada = self.manifest_repo.obtener_por_path(str(ruta))
+            if entrada:
+                manifest[entrada.path] = entrada
+            else:
+                manifest.update({e.path: e for e in self.manifest_repo.listar_por_prefijo(str(ruta))})
+
+        self._eliminar_rutas(list(manifest), manifest)
+        return len(manifest)
 
-            # 1. Extraer metadatos locales
-            folder_meta = self.folder_builder.build_metadata(file_path)
-            content_meta = self._extract_content_metadata(file_path)
+    def mover_ruta(self, origen: Path, destino: Path) -> bool:
+        """
+        Actualiza en el sitio la ruta de un libro cuyo archivo se movió o renombró.
 
-            # 2. Combinar y enriquecer
-            metadata = {**folder_meta, **content_meta}
-            enriched = self._enrich_metadata(metadata)
+        Args:
+            origen (Path): Ruta anterior del archivo.
+            destino (Path): Ruta nueva del archivo.
 
-            # 3. Registrar entidades
-            self._registrar_libro(file_path, enriched)
+        Returns:
+            bool: True si el archivo ya estaba registrado y se actualizó, False en caso contrario.
+        """
+        if not self.manifest_repo:
+            return False
+
+        entrada = self.manifest_repo.obtener_por_path(str(origen))
+        if not entrada or not entrada.libro_id:
+            return False
+
+        # De una copia solo se mueve su entrada: el libro sigue en el archivo original
+        if entrada.resultado == ResultadoEscaneo.REGISTRADO:
+            self.libro_service.actualizar_path(entrada.libro_id, str(destino))
+        self.manifest_repo.eliminar_por_path(entrada.path)
+        # Se conserva la firma anterior: si además cambió el contenido, el próximo escaneo lo detecta
+        self.manifest_repo.guardar(entrada.model_copy(update={"path": str(destino)}))
+        self.logger.info(f"🚚 Libro movido: {origen.name} -> {destino}")
+        return True
+
+    def mover_directorio(self, origen: Path, destino: Path) -> int:
+        """
+        Actualiza la ruta de todos los libros de un directorio movido o renombrado.
+
+        Args:
+            origen (Path): Ruta anterior del directorio.
+            destino (Path): Ruta nueva del directorio.
+
+        Returns:
+            int: Número de libros actualizados.
+        """
+        if not self.manifest_repo:
+            return 0
+
+        movidos = 0
+        for entrada in self.manifest_repo.listar_por_prefijo(str(origen)):
+            path = Path(entrada.path)
+            movidos += self.mover_ruta(path, destino / path.relative_to(origen))
+        return movidos
+
+    def vigilar_directorio(
+        self,
+        base_path: Path,
+        debounce: float = 2.0,
+        intervalo_sondeo: float = 5.0
+    ) -> None:
+        """
+        Observa un directorio de forma continua e ingesta los cambios a medida que ocurren.
+
+        Bloquea hasta que el proceso se interrumpa. Debe ejecutarse dentro del contexto de la aplicación.
+
+        Args:
+            base_path (Path): Directorio raíz de la biblioteca.
+            debounce (float): Segundos sin eventos tras los que se procesa una ráfaga.
+            intervalo_sondeo (float): Segundos entre instantáneas si no hay inotify.
+        """
+        from app.application.services.watcher import LibraryWatcher
+
+        watcher = LibraryWatcher(
+            scanner=self,
+            base_path=base_path,
+            extensiones=SUPPORTED_EXTENSIONS,
+            debounce=debounce,
+            intervalo_sondeo=intervalo_sondeo
+        )
+        try:
+            watcher.vigilar()
+        except KeyboardInterrupt:
+            watcher.detener()
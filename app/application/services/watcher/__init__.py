@@ -0,0 +1,14 @@
+from app.application.services.watcher.evento_archivo import EventoArchivo, TipoEvento
+from app.application.services.watcher.watch_backend import WatchBackend
+from app.application.services.watcher.inotify_backend import InotifyBackend
+from app.application.services.watcher.polling_backend import PollingBackend
+from app.application.services.watcher.library_watcher import LibraryWatcher
+
+__all__ = [
+    "EventoArchivo",
+    "TipoEvento",
+    "WatchBackend",
+    "InotifyBackend",
+    "PollingBackend",
+    "LibraryWatcher",
+]
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from enum import Enum
+
+class TipoEvento(Enum):
+    CREADO = "creado"
+    MODIFICADO = "modificado"
+    ELIMINADO = "eliminado"
+    MOVIDO = "movido"
+    DESBORDADO = "desbordado"
+
+@dataclass(frozen=True)
+class EventoArchivo:
+    """Cambio observado en el árbol de la biblioteca."""
+    tipo: TipoEvento
+    path: Path
+    destino: Optional[Path] = None
+    es_directorio: bool = False
@@ -0,0 +1,175 @@
+from pathlib import Path
+from typing import Dict, List, Tuple
+import ctypes.util
+import logging
+import ctypes
+import select
+import struct
+import os
+
+from app.application.services.watcher.evento_archivo import EventoArchivo, TipoEvento
+from app.application.services.watcher.watch_backend import WatchBackend
+
+# Constantes de <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+_EVENTO = struct.Struct("iIII")
+_TAMANO_BUFFER = 64 * 1024
+
+
+class InotifyBackend(WatchBackend):
+    """
+    Observa el árbol de la biblioteca con inotify (Linux) a través de ctypes.
+
+    Los pares IN_MOVED_FROM/IN_MOVED_TO se combinan por cookie en un único evento
+    de movimiento; un IN_MOVED_FROM sin pareja en la lectura siguiente se considera
+    una salida del árbol y se notifica como eliminación.
+    """
+    MASCARA = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    def __init__(self, base_path: Path):
+        """
+        Args:
+            base_path (Path): Directorio raíz a observar recursivamente.
+
+        Raises:
+            OSError: Si inotify no está disponible en el sistema.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.base_path = base_path
+        self._libc = self._cargar_libc()
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1: {os.strerror(errno)}")
+
+        self._watches: Dict[int, Path] = {}
+        self._movimientos: Dict[int, Tuple[Path, bool]] = {}
+        self._vigilar_arbol(base_path)
+
+    def _cargar_libc(self) -> ctypes.CDLL:
+        nombre = ctypes.util.find_library("c")
+        if not nombre:
+            raise OSError("No se encontró la biblioteca C")
+        libc = ctypes.CDLL(nombre, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("La biblioteca C no implementa inotify")
+        return libc
+
+    def _vigilar(self, directorio: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directorio), self.MASCARA)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            self.logger.warning(f"No se pudo vigilar '{directorio}': {os.strerror(errno)}")
+            return
+        self._watches[wd] = directorio
+
+    def _vigilar_arbol(self, directorio: Path) -> List[Path]:
+        """
+        Vigila un directorio y sus subdirectorios.
+
+        Returns:
+            List[Path]: Archivos ya presentes en el árbol, que pudieron escribirse antes de vigilarlo.
+        """
+        archivos = []
+        self._vigilar(directorio)
+        for raiz, carpetas, nombres in os.walk(directorio):
+            for carpeta in carpetas:
+                self._vigilar(Path(raiz) / carpeta)
+            archivos += [Path(raiz) / nombre for nombre in nombres]
+        return archivos
+
+    def _renombrar_watches(self, origen: Path, destino: Path) -> None:
+        for wd, directorio in list(self._watches.items()):
+            if directorio == origen or directorio.is_relative_to(origen):
+                self._watches[wd] = destino / directorio.relative_to(origen)
+
+    def _olvidar_watches(self, origen: Path) -> None:
+        for wd, directorio in list(self._watches.items()):
+            if directorio == origen or directorio.is_relative_to(origen):
+                self._libc.inotify_rm_watch(self._fd, wd)
+                self._watches.pop(wd, None)
+
+    def leer_eventos(self, timeout: float) -> List[EventoArchivo]:
+        eventos = []
+        previos = set(self._movimientos)
+
+        listos, _, _ = select.select([self._fd], [], [], timeout)
+        if listos:
+            try:
+                datos = os.read(self._fd, _TAMANO_BUFFER)
+            except BlockingIOError:
+                datos = b""
+
+            offset = 0
+            while offset < len(datos):
+                wd, mascara, cookie, longitud = _EVENTO.unpack_from(datos, offset)
+                offset += _EVENTO.size
+                nombre = os.fsdecode(datos[offset:offset + longitud].rstrip(b"\0"))
+                offset += longitud
+                eventos += self._traducir(wd, mascara, cookie, nombre)
+
+        # Movimientos que siguen sin pareja tras una lectura completa: salieron del árbol
+        for cookie in previos & set(self._movimientos):
+            origen, es_directorio = self._movimientos.pop(cookie)
+            if es_directorio:
+                self._olvidar_watches(origen)
+            eventos.append(EventoArchivo(TipoEvento.ELIMINADO, origen, es_directorio=es_directorio))
+
+        return eventos
+
+    def _traducir(self, wd: int, mascara: int, cookie: int, nombre: str) -> List[EventoArchivo]:
+        if mascara & IN_Q_OVERFLOW:
+            self.logger.warning("Desbordamiento de la cola de inotify; se requiere un escaneo completo")
+            return [EventoArchivo(TipoEvento.DESBORDADO, self.base_path)]
+
+        if mascara & IN_IGNORED:
+            self._watches.pop(wd, None)
+            return []
+
+        directorio = self._watches.get(wd)
+        if directorio is None:
+            return []
+
+        path = directorio / nombre
+        es_directorio = bool(mascara & IN_ISDIR)
+
+        if mascara & IN_MOVED_FROM:
+            self._movimientos[cookie] = (path, es_directorio)
+            return []
+
+        if mascara & IN_MOVED_TO:
+            origen = self._movimientos.pop(cookie, None)
+            if origen:
+                if es_directorio:
+                    self._renombrar_watches(origen[0], path)
+                return [EventoArchivo(TipoEvento.MOVIDO, origen[0], destino=path, es_directorio=es_directorio)]
+            if es_directorio:
+                return [EventoArchivo(TipoEvento.CREADO, archivo) for archivo in self._vigilar_arbol(path)]
+            return [EventoArchivo(TipoEvento.CREADO, path)]
+
+        if mascara & IN_CREATE:
+            if es_directorio:
+                return [EventoArchivo(TipoEvento.CREADO, archivo) for archivo in self._vigilar_arbol(path)]
+            # Los archivos se notifican al cerrarse tras la escritura
+            return []
+
+        if mascara & IN_CLOSE_WRITE:
+            return [EventoArchivo(TipoEvento.MODIFICADO, path)]
+
+        if mascara & IN_DELETE:
+            return [EventoArchivo(TipoEvento.ELIMINADO, path, es_directorio=es_directorio)]
+
+        return []
+
+    def cerrar(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
@@ -0,0 +1,175 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+import threading
+import logging
+import time
+
+from app.application.services.watcher.evento_archivo import EventoArchivo, TipoEvento
+from app.application.services.watcher.watch_backend import WatchBackend
+from app.application.services.watcher.inotify_backend import InotifyBackend
+from app.application.services.watcher.polling_backend import PollingBackend
+
+if TYPE_CHECKING:
+    from app.application.services.scanner_service import ScannerService
+
+
+class LoteEventos:
+    """Eventos acumulados durante una ráfaga, ya combinados por ruta."""
+    def __init__(self, extensiones: Iterable[str]):
+        self.extensiones = set(extensiones)
+        self.cambiados: Dict[Path, None] = {}
+        self.eliminados: Set[Path] = set()
+        self.movimientos: List[Tuple[Path, Path, bool]] = []
+        self.desbordado = False
+
+    def __bool__(self) -> bool:
+        return bool(self.cambiados or self.eliminados or self.movimientos or self.desbordado)
+
+    def _soportado(self, path: Path) -> bool:
+        return path.suffix.lower() in self.extensiones
+
+    def agregar(self, evento: EventoArchivo) -> None:
+        if evento.tipo == TipoEvento.DESBORDADO:
+            self.desbordado = True
+        elif evento.tipo in (TipoEvento.CREADO, TipoEvento.MODIFICADO):
+            if self._soportado(evento.path):
+                self.eliminados.discard(evento.path)
+                self.cambiados[evento.path] = None
+        elif evento.tipo == TipoEvento.ELIMINADO:
+            if evento.es_directorio or self._soportado(evento.path):
+                self.cambiados.pop(evento.path, None)
+                self.eliminados.add(evento.path)
+        elif evento.tipo == TipoEvento.MOVIDO:
+            self._agregar_movimiento(evento.path, evento.destino, evento.es_directorio)
+
+    def _agregar_movimiento(self, origen: Path, destino: Path, es_directorio: bool) -> None:
+        if es_directorio:
+            # Los cambios pendientes dentro del directorio siguen al directorio
+            for path in [p for p in self.cambiados if p.is_relative_to(origen)]:
+                del self.cambiados[path]
+                self.cambiados[destino / path.relative_to(origen)] = None
+            self.movimientos.append((origen, destino, True))
+            return
+
+        if not self._soportado(destino):
+            # Renombrado a una extensión ignorada, p. ej. «libro.epub» -> «libro.epub.bak»
+            self.agregar(EventoArchivo(TipoEvento.ELIMINADO, origen))
+            return
+
+        if not self._soportado(origen):
+            # Descarga completada, p. ej. «libro.epub.part» -> «libro.epub»
+            self.agregar(EventoArchivo(TipoEvento.CREADO, destino))
+            return
+
+        if origen in self.cambiados:
+            # El archivo cambió antes de moverse: se procesa en su ruta nueva
+            del self.cambiados[origen]
+            self.cambiados[destino] = None
+        self.eliminados.discard(destino)
+        self.movimientos.append((origen, destino, False))
+
+
+class LibraryWatcher:
+    """
+    Ingesta continua de la biblioteca: observa el árbol de carpetas y pasa por el
+    escáner solo las rutas afectadas, agrupando las ráfagas de eventos.
+
+    Usa inotify si el sistema lo permite y, si no, instantáneas periódicas. Las
+    llamadas al escáner acceden a la base de datos, por lo que `vigilar` debe
+    ejecutarse dentro del contexto de la aplicación.
+    """
+    def __init__(
+        self,
+        scanner: "ScannerService",
+        base_path: Path,
+        extensiones: Iterable[str],
+        debounce: float = 2.0,
+        max_espera: float = 30.0,
+        intervalo_sondeo: float = 5.0,
+        escaneo_inicial: bool = True,
+        backend: Optional[WatchBackend] = None,
+    ):
+        """
+        Args:
+            scanner (ScannerService): Escáner que procesa las rutas afectadas.
+            base_path (Path): Directorio raíz de la biblioteca.
+            extensiones (Iterable[str]): Extensiones de libro soportadas.
+            debounce (float): Segundos sin eventos tras los que se procesa una ráfaga.
+            max_espera (float): Segundos máximos que una ráfaga continua puede retrasar el procesamiento.
+            intervalo_sondeo (float): Segundos entre instantáneas si no hay inotify.
+            escaneo_inicial (bool): Si es True, sincroniza los cambios ocurridos antes de empezar a observar.
+            backend (Optional[WatchBackend]): Fuente de eventos; por defecto se elige según el sistema.
+        """
+        self.logger = logging.getLogger(f"[{self.__class__.__name__}]")
+        self.scanner = scanner
+        self.base_path = base_path
+        self.extensiones = set(extensiones)
+        self.debounce = debounce
+        self.max_espera = max_espera
+        self.intervalo_sondeo = intervalo_sondeo
+        self.escaneo_inicial = escaneo_inicial
+        self.backend = backend
+        self._detener = threading.Event()
+
+    def _crear_backend(self) -> WatchBackend:
+        try:
+            backend = InotifyBackend(self.base_path)
+            self.logger.info("Observando la biblioteca con inotify")
+            return backend
+        except OSError as e:
+            self.logger.info(f"inotify no disponible ({e}); se usará sondeo cada {self.intervalo_sondeo}s")
+            return PollingBackend(self.base_path, self.extensiones, self.intervalo_sondeo)
+
+    def detener(self) -> None:
+        """Solicita la finalización de `vigilar` tras el ciclo en curso."""
+        self._detener.set()
+
+    def vigilar(self) -> None:
+        """
+        Observa la biblioteca hasta que se invoque `detener`.
+        """
+        self._detener.clear()
+        backend = self.backend or self._crear_backend()
+        if self.escaneo_inicial:
+            self.scanner.escanear_directorio(self.base_path)
+
+        lote = LoteEventos(self.extensiones)
+        primer_evento = ultimo_evento = 0.0
+        try:
+            while not self._detener.is_set():
+                eventos = backend.leer_eventos(timeout=min(self.debounce, 1.0))
+                ahora = time.monotonic()
+                if eventos:
+                    if not lote:
+                        primer_evento = ahora
+                    ultimo_evento = ahora
+                    for evento in eventos:
+                        lote.agregar(evento)
+
+                if lote and (ahora - ultimo_evento >= self.debounce or ahora - primer_evento >= self.max_espera):
+                    self._procesar(lote)
+                    lote = LoteEventos(self.extensiones)
+        finally:
+            backend.cerrar()
+
+    def _procesar(self, lote: LoteEventos) -> None:
+        try:
+            if lote.desbordado:
+                self.scanner.escanear_directorio(self.base_path)
+                return
+
+            for origen, destino, es_directorio in lote.movimientos:
+                if es_directorio:
+                    self.scanner.mover_directorio(origen, destino)
+                elif not self.scanner.mover_ruta(origen, destino):
+                    # Origen desconocido: se registra como archivo nuevo
+                    lote.cambiados[destino] = None
+
+            if lote.eliminados:
+                self.scanner.eliminar_rutas(lote.eliminados)
+
+            rutas = [path for path in lote.cambiados if path.exists()]
+            if rutas:
+                self.scanner.procesar_rutas(rutas)
+        except Exception as e:
+            self.logger.exception(f"Error al procesar cambios de la biblioteca: {e}")
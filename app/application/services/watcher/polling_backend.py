@@ -0,0 +1,85 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+import logging
+import time
+import os
+
+from app.application.services.watcher.evento_archivo import EventoArchivo, TipoEvento
+from app.application.services.watcher.watch_backend import WatchBackend
+
+# (inodo, tamaño, mtime_ns)
+Firma = Tuple[int, int, int]
+
+
+class PollingBackend(WatchBackend):
+    """
+    Detecta cambios comparando instantáneas periódicas del árbol de la biblioteca.
+
+    Un archivo que desaparece y otro que aparece con el mismo inodo y tamaño se
+    notifican como un movimiento.
+    """
+    def __init__(self, base_path: Path, extensiones: Iterable[str], intervalo: float = 5.0):
+        """
+        Args:
+            base_path (Path): Directorio raíz a observar.
+            extensiones (Iterable[str]): Extensiones de archivo a tener en cuenta (en minúsculas).
+            intervalo (float): Segundos entre instantáneas.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.base_path = base_path
+        self.extensiones = set(extensiones)
+        self.intervalo = intervalo
+        self._snapshot = self._tomar_snapshot()
+        self._proximo_sondeo = time.monotonic() + intervalo
+
+    def _tomar_snapshot(self) -> Dict[Path, Firma]:
+        snapshot = {}
+        for raiz, _, nombres in os.walk(self.base_path):
+            for nombre in nombres:
+                path = Path(raiz) / nombre
+                if path.suffix.lower() not in self.extensiones:
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def leer_eventos(self, timeout: float) -> List[EventoArchivo]:
+        espera = self._proximo_sondeo - time.monotonic()
+        if espera > timeout:
+            time.sleep(timeout)
+            return []
+        if espera > 0:
+            time.sleep(espera)
+
+        self._proximo_sondeo = time.monotonic() + self.intervalo
+        nuevo = self._tomar_snapshot()
+        eventos = self._comparar(self._snapshot, nuevo)
+        self._snapshot = nuevo
+        return eventos
+
+    def _comparar(self, anterior: Dict[Path, Firma], nuevo: Dict[Path, Firma]) -> List[EventoArchivo]:
+        eventos = []
+        desaparecidos = {
+            (firma[0], firma[1]): path
+            for path, firma in anterior.items() if path not in nuevo
+        }
+
+        for path, firma in nuevo.items():
+            previa = anterior.get(path)
+            if previa is None:
+                origen = desaparecidos.pop((firma[0], firma[1]), None)
+                if origen:
+                    eventos.append(EventoArchivo(TipoEvento.MOVIDO, origen, destino=path))
+                else:
+                    eventos.append(EventoArchivo(TipoEvento.CREADO, path))
+            elif previa != firma:
+                eventos.append(EventoArchivo(TipoEvento.MODIFICADO, path))
+
+        eventos += [EventoArchivo(TipoEvento.ELIMINADO, path) for path in desaparecidos.values()]
+        return eventos
+
+    def cerrar(self) -> None:
+        self._snapshot = {}
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from app.application.services.watcher.evento_archivo import EventoArchivo
+
+class WatchBackend(ABC):
+    @abstractmethod
+    def leer_eventos(self, timeout: float) -> List[EventoArchivo]:
+        """
+        Espera como mucho `timeout` segundos y devuelve los eventos ocurridos.
+
+        Args:
+            timeout (float): Tiempo máximo de espera en segundos.
+
+        Returns:
+            List[EventoArchivo]: Eventos observados, posiblemente vacía.
+        """
+        pass
+
+    @abstractmethod
+    def cerrar(self) -> None:
+        """Libera los recursos del sistema operativo."""
+        pass
@@ -19,6 +19,19 @@ def str_to_bool(value):
     """
     return value.lower() in ['true', '1', 'yes']
 
+# Función para convertir una cadena 'clave=valor,clave=valor' a un diccionario
+def str_to_float_dict(value):
+    """Convierte una cadena de pares 'clave=valor' separados por comas a un diccionario.
+    
+    Args:
+        value (str): La cadena a convertir, p. ej. 'openlibrary.org=3,www.googleapis.com=10'.
+    
+    Return:
+        dict: Diccionario con los valores convertidos a float.
+    """
+    pares = [par.split('=', 1) for par in value.split(',') if '=' in par]
+    return {clave.strip(): float(valor) for clave, valor in pares}
+
 class AppConfig:
     """Configuración de la aplicación. Esta clase recolecta y almacena las variables de entorno."""
     
@@ -56,6 +69,67 @@ class AppConfig:
     MAIL_DEFAULT_SENDER = (os.environ.get('APP_NAME'), os.environ.get('MAIL_USERNAME'))
     MAIL_DEBUG = int(os.environ.get('MAIL_DEBUG', 0))
 
+    # Escáner de biblioteca (0 = valor por defecto según núcleos)
+    SCANNER_WORKERS = int(os.getenv('SCANNER_WORKERS', 0)) or None
+    SCANNER_IO_WORKERS = int(os.getenv('SCANNER_IO_WORKERS', 0)) or None
+    SCANNER_QUEUE_SIZE = int(os.getenv('SCANNER_QUEUE_SIZE', 0)) or None
+    SCANNER_ENRICH_BATCH = int(os.getenv('SCANNER_ENRICH_BATCH', 50))
+    SCANNER_WRITE_BATCH = int(os.getenv('SCANNER_WRITE_BATCH', 200))
+
+    # Enriquecimiento: 'primero' (primera respuesta válida) o 'prioridad' (combina todas)
+    ENRICH_STRATEGY = os.getenv('ENRICH_STRATEGY', 'primero')
+    ENRICH_DEADLINE = float(os.getenv('ENRICH_DEADLINE', 10))
+    ENRICH_CONCURRENCY = int(os.getenv('ENRICH_CONCURRENCY', 16))
+
+    # Enriquecimiento diferido: registrar con metadatos locales y enriquecer en segundo plano
+    ENRICH_DEFERRED = str_to_bool(os.getenv('ENRICH_DEFERRED', 'False'))
+    ENRICH_QUEUE_PATH = os.getenv('ENRICH_QUEUE_PATH', os.path.join(BASE_DIR, 'enrichment_queue.db'))
+    ENRICH_WORKERS = int(os.getenv('ENRICH_WORKERS', 2))
+    ENRICH_MAX_RETRIES = int(os.getenv('ENRICH_MAX_RETRIES', 5))
+    ENRICH_RETRY_DELAY = float(os.getenv('ENRICH_RETRY_DELAY', 30))
+    # Segundos que un trabajo reclamado queda reservado a su worker antes de que otro pueda retomarlo
+    ENRICH_LEASE = float(os.getenv('ENRICH_LEASE', 600))
+
+    # Buffer de progresos de lectura: segundos entre volcados (0 = guardar cada progreso al momento)
+    PROGRESS_FLUSH_INTERVAL = float(os.getenv('PROGRESS_FLUSH_INTERVAL', 5))
+    PROGRESS_BUFFER_MAX = int(os.getenv('PROGRESS_BUFFER_MAX', 1000))
+
+    # Caché de entidades por ID en los servicios (TTL en segundos; 0 = desactivada).
+    # Con una URL de Redis la comparten todos los workers; si no, cada proceso tiene la suya
+    # y no ve las escrituras de los demás, por lo que solo se activa si se pide un TTL
+    ENTITY_CACHE_REDIS_URL = os.getenv('ENTITY_CACHE_REDIS_URL', '')
+    ENTITY_CACHE_TTL = float(os.getenv('ENTITY_CACHE_TTL', 300 if ENTITY_CACHE_REDIS_URL else 0))
+    ENTITY_CACHE_MAX_ENTRIES = int(os.getenv('ENTITY_CACHE_MAX_ENTRIES', 10000))
+
+    # Extracción de PDF (presupuesto por archivo en modo lazy; 0 = sin límite)
+    PDF_LAZY = str_to_bool(os.getenv('PDF_LAZY', 'True'))
+    PDF_MAX_BYTES = int(os.getenv('PDF_MAX_BYTES', 16 * 1024 * 1024)) or None
+    PDF_TIMEOUT = float(os.getenv('PDF_TIMEOUT', 10)) or None
+
+    # Caché de extracción en disco (ruta vacía = desactivada)
+    EXTRACTION_CACHE_PATH = os.getenv('EXTRACTION_CACHE_PATH', os.path.join(BASE_DIR, 'extraction_cache.db'))
+    EXTRACTION_CACHE_MAX_MB = int(os.getenv('EXTRACTION_CACHE_MAX_MB', 512))
+
+    # Cliente HTTP de los proveedores de metadatos
+    HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', 5))
+    HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', 15))
+    HTTP_RETRIES = int(os.getenv('HTTP_RETRIES', 3))
+    HTTP_BACKOFF = float(os.getenv('HTTP_BACKOFF', 0.5))
+    HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', 16))
+
+    # Límite de peticiones por host (peticiones/segundo; 0 = sin límite) y circuit breaker
+    HTTP_RATE_LIMIT = float(os.getenv('HTTP_RATE_LIMIT', 5)) or None
+    HTTP_RATE_LIMITS = str_to_float_dict(os.getenv('HTTP_RATE_LIMITS', ''))
+    HTTP_RATE_BURST = int(os.getenv('HTTP_RATE_BURST', 0)) or None
+    HTTP_BREAKER_THRESHOLD = float(os.getenv('HTTP_BREAKER_THRESHOLD', 0.5))
+    HTTP_BREAKER_COOLDOWN = float(os.getenv('HTTP_BREAKER_COOLDOWN', 60))
+
+    # Caché de respuestas HTTP en disco (ruta vacía = desactivada; TTL en horas)
+    HTTP_CACHE_PATH = os.getenv('HTTP_CACHE_PATH', os.path.join(BASE_DIR, 'http_cache.db'))
+    HTTP_CACHE_TTL_ACIERTO = float(os.getenv('HTTP_CACHE_TTL_ACIERTO', 30 * 24))
+    HTTP_CACHE_TTL_FALLO = float(os.getenv('HTTP_CACHE_TTL_FALLO', 24))
+    HTTP_CACHE_MAX_ENTRADAS = int(os.getenv('HTTP_CACHE_MAX_ENTRADAS', 50000)) or None
+
     # BDD (en caso de usar un servidor)
     DB_HOST = os.environ.get('DB_HOST')
     DB_USER = os.environ.get('DB_USER')
@@ -63,10 +137,31 @@ class AppConfig:
     DB_NAME = os.environ.get('DB_NAME')
     DB_PORT = os.environ.get('DB_PORT')
 
+    # Motor de base de datos: 'sqlite', 'postgresql' o 'mariadb'
+    DB_BACKEND = os.getenv('DB_BACKEND', 'sqlite').lower()
+
+    # Pool de conexiones de PostgreSQL y MariaDB (reciclado en segundos; filas por lote de executemany)
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 20))
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 1800))
+    DB_POOL_PRE_PING = str_to_bool(os.getenv('DB_POOL_PRE_PING', 'True'))
+    DB_EXECUTEMANY_PAGE_SIZE = int(os.getenv('DB_EXECUTEMANY_PAGE_SIZE', 1000))
+
     # BDD SQLite
     SQLALCHEMY_DATABASE_URI = os.environ.get('SQLALCHEMY_DATABASE_URI')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Perfil de SQLite (solo con bases de datos en archivo)
+    SQLITE_WAL = str_to_bool(os.getenv('SQLITE_WAL', 'True'))
+    SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+    SQLITE_CACHE_MB = int(os.getenv('SQLITE_CACHE_MB', 64))
+    SQLITE_MMAP_MB = int(os.getenv('SQLITE_MMAP_MB', 256))
+    SQLITE_TEMP_STORE = os.getenv('SQLITE_TEMP_STORE', 'MEMORY')
+    SQLITE_BUSY_TIMEOUT = float(os.getenv('SQLITE_BUSY_TIMEOUT', 30))
+    SQLITE_READ_POOL = int(os.getenv('SQLITE_READ_POOL', 8))
+    SQLITE_SINGLE_WRITER = str_to_bool(os.getenv('SQLITE_SINGLE_WRITER', 'True'))
+
     def get_db_config(self) -> dict:
         """Retorna un diccionario con la configuración de la base de datos de CERCAPP.
         
@@ -102,4 +197,18 @@ class AppConfig:
         Return:
             str: URL de conexión a la base de datos PostgreSQL.
         """
-        return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
\ No newline at end of file
+        return f"postgresql+psycopg2://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
+
+    def get_database_url(self) -> str:
+        """Retorna la URL de conexión del motor elegido en DB_BACKEND.
+        
+        Return:
+            str: URL de conexión a la base de datos.
+        """
+        if self.DB_BACKEND == 'postgresql':
+            return self.get_postgresql_url()
+        if self.DB_BACKEND in ('mariadb', 'mysql'):
+            return self.get_maria_db_url()
+        if self.DB_BACKEND != 'sqlite':
+            raise ValueError(f"DB_BACKEND no válido: {self.DB_BACKEND}. Opciones: sqlite, postgresql, mariadb")
+        return self.SQLALCHEMY_DATABASE_URI or self.get_sqlite_url()
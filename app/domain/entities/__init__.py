@@ -4,6 +4,8 @@ from app.domain.entities.marcador import Marcador
 from app.domain.entities.progreso import Progreso
 from app.domain.entities.serie import Serie
 from app.domain.entities.usuario import Usuario
+from app.domain.entities.archivo_escaneado import ArchivoEscaneado
+from app.domain.entities.resultado_busqueda import ResultadoBusqueda
 
 __all__ = [
     "Autor",
@@ -12,4 +14,6 @@ __all__ = [
     "Progreso",
     "Serie",
     "Usuario",
+    "ArchivoEscaneado",
+    "ResultadoBusqueda",
 ]
\ No newline at end of file
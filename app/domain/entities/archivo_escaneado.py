@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from uuid import UUID
+from datetime import datetime
+
+from app.domain.enums import ResultadoEscaneo
+
+class ArchivoEscaneado(BaseModel):
+    path: str
+    tamano: int
+    mtime_ns: int
+    inodo: int
+    resultado: ResultadoEscaneo
+    libro_id: Optional[UUID] = None
+    fecha_escaneo: datetime = Field(default_factory=datetime.utcnow)
@@ -17,4 +17,6 @@ class Libro(BaseModel):
     serie_id: Optional[UUID] = None
     descripcion: Optional[str] = None
     paginas: Optional[int] = None
-    year: Optional[int] = None
\ No newline at end of file
+    year: Optional[int] = None
+    hash_parcial: Optional[str] = None
+    hash_contenido: Optional[str] = None
\ No newline at end of file
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from uuid import UUID
+
+from app.domain.enums import TipoResultado
+
+class ResultadoBusqueda(BaseModel):
+    tipo: TipoResultado
+    id: UUID
+    titulo: str
+    relevancia: float
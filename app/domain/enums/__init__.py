@@ -1,9 +1,13 @@
 from app.domain.enums.formats_enum import Formato
 from app.domain.enums.estatus_enum import Estatus
 from app.domain.enums.rol_enums import Rol
+from app.domain.enums.resultado_escaneo_enum import ResultadoEscaneo
+from app.domain.enums.tipo_resultado_enum import TipoResultado
 
 __all__ = [
     "Formato",
     "Estatus",
     "Rol",
+    "ResultadoEscaneo",
+    "TipoResultado",
 ]
\ No newline at end of file
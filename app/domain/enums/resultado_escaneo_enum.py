@@ -0,0 +1,6 @@
+from enum import Enum
+
+class ResultadoEscaneo(Enum):
+    REGISTRADO = "registrado"
+    DUPLICADO = "duplicado"
+    ERROR = "error"
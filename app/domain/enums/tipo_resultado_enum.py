@@ -0,0 +1,6 @@
+from enum import Enum
+
+class TipoResultado(Enum):
+    LIBRO = "libro"
+    AUTOR = "autor"
+    SERIE = "serie"
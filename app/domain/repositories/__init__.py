@@ -4,6 +4,9 @@ from app.domain.repositories.serie_repository import SerieRepository
 from app.domain.repositories.usuario_repository import UsuarioRepository
 from app.domain.repositories.marcador_repository import MarcadorRepository
 from app.domain.repositories.progreso_repository import ProgresoRepository
+from app.domain.repositories.archivo_escaneado_repository import ArchivoEscaneadoRepository
+from app.domain.repositories.busqueda_repository import BusquedaRepository
+from app.domain.repositories.unit_of_work import UnitOfWork
 
 __all__ = [
     "AutorRepository",
@@ -12,4 +15,7 @@ __all__ = [
     "UsuarioRepository",
     "MarcadorRepository",
     "ProgresoRepository",
+    "ArchivoEscaneadoRepository",
+    "BusquedaRepository",
+    "UnitOfWork",
 ]
\ No newline at end of file
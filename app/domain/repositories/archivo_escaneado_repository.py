@@ -0,0 +1,24 @@
+from typing import List, Optional
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from app.domain.entities import ArchivoEscaneado
+
+class ArchivoEscaneadoRepository(ABC):
+    @abstractmethod
+    def guardar(self, archivo: ArchivoEscaneado) -> None: pass
+
+    @abstractmethod
+    def obtener_por_path(self, path: str) -> Optional[ArchivoEscaneado]: pass
+
+    @abstractmethod
+    def eliminar_por_path(self, path: str) -> None: pass
+
+    @abstractmethod
+    def listar_por_prefijo(self, prefijo: str) -> List[ArchivoEscaneado]: pass
+
+    @abstractmethod
+    def listar_por_libro(self, libro_id: UUID) -> List[ArchivoEscaneado]: pass
+
+    @abstractmethod
+    def listar_todos(self) -> List[ArchivoEscaneado]: pass
@@ -1,21 +1,36 @@
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from abc import ABC, abstractmethod
 from uuid import UUID
 
-from domain.entities import Autor
+from app.domain.entities import Autor
 
 class AutorRepository(ABC):
     @abstractmethod
     def guardar(self, autor: Autor) -> None: pass
 
+    @abstractmethod
+    def guardar_lote(self, autores: List[Autor]) -> None: pass
+
     @abstractmethod
     def obtener_por_id(self, id: UUID) -> Optional[Autor]: pass
 
     @abstractmethod
     def buscar_por_nombre(self, nombre: str) -> List[Autor]: pass
 
+    @abstractmethod
+    def listar_nombres(self) -> List[Dict]: pass
+
+    @abstractmethod
+    def actualizar_campos(self, id: UUID, campos: Dict) -> bool: pass
+
     @abstractmethod
     def eliminar(self, id: UUID) -> None: pass
 
     @abstractmethod
-    def listar_todos(self) -> List[Autor]: pass
\ No newline at end of file
+    def listar_todos(self) -> List[Autor]: pass
+
+    @abstractmethod
+    def listar_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Autor]: pass
+
+    @abstractmethod
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Autor]: pass
@@ -0,0 +1,12 @@
+from typing import List, Optional
+from abc import ABC, abstractmethod
+
+from app.domain.entities import ResultadoBusqueda
+from app.domain.enums import TipoResultado
+
+class BusquedaRepository(ABC):
+    @abstractmethod
+    def buscar(self, consulta: str, tipos: Optional[List[TipoResultado]] = None, limite: int = 20) -> List[ResultadoBusqueda]: pass
+
+    @abstractmethod
+    def reconstruir(self) -> None: pass
@@ -1,13 +1,19 @@
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from abc import ABC, abstractmethod
 from uuid import UUID
 
-from domain.entities import Libro
+from app.domain.entities import Libro
 
 class LibroRepository(ABC):
     @abstractmethod
     def guardar(self, libro: Libro) -> None: pass
 
+    @abstractmethod
+    def guardar_lote(self, libros: List[Libro]) -> None: pass
+
+    @abstractmethod
+    def actualizar(self, libro: Libro) -> bool: pass
+
     @abstractmethod
     def obtener_por_id(self, id: UUID) -> Optional[Libro]: pass
 
@@ -17,8 +23,26 @@ class LibroRepository(ABC):
     @abstractmethod
     def buscar_por_serie(self, serie_id: UUID) -> List[Libro]: pass
 
+    @abstractmethod
+    def buscar_por_titulo(self, titulo: str) -> List[Libro]: pass
+
+    @abstractmethod
+    def listar_huellas(self) -> List[Dict]: pass
+
+    @abstractmethod
+    def actualizar_path(self, id: UUID, path: str) -> None: pass
+
+    @abstractmethod
+    def actualizar_campos(self, id: UUID, campos: Dict) -> bool: pass
+
     @abstractmethod
     def eliminar(self, id: UUID) -> None: pass
 
     @abstractmethod
     def listar_todos(self) -> List[Libro]: pass
+
+    @abstractmethod
+    def listar_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Libro]: pass
+
+    @abstractmethod
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Libro]: pass
@@ -1,8 +1,8 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from abc import ABC, abstractmethod
 from uuid import UUID
 
-from domain.entities import Marcador
+from app.domain.entities import Marcador
 
 class MarcadorRepository(ABC):
     @abstractmethod
@@ -11,6 +11,17 @@ class MarcadorRepository(ABC):
     @abstractmethod
     def obtener_por_usuario(self, usuario_id: UUID) -> List[Marcador]: pass
 
+    @abstractmethod
+    def obtener_por_usuario_y_libro(
+        self,
+        usuario_id: UUID,
+        libro_id: UUID,
+        desde_pagina: Optional[int] = None,
+        hasta_pagina: Optional[int] = None,
+        despues_de: Optional[UUID] = None,
+        limite: int = 100
+    ) -> List[Marcador]: pass
+
     @abstractmethod
     def obtener_por_libro(self, libro_id: UUID) -> List[Marcador]: pass
 
@@ -21,4 +32,10 @@ class MarcadorRepository(ABC):
     def listar_todos(self) -> List[Marcador]: pass
 
     @abstractmethod
-    def obtener_por_id(self, id: UUID) ->Optional[Marcador]: pass
\ No newline at end of file
+    def obtener_por_id(self, id: UUID) ->Optional[Marcador]: pass
+
+    @abstractmethod
+    def listar_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Marcador]: pass
+
+    @abstractmethod
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Marcador]: pass
@@ -1,12 +1,15 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from abc import ABC, abstractmethod
 from uuid import UUID
-from domain.entities import Progreso
+from app.domain.entities import Progreso
 
 class ProgresoRepository(ABC):
     @abstractmethod
     def guardar(self, progreso: Progreso) -> None: pass
 
+    @abstractmethod
+    def guardar_lote(self, progresos: List[Progreso]) -> None: pass
+
     @abstractmethod
     def obtener_por_usuario_y_libro(self, usuario_id: UUID, libro_id: UUID) -> Optional[Progreso]: pass
 
@@ -23,4 +26,10 @@ class ProgresoRepository(ABC):
     def obtener_por_id(self, id: UUID) -> Optional[Progreso]: pass
 
     @abstractmethod
-    def obtener_por_usuario(self, usuario_id: UUID) -> List[Progreso]: pass
\ No newline at end of file
+    def obtener_por_usuario(self, usuario_id: UUID) -> List[Progreso]: pass
+
+    @abstractmethod
+    def listar_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Progreso]: pass
+
+    @abstractmethod
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Progreso]: pass
@@ -1,18 +1,24 @@
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from abc import ABC, abstractmethod
 from uuid import UUID
-from domain.entities import Serie
+from app.domain.entities import Serie
 
 class SerieRepository(ABC):
     @abstractmethod
     def guardar(self, serie: Serie) -> None: pass
 
+    @abstractmethod
+    def guardar_lote(self, series: List[Serie]) -> None: pass
+
     @abstractmethod
     def obtener_por_id(self, id: UUID) -> Optional[Serie]: pass
 
     @abstractmethod
     def buscar_por_nombre(self, nombre: str) -> List[Serie]: pass
 
+    @abstractmethod
+    def listar_nombres(self) -> List[Dict]: pass
+
     @abstractmethod
     def buscar_por_autor(self, autor_id: UUID) -> List[Serie]: pass
 
@@ -20,4 +26,10 @@ class SerieRepository(ABC):
     def eliminar(self, id: UUID) -> None: pass
 
     @abstractmethod
-    def listar_todos(self) -> List[Serie]: pass
\ No newline at end of file
+    def listar_todos(self) -> List[Serie]: pass
+
+    @abstractmethod
+    def listar_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Serie]: pass
+
+    @abstractmethod
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Serie]: pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class UnitOfWork(ABC):
+    """
+    Agrupa las escrituras de varios repositorios en una sola transacción.
+
+    Dentro del bloque `with`, los repositorios vuelcan sus cambios sin confirmarlos;
+    al salir se confirma todo junto o, si hubo una excepción, se deshace todo.
+    """
+    @abstractmethod
+    def __enter__(self) -> "UnitOfWork": pass
+
+    @abstractmethod
+    def __exit__(self, tipo, valor, traza) -> None: pass
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
-from domain.entities import Usuario
+from app.domain.entities import Usuario
 
 class UsuarioRepository(ABC):
     @abstractmethod
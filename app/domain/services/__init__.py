@@ -3,4 +3,5 @@ from app.domain.services.autor_service import AutorService
 from app.domain.services.libro_service import LibroService
 from app.domain.services.marcador_service import MarcadorService
 from app.domain.services.progreso_service import ProgresoService
-from app.domain.services.serie_service import SerieService
\ No newline at end of file
+from app.domain.services.serie_service import SerieService
+from app.domain.services.busqueda_service import BusquedaService
\ No newline at end of file
@@ -1,10 +1,10 @@
 from uuid import uuid4, UUID
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 from datetime import date
 
-from domain.entities import Autor, Libro
-from domain.repositories import AutorRepository
-from domain.exceptions import AutorNoEncontrado
+from app.domain.entities import Autor, Libro
+from app.domain.repositories import AutorRepository
+from app.domain.exceptions import AutorNoEncontrado, AutorNoValido
 
 class AutorService:
     def __init__(self, autor_repo: AutorRepository):
@@ -51,6 +51,23 @@ class AutorService:
         self.repo.guardar(autor)
         return autor
 
+    def registrar_lote(self, autores: List[Autor]) -> None:
+        """
+        Registra varios autores en una sola escritura.
+
+        Args:
+            autores (List[Autor]): Los autores a registrar.
+
+        Raises:
+            AutorNoValido: Si alguno de los autores no pudo guardarse; no se guarda ninguno.
+        """
+        if not autores:
+            return
+        try:
+            self.repo.guardar_lote(autores)
+        except Exception as e:
+            raise AutorNoValido(f"Error al crear {len(autores)} autores: {e}")
+
     def obtener_por_id(self, autor_id: UUID) -> Autor:
         """
         Obtiene un autor por su ID.
@@ -87,6 +104,15 @@ class AutorService:
             raise AutorNoEncontrado()
         return autores
 
+    def listar_nombres(self) -> List[Dict]:
+        """
+        Obtiene el ID y el nombre de todos los autores.
+
+        Returns:
+            List[Dict]: Diccionarios con 'id' y 'nombre'.
+        """
+        return self.repo.listar_nombres()
+
     def obtener_todos(self) -> List[Autor]:
         """
         Obtiene todos los autores.
@@ -107,17 +133,13 @@ class AutorService:
         Returns:
             Optional[bool]: True si la edición se realizó correctamente, False en caso contrario.
         """
+        campos = {
+            campo: metadatos[campo]
+            for campo in ["nombre", "foto_hash", "biografia", "fecha_nacimiento", "fecha_muerte", "nacionalidad", "redes_sociales"]
+            if campo in metadatos
+        }
         try:
-            autor = self.repo.obtener_por_id(autor_id)
-            if not autor:
-                return False
-
-            for campo in ["nombre", "foto_hash", "biografia", "fecha_nacimiento", "fecha_muerte", "nacionalidad", "redes_sociales"]:
-                if campo in metadatos:
-                    setattr(autor, campo, metadatos[campo])
-
-            self.repo.guardar(autor)
-            return True
+            return self.repo.actualizar_campos(autor_id, campos) if campos else self.repo.obtener_por_id(autor_id) is not None
         except Exception as e:
             return False
 
@@ -143,4 +165,31 @@ class AutorService:
         Args:
             autor_id (UUID): El ID del autor.
         """
-        self.repo.eliminar(autor_id)
\ No newline at end of file
+        self.repo.eliminar(autor_id)
+
+    def obtener_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Autor]:
+        """
+        Obtiene una página de autores. Para la siguiente, se pasa como `despues_de`
+        el ID del último elemento recibido.
+
+        Args:
+            despues_de (Optional[UUID]): ID del último autor de la página anterior; None para la primera.
+            limite (int): Autores máximos de la página.
+            orden (str): Columna de orden: 'id' o 'nombre'.
+
+        Returns:
+            List[Autor]: Los autores de la página.
+        """
+        return self.repo.listar_pagina(despues_de, limite, orden)
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Autor]:
+        """
+        Recorre todos los autores sin cargarlos a la vez en memoria.
+
+        Args:
+            tamano_lote (int): Filas leídas de la base de datos de cada vez.
+
+        Returns:
+            Iterator[Autor]: Los autores, por orden de ID.
+        """
+        return self.repo.iterar_todos(tamano_lote)
@@ -0,0 +1,38 @@
+from typing import List, Optional
+
+from app.domain.entities import ResultadoBusqueda
+from app.domain.enums import TipoResultado
+from app.domain.repositories import BusquedaRepository
+
+class BusquedaService:
+    def __init__(self, busqueda_repo: BusquedaRepository):
+        self.repo = busqueda_repo
+
+    def buscar(
+            self,
+            consulta: str,
+            tipos: Optional[List[TipoResultado]] = None,
+            limite: int = 20
+    ) -> List[ResultadoBusqueda]:
+        """
+        Busca en todo el catálogo: libros (por título, autores, serie y descripción),
+        autores y series, sin distinguir mayúsculas ni acentos.
+
+        Args:
+            consulta (str): Palabras a buscar; la última puede estar incompleta.
+            tipos (Optional[List[TipoResultado]]): Tipos de resultado; todos si se omite.
+            limite (int): Resultados máximos.
+
+        Returns:
+            List[ResultadoBusqueda]: Los resultados agrupados por tipo, en el orden de `tipos`,
+            y dentro de cada tipo del más al menos relevante.
+        """
+        if not consulta or not consulta.strip():
+            return []
+        return self.repo.buscar(consulta, tipos, limite)
+
+    def reconstruir_indice(self) -> None:
+        """
+        Vuelve a generar el índice de búsqueda a partir del catálogo.
+        """
+        self.repo.reconstruir()
@@ -1,16 +1,16 @@
 from uuid import uuid4, UUID
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 
-from domain.entities import Libro
-from domain.enums import Formato
-from domain.repositories import LibroRepository
-from domain.exceptions import MetadatosIncompletos, LibroNoValido, LibroNoEncontrado
+from app.domain.entities import Libro
+from app.domain.enums import Formato
+from app.domain.repositories import LibroRepository
+from app.domain.exceptions import MetadatosIncompletos, LibroNoValido, LibroNoEncontrado
 
 class LibroService:
     def __init__(self, libro_repo: LibroRepository):
         self.repo = libro_repo
 
-    def registrar_libro(
+    def preparar_libro(
             self,
             titulo: str,
             autores: List[UUID],
@@ -23,10 +23,12 @@ class LibroService:
             serie_id: Optional[UUID] = None,
             descripcion: Optional[str] = None,
             paginas: Optional[int] = None,
-            year: Optional[int] = None
+            year: Optional[int] = None,
+            hash_parcial: Optional[str] = None,
+            hash_contenido: Optional[str] = None
     ) -> Libro:
         """
-        Registra un nuevo libro.
+        Valida los datos de un libro nuevo y construye la entidad, sin guardarla.
 
         Args:
             titulo (str): El título del libro.
@@ -41,18 +43,19 @@ class LibroService:
             descripcion (Optional[str]): La descripción del libro.
             paginas (Optional[int]): El número de páginas del libro.
             year (Optional[int]): El año de publicación del libro.
+            hash_parcial (Optional[str]): La huella parcial del contenido del archivo.
+            hash_contenido (Optional[str]): La huella completa del contenido del archivo.
 
         Returns:
-            Libro: El libro registrado.
+            Libro: El libro, con su ID ya asignado.
 
         Raises:
             MetadatosIncompletos: Si faltan metadatos obligatorios.
-            LibroNoValido: Si el libro no es válido.
         """
         if not titulo or not autores or not path or not formato or not portada_hash:
             raise MetadatosIncompletos()
 
-        libro = Libro(
+        return Libro(
             id=uuid4(),
             titulo=titulo,
             autores=autores,
@@ -65,13 +68,110 @@ class LibroService:
             serie_id=serie_id,
             descripcion=descripcion,
             paginas=paginas,
-            year=year
+            year=year,
+            hash_parcial=hash_parcial,
+            hash_contenido=hash_contenido
+        )
+
+    def registrar_libro(
+            self,
+            titulo: str,
+            autores: List[UUID],
+            path: str,
+            formato: Formato,
+            portada_hash: str,
+            isbn: Optional[str] = None,
+            fecha_publicacion: Optional[str] = None,
+            editorial: Optional[str] = None,
+            serie_id: Optional[UUID] = None,
+            descripcion: Optional[str] = None,
+            paginas: Optional[int] = None,
+            year: Optional[int] = None,
+            hash_parcial: Optional[str] = None,
+            hash_contenido: Optional[str] = None
+    ) -> Libro:
+        """
+        Registra un nuevo libro.
+
+        Args:
+            titulo (str): El título del libro.
+            autores (List[UUID]): La lista de IDs de los autores del libro.
+            path (str): La ruta del archivo del libro.
+            formato (Formato): El formato del libro.
+            portada_hash (str): El hash de la portada del libro.
+            isbn (Optional[str]): El ISBN del libro.
+            fecha_publicacion (Optional[str]): La fecha de publicación del libro.
+            editorial (Optional[str]): La editorial del libro.
+            serie_id (Optional[UUID]): El ID de la serie a la que pertenece el libro.
+            descripcion (Optional[str]): La descripción del libro.
+            paginas (Optional[int]): El número de páginas del libro.
+            year (Optional[int]): El año de publicación del libro.
+            hash_parcial (Optional[str]): La huella parcial del contenido del archivo.
+            hash_contenido (Optional[str]): La huella completa del contenido del archivo.
+
+        Returns:
+            Libro: El libro registrado.
+
+        Raises:
+            MetadatosIncompletos: Si faltan metadatos obligatorios.
+            LibroNoValido: Si el libro no es válido.
+        """
+        libro = self.preparar_libro(
+            titulo=titulo,
+            autores=autores,
+            path=path,
+            formato=formato,
+            portada_hash=portada_hash,
+            isbn=isbn,
+            fecha_publicacion=fecha_publicacion,
+            editorial=editorial,
+            serie_id=serie_id,
+            descripcion=descripcion,
+            paginas=paginas,
+            year=year,
+            hash_parcial=hash_parcial,
+            hash_contenido=hash_contenido
         )
         try:
             self.repo.guardar(libro)
         except Exception as e:
             raise LibroNoValido(f"Error al crear el libro: {e}")
         return libro
+
+    def registrar_lote(self, libros: List[Libro]) -> None:
+        """
+        Registra varios libros ya preparados en una sola escritura.
+
+        Args:
+            libros (List[Libro]): Los libros a registrar, construidos con `preparar_libro`.
+
+        Raises:
+            LibroNoValido: Si alguno de los libros no pudo guardarse; no se guarda ninguno.
+        """
+        if not libros:
+            return
+        try:
+            self.repo.guardar_lote(libros)
+        except Exception as e:
+            raise LibroNoValido(f"Error al crear {len(libros)} libros: {e}")
+    
+    def actualizar_libro(self, libro: Libro) -> bool:
+        """
+        Sustituye los datos de un libro ya registrado, por ejemplo tras modificarse su archivo.
+
+        Args:
+            libro (Libro): El libro, construido con `preparar_libro` y con el ID del que se actualiza.
+
+        Returns:
+            bool: True si el libro existe y se actualizó, False si no existe.
+
+        Raises:
+            LibroNoValido: Si el libro no pudo guardarse.
+        """
+        try:
+            return self.repo.actualizar(libro)
+        except Exception as e:
+            raise LibroNoValido(f"Error al actualizar el libro: {e}")
     
     def obtener_por_id(self, libro_id: UUID) -> Libro:
         """
@@ -122,6 +222,24 @@ class LibroService:
         """
         return self.repo.buscar_por_serie(serie_id)
 
+    def buscar_por_titulo(self, titulo: str) -> List[Libro]:
+        """
+        Busca libros por las palabras de su título, ordenados por relevancia.
+
+        Args:
+            titulo (str): El título, o parte de él.
+
+        Returns:
+            List[Libro]: La lista de libros encontrados.
+
+        Raises:
+            LibroNoEncontrado: Si ningún título coincide.
+        """
+        libros = self.repo.buscar_por_titulo(titulo)
+        if not libros:
+            raise LibroNoEncontrado()
+        return libros
+
     def obtener_todos(self) -> List[Libro]:
         """
         Obtiene todos los libros.
@@ -131,6 +249,25 @@ class LibroService:
         """
         return self.repo.listar_todos()
 
+    def listar_huellas(self) -> List[Dict]:
+        """
+        Obtiene la ruta y las huellas de contenido de los libros registrados.
+
+        Returns:
+            List[Dict]: Diccionarios con 'id', 'path', 'hash_parcial' y 'hash_contenido'.
+        """
+        return self.repo.listar_huellas()
+
+    def actualizar_path(self, libro_id: UUID, path: str) -> None:
+        """
+        Actualiza la ruta del archivo de un libro que se movió o renombró.
+
+        Args:
+            libro_id (UUID): El ID del libro.
+            path (str): La nueva ruta del archivo.
+        """
+        self.repo.actualizar_path(libro_id, path)
+
     def eliminar(self, libro_id: UUID) -> None:
         """
         Elimina un libro por su ID.
@@ -151,16 +288,39 @@ class LibroService:
         Returns:
             Optional[bool]: True si la edición se realizó correctamente, False en caso contrario.
         """
+        campos = {
+            campo: metadatos[campo]
+            for campo in ["titulo", "descripcion", "paginas", "year", "serie_id", "portada_hash", "isbn", "editorial"]
+            if campo in metadatos
+        }
         try:
-            libro = self.repo.obtener_por_id(libro_id)
-            if not libro:
-                return False
+            return self.repo.actualizar_campos(libro_id, campos) if campos else self.repo.obtener_por_id(libro_id) is not None
+        except Exception as e:
+            return False
 
-            for campo in ["titulo", "descripcion", "paginas", "year", "serie_id", "portada_hash"]:
-                if campo in metadatos:
-                    setattr(libro, campo, metadatos[campo])
+    def obtener_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Libro]:
+        """
+        Obtiene una página de libros. Para la siguiente, se pasa como `despues_de`
+        el ID del último elemento recibido.
 
-            self.repo.guardar(libro)
-            return True
-        except Exception as e:
-            return False
\ No newline at end of file
+        Args:
+            despues_de (Optional[UUID]): ID del último libro de la página anterior; None para la primera.
+            limite (int): Libros máximos de la página.
+            orden (str): Columna de orden: 'id' o 'titulo'.
+
+        Returns:
+            List[Libro]: Los libros de la página.
+        """
+        return self.repo.listar_pagina(despues_de, limite, orden)
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Libro]:
+        """
+        Recorre todos los libros sin cargarlos a la vez en memoria.
+
+        Args:
+            tamano_lote (int): Filas leídas de la base de datos de cada vez.
+
+        Returns:
+            Iterator[Libro]: Los libros, por orden de ID.
+        """
+        return self.repo.iterar_todos(tamano_lote)
@@ -1,9 +1,9 @@
 from uuid import uuid4, UUID
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 
-from domain.entities  import Marcador
-from domain.repositories import MarcadorRepository
-from domain.exceptions import MarcadorNoEncontrado, MarcadorInvalido
+from app.domain.entities  import Marcador
+from app.domain.repositories import MarcadorRepository
+from app.domain.exceptions import MarcadorNoEncontrado, MarcadorInvalido
 
 class MarcadorService:
     def __init__(self, marcador_repo: MarcadorRepository):
@@ -38,22 +38,32 @@ class MarcadorService:
         return marcador
 
 
-    def obtener_marcadores_por_usuario_y_libro(self, usuario_id: UUID, libro_id: UUID) -> List[Marcador]:
+    def obtener_marcadores_por_usuario_y_libro(
+        self,
+        usuario_id: UUID,
+        libro_id: UUID,
+        desde_pagina: Optional[int] = None,
+        hasta_pagina: Optional[int] = None,
+        despues_de: Optional[UUID] = None,
+        limite: int = 100
+    ) -> List[Marcador]:
         """
-        Obtiene todos los marcadores de un usuario para un libro específico.
+        Obtiene los marcadores de un usuario para un libro específico, por orden de página.
+        Para la siguiente página de resultados, se pasa como `despues_de` el ID del último
+        marcador recibido.
 
         Args:
             usuario_id (UUID): El ID del usuario.
             libro_id (UUID): El ID del libro.
+            desde_pagina (Optional[int]): Primera página del libro a incluir.
+            hasta_pagina (Optional[int]): Última página del libro a incluir.
+            despues_de (Optional[UUID]): ID del último marcador de la página anterior; None para la primera.
+            limite (int): Marcadores máximos de la página.
 
         Returns:
             List[Marcador]: Una lista de marcadores.
         """
-        marcadores = []
-        for marcador in self.repo.obtener_por_usuario(usuario_id):
-            if marcador.libro_id == libro_id:
-                marcadores.append(marcador)
-        return marcadores
+        return self.repo.obtener_por_usuario_y_libro(usuario_id, libro_id, desde_pagina, hasta_pagina, despues_de, limite)
 
     def obtener_marcador_por_id(self, marcador_id: UUID) -> Optional[Marcador]:
         """
@@ -113,4 +123,31 @@ class MarcadorService:
         Returns:
             List[Marcador]: Una lista de marcadores.
         """
-        return self.repo.listar_todos()
\ No newline at end of file
+        return self.repo.listar_todos()
+
+    def listar_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Marcador]:
+        """
+        Obtiene una página de marcadores. Para la siguiente, se pasa como `despues_de`
+        el ID del último elemento recibido.
+
+        Args:
+            despues_de (Optional[UUID]): ID del último marcador de la página anterior; None para la primera.
+            limite (int): Marcadores máximos de la página.
+            orden (str): Columna de orden: 'id'.
+
+        Returns:
+            List[Marcador]: Los marcadores de la página.
+        """
+        return self.repo.listar_pagina(despues_de, limite, orden)
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Marcador]:
+        """
+        Recorre todos los marcadores sin cargarlos a la vez en memoria.
+
+        Args:
+            tamano_lote (int): Filas leídas de la base de datos de cada vez.
+
+        Returns:
+            Iterator[Marcador]: Los marcadores, por orden de ID.
+        """
+        return self.repo.iterar_todos(tamano_lote)
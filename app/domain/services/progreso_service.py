@@ -1,11 +1,11 @@
 from uuid import UUID
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Iterator, List
 
-from domain.entities import Progreso
-from domain.enums import Estatus
-from domain.repositories import ProgresoRepository
-from domain.exceptions import ProgresoInvalido
+from app.domain.entities import Progreso
+from app.domain.enums import Estatus
+from app.domain.repositories import ProgresoRepository
+from app.domain.exceptions import ProgresoInvalido
 
 class ProgresoService:
     def __init__(self, progreso_repo: ProgresoRepository):
@@ -90,4 +90,31 @@ class ProgresoService:
         Returns:
             Optional[Progreso]: EL progreso de lectura, None si no se encuentra.
         """
-        return self.repo.obtener_por_id(progreso_id)
\ No newline at end of file
+        return self.repo.obtener_por_id(progreso_id)
+
+    def obtener_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Progreso]:
+        """
+        Obtiene una página de progresos. Para la siguiente, se pasa como `despues_de`
+        el ID del último elemento recibido.
+
+        Args:
+            despues_de (Optional[UUID]): ID del último progreso de la página anterior; None para la primera.
+            limite (int): Progresos máximos de la página.
+            orden (str): Columna de orden: 'id'.
+
+        Returns:
+            List[Progreso]: Los progresos de la página.
+        """
+        return self.repo.listar_pagina(despues_de, limite, orden)
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Progreso]:
+        """
+        Recorre todos los progresos sin cargarlos a la vez en memoria.
+
+        Args:
+            tamano_lote (int): Filas leídas de la base de datos de cada vez.
+
+        Returns:
+            Iterator[Progreso]: Los progresos, por orden de ID.
+        """
+        return self.repo.iterar_todos(tamano_lote)
@@ -1,9 +1,9 @@
 from uuid import uuid4, UUID
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 
-from domain.entities import Serie
-from domain.repositories import SerieRepository
-from domain.exceptions import SerieNoEncontrada, SerieInvalida
+from app.domain.entities import Serie
+from app.domain.repositories import SerieRepository
+from app.domain.exceptions import SerieNoEncontrada, SerieInvalida
 
 class SerieService:
     def __init__(self, serie_repo: SerieRepository):
@@ -42,6 +42,23 @@ class SerieService:
             portada_hash=portada_hash
         )
     
+    def registrar_lote(self, series: List[Serie]) -> None:
+        """
+        Registra varias series en una sola escritura.
+
+        Args:
+            series (List[Serie]): Las series a registrar.
+
+        Raises:
+            SerieInvalida: Si alguna de las series no pudo guardarse; no se guarda ninguna.
+        """
+        if not series:
+            return
+        try:
+            self.repo.guardar_lote(series)
+        except Exception as e:
+            raise SerieInvalida(f"Error al crear {len(series)} series: {e}")
+
     def obtener_por_id(self, serie_id: UUID) -> Serie:
         """
         Obtiene una serie por su ID.
@@ -96,6 +113,15 @@ class SerieService:
             raise SerieNoEncontrada()
         return series
     
+    def listar_nombres(self) -> List[Dict]:
+        """
+        Obtiene el ID y el nombre de todas las series.
+
+        Returns:
+            List[Dict]: Diccionarios con 'id' y 'nombre'.
+        """
+        return self.repo.listar_nombres()
+
     def agregar_libro_a_serie(self, serie_id: UUID, libro_id: UUID) -> Optional[bool]:
         """
         Agrega un libro a una serie.
@@ -162,4 +188,31 @@ class SerieService:
         Args:
             serie_id (UUID): El ID de la serie.
         """
-        self.repo.eliminar(serie_id)
\ No newline at end of file
+        self.repo.eliminar(serie_id)
+
+    def obtener_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Serie]:
+        """
+        Obtiene una página de series. Para la siguiente, se pasa como `despues_de`
+        el ID del último elemento recibido.
+
+        Args:
+            despues_de (Optional[UUID]): ID de la última serie de la página anterior; None para la primera.
+            limite (int): Series máximas de la página.
+            orden (str): Columna de orden: 'id' o 'nombre'.
+
+        Returns:
+            List[Serie]: Las series de la página.
+        """
+        return self.repo.listar_pagina(despues_de, limite, orden)
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Serie]:
+        """
+        Recorre todos los series sin cargarlos a la vez en memoria.
+
+        Args:
+            tamano_lote (int): Filas leídas de la base de datos de cada vez.
+
+        Returns:
+            Iterator[Serie]: Los series, por orden de ID.
+        """
+        return self.repo.iterar_todos(tamano_lote)
@@ -2,10 +2,10 @@ from uuid import uuid4
 from datetime import date
 from typing import Optional, List
 
-from domain.entities import Usuario
-from domain.repositories import UsuarioRepository
-from domain.exceptions import UsuarioNoEncontrado
-from domain.enums import Rol
+from app.domain.entities import Usuario
+from app.domain.repositories import UsuarioRepository
+from app.domain.exceptions import UsuarioNoEncontrado
+from app.domain.enums import Rol
 
 class UsuarioService:
     def __init__(self, usuario_repo: UsuarioRepository):
@@ -0,0 +1,11 @@
+from app.infrastructure.cache.cache_backend import CacheBackend
+from app.infrastructure.cache.cache_memoria import CacheMemoria
+from app.infrastructure.cache.cache_redis import CacheRedis
+from app.infrastructure.cache.cache_entidades import CacheEntidades
+
+__all__ = [
+    "CacheBackend",
+    "CacheMemoria",
+    "CacheRedis",
+    "CacheEntidades",
+]
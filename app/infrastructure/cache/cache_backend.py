@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class CacheBackend(ABC):
+    """Almacén clave-valor con caducidad en el que se apoya la caché de entidades."""
+
+    @abstractmethod
+    def obtener(self, clave: str) -> Optional[str]:
+        """
+        Args:
+            clave (str): La clave.
+
+        Returns:
+            Optional[str]: El valor guardado, o None si no existe o ha caducado.
+        """
+
+    @abstractmethod
+    def guardar(self, clave: str, valor: str, ttl: float) -> None:
+        """
+        Args:
+            clave (str): La clave.
+            valor (str): El valor.
+            ttl (float): Segundos de validez.
+        """
+
+    @abstractmethod
+    def eliminar(self, *claves: str) -> None:
+        """
+        Args:
+            claves (str): Las claves a eliminar; las que no existen se ignoran.
+        """
+
+    @abstractmethod
+    def limpiar(self) -> None:
+        """Elimina todas las entradas."""
+
+    @abstractmethod
+    def entradas(self) -> int:
+        """Número de entradas guardadas (incluidas las caducadas aún no eliminadas)."""
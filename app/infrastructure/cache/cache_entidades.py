@@ -0,0 +1,157 @@
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Type, TypeVar
+import threading
+import logging
+
+from pydantic import BaseModel, ValidationError
+
+from app.infrastructure.cache.cache_backend import CacheBackend
+from app.infrastructure.database.unit_of_work import al_terminar
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class CacheEntidades:
+    """
+    Caché de lectura (read-through) de las entidades por ID, en la frontera de los servicios.
+
+    Si una entidad no está en la caché, se carga del repositorio y se guarda, serializada
+    en JSON, durante `ttl` segundos. Los servicios la invalidan en cada escritura; con una
+    sesión, la invalidación espera a que termine su transacción, para que otra lectura no
+    vuelva a guardar los datos anteriores mientras tanto. El TTL acota lo que tarda en verse
+    un cambio hecho por otro proceso que no comparte la caché.
+    Las entidades se devuelven como copias nuevas, así que modificarlas no altera la caché.
+
+    Sin backend, la caché está desactivada y cada lectura va al repositorio.
+    """
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: float = 300, session=None):
+        """
+        Args:
+            backend (Optional[CacheBackend]): Dónde se guardan las entradas; None para desactivar la caché.
+            ttl (float): Segundos de validez de cada entrada.
+            session: Sesión de las escrituras; None para invalidar al momento.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.backend = backend
+        self.ttl = ttl
+        self.session = session
+        self._lock = threading.Lock()
+        # Se incrementa en cada invalidación: una carga que empezó antes no se guarda
+        self._generacion = 0
+        self._contadores: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"aciertos": 0, "fallos": 0, "invalidaciones": 0}
+        )
+
+    @property
+    def activa(self) -> bool:
+        return self.backend is not None
+
+    def obtener(self, tipo: Type[T], id, cargar: Callable[[object], Optional[T]]) -> Optional[T]:
+        """
+        Devuelve la entidad de la caché o, si no está, la carga y la guarda.
+
+        Args:
+            tipo (Type[T]): Clase de la entidad.
+            id: ID de la entidad.
+            cargar (Callable[[object], Optional[T]]): Lee la entidad del repositorio a partir de su ID.
+
+        Returns:
+            Optional[T]: La entidad, o None si no existe (los resultados vacíos no se guardan).
+        """
+        if not self.activa:
+            return cargar(id)
+
+        clave = self._clave(tipo, id)
+        try:
+            datos = self.backend.obtener(clave)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Error al leer la caché de entidades: {e}")
+            datos = None
+
+        if datos is not None:
+            try:
+                entidad = tipo.model_validate_json(datos)
+                self._contar(tipo, "aciertos")
+                return entidad
+            except ValidationError:
+                self._eliminar(clave)
+
+        self._contar(tipo, "fallos")
+        with self._lock:
+            generacion = self._generacion
+        entidad = cargar(id)
+        if entidad is None:
+            return None
+
+        with self._lock:
+            vigente = generacion == self._generacion
+        if vigente:
+            try:
+                self.backend.guardar(clave, entidad.model_dump_json(), self.ttl)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Error al escribir en la caché de entidades: {e}")
+        return entidad
+
+    def invalidar(self, tipo: Type[BaseModel], *ids) -> None:
+        """
+        Quita de la caché las entidades indicadas cuando termina la transacción en curso.
+
+        Args:
+            tipo (Type[BaseModel]): Clase de las entidades.
+            ids: Sus IDs; los None se ignoran.
+        """
+        claves = [self._clave(tipo, id) for id in ids if id is not None]
+        if not self.activa or not claves:
+            return
+        if self.session is not None:
+            al_terminar(self.session, lambda: self._invalidar(tipo, claves))
+        else:
+            self._invalidar(tipo, claves)
+
+    def stats(self, tipo: Optional[Type[BaseModel]] = None) -> Dict[str, float]:
+        """
+        Obtiene las estadísticas de uso desde el arranque del proceso.
+
+        Args:
+            tipo (Optional[Type[BaseModel]]): Clase de las entidades; None para el total.
+
+        Returns:
+            Dict[str, float]: Aciertos, fallos, invalidaciones y ratio de aciertos.
+        """
+        with self._lock:
+            if tipo is not None:
+                contadores = dict(self._contadores[tipo.__name__])
+            else:
+                contadores = {"aciertos": 0, "fallos": 0, "invalidaciones": 0}
+                for por_tipo in self._contadores.values():
+                    for evento, valor in por_tipo.items():
+                        contadores[evento] += valor
+
+        lecturas = contadores["aciertos"] + contadores["fallos"]
+        return {**contadores, "ratio": contadores["aciertos"] / lecturas if lecturas else 0.0}
+
+    def limpiar(self) -> None:
+        """Elimina todas las entradas de la caché."""
+        if self.activa:
+            with self._lock:
+                self._generacion += 1
+            self.backend.limpiar()
+
+    def _clave(self, tipo: Type[BaseModel], id) -> str:
+        return f"{tipo.__name__.lower()}:{id}"
+
+    def _invalidar(self, tipo: Type[BaseModel], claves: List[str]) -> None:
+        with self._lock:
+            self._generacion += 1
+            self._contadores[tipo.__name__]["invalidaciones"] += len(claves)
+        self._eliminar(*claves)
+
+    def _contar(self, tipo: Type[BaseModel], evento: str) -> None:
+        with self._lock:
+            self._contadores[tipo.__name__][evento] += 1
+
+    def _eliminar(self, *claves: str) -> None:
+        try:
+            self.backend.eliminar(*claves)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Error al invalidar la caché de entidades: {e}")
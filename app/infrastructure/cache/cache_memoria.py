@@ -0,0 +1,53 @@
+from collections import OrderedDict
+from typing import Optional, Tuple
+import threading
+import time
+
+from app.infrastructure.cache.cache_backend import CacheBackend
+
+
+class CacheMemoria(CacheBackend):
+    """
+    Caché en la memoria del proceso, con caducidad por entrada y expulsión LRU al
+    superar `max_entradas`. Cada proceso tiene la suya.
+    """
+    def __init__(self, max_entradas: Optional[int] = 10000):
+        """
+        Args:
+            max_entradas (Optional[int]): Entradas máximas; None para no limitar.
+        """
+        self.max_entradas = max_entradas
+        self._entradas: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obtener(self, clave: str) -> Optional[str]:
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                return None
+            expira, valor = entrada
+            if expira <= time.monotonic():
+                del self._entradas[clave]
+                return None
+            self._entradas.move_to_end(clave)
+            return valor
+
+    def guardar(self, clave: str, valor: str, ttl: float) -> None:
+        with self._lock:
+            self._entradas[clave] = (time.monotonic() + ttl, valor)
+            self._entradas.move_to_end(clave)
+            while self.max_entradas and len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+
+    def eliminar(self, *claves: str) -> None:
+        with self._lock:
+            for clave in claves:
+                self._entradas.pop(clave, None)
+
+    def limpiar(self) -> None:
+        with self._lock:
+            self._entradas.clear()
+
+    def entradas(self) -> int:
+        with self._lock:
+            return len(self._entradas)
@@ -0,0 +1,60 @@
+from typing import Optional
+import math
+
+from app.infrastructure.cache.cache_backend import CacheBackend
+
+
+class CacheRedis(CacheBackend):
+    """
+    Caché compartida entre procesos sobre un servidor compatible con Redis (Redis,
+    Valkey, KeyDB, Dragonfly...). Todas las claves llevan un prefijo, para poder
+    compartir el servidor y limpiar solo las de la aplicación.
+    """
+    def __init__(self, cliente, prefijo: str = "samanbooks:"):
+        """
+        Args:
+            cliente: Cliente con la interfaz de `redis.Redis` (get, set, delete, scan_iter).
+            prefijo (str): Prefijo de las claves.
+        """
+        self.cliente = cliente
+        self.prefijo = prefijo
+
+    @classmethod
+    def desde_url(cls, url: str, prefijo: str = "samanbooks:") -> "CacheRedis":
+        """
+        Args:
+            url (str): URL del servidor, p. ej. 'redis://localhost:6379/0'.
+            prefijo (str): Prefijo de las claves.
+
+        Returns:
+            CacheRedis: La caché, conectada al servidor.
+
+        Raises:
+            ImportError: Si el paquete `redis` no está instalado.
+        """
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("La caché compartida necesita el paquete 'redis' (pip install redis)") from e
+        return cls(redis.Redis.from_url(url, decode_responses=True), prefijo)
+
+    def obtener(self, clave: str) -> Optional[str]:
+        valor = self.cliente.get(self.prefijo + clave)
+        if isinstance(valor, bytes):
+            valor = valor.decode("utf-8")
+        return valor
+
+    def guardar(self, clave: str, valor: str, ttl: float) -> None:
+        self.cliente.set(self.prefijo + clave, valor, ex=max(1, math.ceil(ttl)))
+
+    def eliminar(self, *claves: str) -> None:
+        if claves:
+            self.cliente.delete(*(self.prefijo + clave for clave in claves))
+
+    def limpiar(self) -> None:
+        claves = list(self.cliente.scan_iter(match=f"{self.prefijo}*"))
+        if claves:
+            self.cliente.delete(*claves)
+
+    def entradas(self) -> int:
+        return sum(1 for _ in self.cliente.scan_iter(match=f"{self.prefijo}*"))
@@ -0,0 +1,193 @@
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Dict, List, Optional, Tuple
+from uuid import UUID
+import threading
+import logging
+
+from sqlalchemy.exc import DataError, IntegrityError
+
+from app.domain.entities import Progreso
+from app.domain.repositories import ProgresoRepository
+
+Clave = Tuple[UUID, UUID]
+
+# Errores que no se resuelven reintentando: el progreso no se puede guardar nunca (por
+# ejemplo, porque su libro o su usuario se eliminaron mientras esperaba)
+ERRORES_PERMANENTES = (IntegrityError, DataError)
+
+
+class BufferProgreso:
+    """
+    Buffer de escritura diferida (write-behind) de los progresos de lectura.
+
+    Los lectores envían su progreso cada pocos segundos; en lugar de una transacción
+    (y una sincronización del disco) por envío, el buffer guarda en memoria el último
+    estado de cada par usuario-libro y un hilo lo vuelca cada `intervalo` segundos, o
+    antes si se acumulan `max_pendientes`, con un único upsert por lote. Las lecturas
+    consultan primero el buffer, así que ven el último progreso aunque aún no esté en
+    la base de datos.
+
+    Si la aplicación termina sin llamar a `detener`, se pierden como mucho los
+    progresos de un intervalo. Si un lote falla por un error permanente, se divide
+    hasta aislar los progresos que no se pueden guardar, que se descartan; con
+    cualquier otro error, se reintenta entero en el siguiente volcado.
+    """
+    def __init__(
+        self,
+        repo: ProgresoRepository,
+        intervalo: float = 5.0,
+        max_pendientes: int = 1000,
+        contexto: Optional[Callable[[], ContextManager]] = None,
+    ):
+        """
+        Args:
+            repo (ProgresoRepository): Repositorio en el que se vuelcan los progresos.
+            intervalo (float): Segundos entre volcados.
+            max_pendientes (int): Progresos pendientes que adelantan el volcado.
+            contexto (Optional[Callable[[], ContextManager]]): Fábrica del contexto en el que se
+                vuelca cada lote (por ejemplo, el de la aplicación Flask).
+        """
+        self.logger = logging.getLogger(__name__)
+        self.repo = repo
+        self.intervalo = intervalo
+        self.max_pendientes = max(1, max_pendientes)
+        self.contexto = contexto or nullcontext
+        self._pendientes: Dict[Clave, Progreso] = {}
+        # Lote que se está escribiendo: sigue visible para las lecturas hasta confirmarse
+        self._en_curso: Dict[Clave, Progreso] = {}
+        self._cerrojo = threading.Lock()
+        self._volcando = threading.Lock()
+        self._detener = threading.Event()
+        self._despertar = threading.Event()
+        self._hilo: Optional[threading.Thread] = None
+
+    def registrar(self, progreso: Progreso) -> None:
+        """
+        Guarda en el buffer el progreso, sustituyendo al pendiente del mismo usuario y libro.
+
+        Args:
+            progreso (Progreso): El progreso a guardar.
+        """
+        with self._cerrojo:
+            self._pendientes[(progreso.usuario_id, progreso.libro_id)] = progreso
+            lleno = len(self._pendientes) >= self.max_pendientes
+        if lleno:
+            self._despertar.set()
+
+    def obtener(self, usuario_id: UUID, libro_id: UUID) -> Optional[Progreso]:
+        """
+        Returns:
+            Optional[Progreso]: El progreso del usuario en el libro que aún no se ha
+            confirmado en la base de datos, o None si no hay ninguno.
+        """
+        clave = (usuario_id, libro_id)
+        with self._cerrojo:
+            return self._pendientes.get(clave) or self._en_curso.get(clave)
+
+    def obtener_por_usuario(self, usuario_id: UUID) -> List[Progreso]:
+        """
+        Returns:
+            List[Progreso]: Los progresos del usuario aún sin confirmar, uno por libro.
+        """
+        with self._cerrojo:
+            progresos = {**self._en_curso, **self._pendientes}
+        return [p for (usuario, _), p in progresos.items() if usuario == usuario_id]
+
+    def descartar(self, progreso_id: UUID) -> None:
+        """
+        Quita del buffer el progreso pendiente con ese ID, si lo hay. Si se está volcando
+        un lote, espera a que termine: así, si el progreso iba en él, el borrado posterior
+        en la base de datos no se adelanta a su escritura.
+
+        Args:
+            progreso_id (UUID): El ID del progreso.
+        """
+        with self._volcando, self._cerrojo:
+            for clave, progreso in list(self._pendientes.items()):
+                if progreso.id == progreso_id:
+                    del self._pendientes[clave]
+
+    def pendientes(self) -> int:
+        """Número de progresos a la espera de volcarse."""
+        with self._cerrojo:
+            return len(self._pendientes)
+
+    def vaciar(self) -> int:
+        """
+        Vuelca en el hilo actual todos los progresos pendientes. Los que fallan por un
+        error transitorio y no se han vuelto a registrar entretanto se reintentan en el
+        siguiente volcado.
+
+        Returns:
+            int: Número de progresos guardados.
+        """
+        with self._volcando:
+            with self._cerrojo:
+                lote, self._pendientes = self._pendientes, {}
+                self._en_curso = lote
+            if not lote:
+                return 0
+
+            guardados, fallidos = self._guardar(list(lote.values()))
+            with self._cerrojo:
+                reintentos = {(p.usuario_id, p.libro_id): p for p in fallidos}
+                self._pendientes = {**reintentos, **self._pendientes}
+                self._en_curso = {}
+            if guardados:
+                self.logger.debug(f"💾 {guardados} progresos guardados")
+            return guardados
+
+    def _guardar(self, progresos: List[Progreso]) -> Tuple[int, List[Progreso]]:
+        """
+        Guarda los progresos en una transacción; si falla por un error permanente, divide
+        el lote en dos y guarda cada mitad por separado.
+
+        Returns:
+            Tuple[int, List[Progreso]]: Número de progresos guardados y progresos a reintentar.
+        """
+        try:
+            with self.contexto():
+                self.repo.guardar_lote(progresos)
+            return len(progresos), []
+        except ERRORES_PERMANENTES as e:
+            if len(progresos) == 1:
+                progreso = progresos[0]
+                self.logger.warning(
+                    f"⚠️ Progreso descartado (usuario {progreso.usuario_id}, libro {progreso.libro_id}): {e}"
+                )
+                return 0, []
+            mitad = len(progresos) // 2
+            guardados_1, fallidos_1 = self._guardar(progresos[:mitad])
+            guardados_2, fallidos_2 = self._guardar(progresos[mitad:])
+            return guardados_1 + guardados_2, fallidos_1 + fallidos_2
+        except Exception as e:
+            self.logger.warning(f"⚠️ Error al guardar {len(progresos)} progresos; se reintentará: {e}")
+            return 0, progresos
+
+    def iniciar(self) -> None:
+        """Arranca el hilo de volcado, si no estaba ya en marcha."""
+        if self._hilo and self._hilo.is_alive():
+            return
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._trabajar, name="buffer-progreso", daemon=True)
+        self._hilo.start()
+        self.logger.info(f"Buffer de progresos iniciado: volcado cada {self.intervalo}s")
+
+    def detener(self, timeout: Optional[float] = None) -> None:
+        """
+        Detiene el hilo de volcado y guarda los progresos pendientes.
+
+        Args:
+            timeout (Optional[float]): Segundos máximos de espera por el hilo.
+        """
+        self._detener.set()
+        self._despertar.set()
+        if self._hilo:
+            self._hilo.join(timeout)
+        self.vaciar()
+
+    def _trabajar(self) -> None:
+        while not self._detener.is_set():
+            self._despertar.wait(self.intervalo)
+            self._despertar.clear()
+            self.vaciar()
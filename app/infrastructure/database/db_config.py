@@ -1,6 +1,10 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
 from flask import Flask
 
+from app.infrastructure.database.indice_busqueda import crear_con_tablas
+from app.infrastructure.database import motor, perfil_sqlite
+
 db = SQLAlchemy()
 
 def init_db(application: Flask):
@@ -9,4 +13,21 @@ def init_db(application: Flask):
     Args:
         app (Flask): Instancia de la aplicación Flask
     """
-    db.init_app(application)
\ No newline at end of file
+    # Pool y opciones del motor (ver motor); las de SQLALCHEMY_ENGINE_OPTIONS tienen prioridad
+    uri = application.config.get("SQLALCHEMY_DATABASE_URI")
+    application.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+        **motor.opciones_engine(uri, application.config),
+        **application.config.get("SQLALCHEMY_ENGINE_OPTIONS", {})
+    }
+
+    db.init_app(application)
+
+    # Con SQLite en archivo: WAL, PRAGMA y escritor único (ver perfil_sqlite)
+    perfil = motor.perfil_sqlite(uri, application.config)
+    if perfil is not None:
+        with application.app_context():
+            perfil_sqlite.aplicar(db.engine, perfil)
+
+    # El índice de texto completo (SQLite FTS5) se crea junto con las tablas
+    if not event.contains(db.metadata, "after_create", crear_con_tablas):
+        event.listen(db.metadata, "after_create", crear_con_tablas)
@@ -1,30 +1,42 @@
-from sqlalchemy.types import TypeDecorator, CHAR
+from sqlalchemy.types import TypeDecorator, BINARY, LargeBinary
+from sqlalchemy.dialects import postgresql
 import uuid
 
 class GUID(TypeDecorator):
-    """Plataforma-agnóstico UUID type."""
-    impl = CHAR
+    """UUID independiente de la base de datos: tipo nativo en PostgreSQL y 16 bytes
+    (BLOB en SQLite, BINARY(16) en el resto) en lugar de 36 caracteres."""
+    impl = BINARY(16)
+    cache_ok = True
 
     def load_dialect_impl(self, dialect):
         """
-
+        Elige el tipo de la columna según el motor de base de datos.
         """
-        return dialect.type_descriptor(CHAR(36))
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        if dialect.name == "sqlite":
+            # BLOB: con BINARY(16) SQLite aplicaría afinidad numérica
+            return dialect.type_descriptor(LargeBinary())
+        return dialect.type_descriptor(BINARY(16))
 
     def process_bind_param(self, value, dialect):
         """
-        
+        Convierte el UUID (o su texto) al valor que se guarda.
         """
         if value is None:
             return value
         if not isinstance(value, uuid.UUID):
-            return str(uuid.UUID(value))
-        return str(value)
+            value = uuid.UUID(str(value))
+        if dialect.name == "postgresql":
+            return value
+        return value.bytes
 
     def process_result_value(self, value, dialect):
         """
-        
+        Convierte el valor guardado en un UUID.
         """
-        if value is None:
+        if value is None or isinstance(value, uuid.UUID):
             return value
-        return uuid.UUID(value)
\ No newline at end of file
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return uuid.UUID(bytes=bytes(value))
+        return uuid.UUID(value)
@@ -0,0 +1,292 @@
+"""
+Índice de texto completo (SQLite FTS5) sobre los títulos, autores, series y
+descripciones del catálogo.
+
+Hay una tabla virtual por entidad (`libros_fts`, `autores_fts` y `series_fts`) cuyo
+rowid es la clave entera que `busqueda_claves` asigna al UUID de la fila de origen.
+Los triggers la mantienen al día en cada alta, cambio o baja, incluidos los de
+`libros_autores` y los cambios de nombre de autores y series, que se propagan a la
+columna `autores`/`serie` de sus libros.
+
+El tokenizador `unicode61 remove_diacritics 2` ignora mayúsculas y acentos ("Garcia
+Marquez" encuentra "García Márquez") y el índice de prefijos resuelve las búsquedas
+de palabras incompletas sin recorrer todo el vocabulario.
+"""
+from typing import Iterable, Optional
+import logging
+import re
+
+from sqlalchemy.engine import Connection
+import sqlalchemy as sa
+
+from app.infrastructure.database.extensions import GUID
+
+logger = logging.getLogger(__name__)
+
+TOKENIZADOR = "unicode61 remove_diacritics 2"
+PREFIJOS = "2 3 4"
+
+metadata_busqueda = sa.MetaData()
+
+libros_fts = sa.Table(
+    "libros_fts", metadata_busqueda,
+    sa.Column("id", GUID()),
+    sa.Column("titulo", sa.Text),
+    sa.Column("autores", sa.Text),
+    sa.Column("serie", sa.Text),
+    sa.Column("descripcion", sa.Text),
+)
+autores_fts = sa.Table(
+    "autores_fts", metadata_busqueda,
+    sa.Column("id", GUID()),
+    sa.Column("nombre", sa.Text),
+)
+series_fts = sa.Table(
+    "series_fts", metadata_busqueda,
+    sa.Column("id", GUID()),
+    sa.Column("nombre", sa.Text),
+    sa.Column("descripcion", sa.Text),
+)
+
+# Pesos BM25 de cada columna, en el orden de la tabla (el id no se indexa)
+PESOS = {
+    "libros_fts": (0.0, 10.0, 4.0, 2.0, 1.0),
+    "autores_fts": (0.0, 1.0),
+    "series_fts": (0.0, 4.0, 1.0),
+}
+
+
+def _autores_de(libro_id: str) -> str:
+    return (
+        "(SELECT group_concat(a.nombre, ' ') FROM libros_autores la"
+        f" JOIN autores a ON a.id = la.autor_id WHERE la.libro_id = {libro_id})"
+    )
+
+
+def _serie_de(serie_id: str) -> str:
+    return f"(SELECT s.nombre FROM series s WHERE s.id = {serie_id})"
+
+
+def _clave_de(id: str) -> str:
+    return f"(SELECT c.clave FROM busqueda_claves c WHERE c.id = {id})"
+
+
+def _claves_de_libros_de_autor(autor_id: str) -> str:
+    return (
+        "(SELECT c.clave FROM libros_autores la"
+        f" JOIN busqueda_claves c ON c.id = la.libro_id WHERE la.autor_id = {autor_id})"
+    )
+
+
+def _claves_de_libros_de_serie(serie_id: str) -> str:
+    return (
+        "(SELECT c.clave FROM libros l"
+        f" JOIN busqueda_claves c ON c.id = l.id WHERE l.serie_id = {serie_id})"
+    )
+
+
+_OPCIONES = f"tokenize='{TOKENIZADOR}', prefix='{PREFIJOS}'"
+
+# Clave entera estable de cada entidad indexada: el rowid de las tablas del catálogo
+# (con clave primaria UUID) cambia al recrearlas o con VACUUM, y buscar por la columna
+# `id` de una tabla FTS5 recorre la tabla entera
+CLAVES = "CREATE TABLE busqueda_claves (clave INTEGER PRIMARY KEY, id NOT NULL UNIQUE)"
+
+TABLAS = {
+    "libros_fts": f"CREATE VIRTUAL TABLE libros_fts USING fts5(id UNINDEXED, titulo, autores, serie, descripcion, {_OPCIONES})",
+    "autores_fts": f"CREATE VIRTUAL TABLE autores_fts USING fts5(id UNINDEXED, nombre, {_OPCIONES})",
+    "series_fts": f"CREATE VIRTUAL TABLE series_fts USING fts5(id UNINDEXED, nombre, descripcion, {_OPCIONES})",
+}
+
+TRIGGERS = {
+    "libros_fts_ai": f"""
+        AFTER INSERT ON libros BEGIN
+            INSERT OR IGNORE INTO busqueda_claves (id) VALUES (new.id);
+            INSERT INTO libros_fts (rowid, id, titulo, autores, serie, descripcion)
+            VALUES ({_clave_de('new.id')}, new.id, new.titulo, {_autores_de('new.id')}, {_serie_de('new.serie_id')}, new.descripcion);
+        END""",
+    "libros_fts_au": f"""
+        AFTER UPDATE OF titulo, descripcion, serie_id ON libros BEGIN
+            UPDATE libros_fts SET titulo = new.titulo, serie = {_serie_de('new.serie_id')}, descripcion = new.descripcion
+            WHERE rowid = {_clave_de('new.id')};
+        END""",
+    "libros_fts_ad": f"""
+        AFTER DELETE ON libros BEGIN
+            DELETE FROM libros_fts WHERE rowid = {_clave_de('old.id')};
+            DELETE FROM busqueda_claves WHERE id = old.id;
+        END""",
+    "libros_autores_fts_ai": f"""
+        AFTER INSERT ON libros_autores BEGIN
+            UPDATE libros_fts SET autores = {_autores_de('new.libro_id')}
+            WHERE rowid = {_clave_de('new.libro_id')};
+        END""",
+    "libros_autores_fts_ad": f"""
+        AFTER DELETE ON libros_autores BEGIN
+            UPDATE libros_fts SET autores = {_autores_de('old.libro_id')}
+            WHERE rowid = {_clave_de('old.libro_id')};
+        END""",
+    "autores_fts_ai": f"""
+        AFTER INSERT ON autores BEGIN
+            INSERT OR IGNORE INTO busqueda_claves (id) VALUES (new.id);
+            INSERT INTO autores_fts (rowid, id, nombre) VALUES ({_clave_de('new.id')}, new.id, new.nombre);
+        END""",
+    "autores_fts_au": f"""
+        AFTER UPDATE OF nombre ON autores BEGIN
+            UPDATE autores_fts SET nombre = new.nombre WHERE rowid = {_clave_de('new.id')};
+            UPDATE libros_fts SET autores = {_autores_de('libros_fts.id')}
+            WHERE rowid IN {_claves_de_libros_de_autor('new.id')};
+        END""",
+    "autores_fts_ad": f"""
+        AFTER DELETE ON autores BEGIN
+            DELETE FROM autores_fts WHERE rowid = {_clave_de('old.id')};
+            DELETE FROM busqueda_claves WHERE id = old.id;
+            UPDATE libros_fts SET autores = {_autores_de('libros_fts.id')}
+            WHERE rowid IN {_claves_de_libros_de_autor('old.id')};
+        END""",
+    "series_fts_ai": f"""
+        AFTER INSERT ON series BEGIN
+            INSERT OR IGNORE INTO busqueda_claves (id) VALUES (new.id);
+            INSERT INTO series_fts (rowid, id, nombre, descripcion) VALUES ({_clave_de('new.id')}, new.id, new.nombre, new.descripcion);
+        END""",
+    "series_fts_au": f"""
+        AFTER UPDATE OF nombre, descripcion ON series BEGIN
+            UPDATE series_fts SET nombre = new.nombre, descripcion = new.descripcion WHERE rowid = {_clave_de('new.id')};
+            UPDATE libros_fts SET serie = new.nombre
+            WHERE rowid IN {_claves_de_libros_de_serie('new.id')};
+        END""",
+    "series_fts_ad": f"""
+        AFTER DELETE ON series BEGIN
+            DELETE FROM series_fts WHERE rowid = {_clave_de('old.id')};
+            DELETE FROM busqueda_claves WHERE id = old.id;
+            UPDATE libros_fts SET serie = NULL
+            WHERE rowid IN {_claves_de_libros_de_serie('old.id')};
+        END""",
+}
+
+_RECONSTRUIR = [
+    "DELETE FROM busqueda_claves",
+    "INSERT INTO busqueda_claves (id) SELECT id FROM libros UNION ALL SELECT id FROM autores UNION ALL SELECT id FROM series",
+    "DELETE FROM libros_fts",
+    f"""INSERT INTO libros_fts (rowid, id, titulo, autores, serie, descripcion)
+        SELECT c.clave, l.id, l.titulo, {_autores_de('l.id')}, {_serie_de('l.serie_id')}, l.descripcion
+        FROM libros l JOIN busqueda_claves c ON c.id = l.id""",
+    "DELETE FROM autores_fts",
+    """INSERT INTO autores_fts (rowid, id, nombre)
+        SELECT c.clave, a.id, a.nombre FROM autores a JOIN busqueda_claves c ON c.id = a.id""",
+    "DELETE FROM series_fts",
+    """INSERT INTO series_fts (rowid, id, nombre, descripcion)
+        SELECT c.clave, s.id, s.nombre, s.descripcion FROM series s JOIN busqueda_claves c ON c.id = s.id""",
+]
+
+
+def soporta_busqueda(bind) -> bool:
+    """
+    Returns:
+        bool: True si la base de datos (una sesión, conexión o engine) tiene índice FTS5.
+    """
+    if hasattr(bind, "get_bind"):
+        bind = bind.get_bind()
+    return bind.dialect.name == "sqlite"
+
+
+def instalar(conexion: Connection) -> None:
+    """
+    Crea las tablas FTS5, la de sus claves y los triggers si no existen. Si alguna tabla
+    es nueva y el catálogo ya tiene datos, las llena.
+
+    Args:
+        conexion (Connection): Conexión con la base de datos, dentro de una transacción.
+    """
+    if not soporta_busqueda(conexion):
+        return
+
+    existentes = set(conexion.exec_driver_sql(
+        "SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')"
+    ).scalars())
+    nuevas = [nombre for nombre in TABLAS if nombre not in existentes]
+    for nombre in nuevas:
+        conexion.exec_driver_sql(TABLAS[nombre])
+    if "busqueda_claves" not in existentes:
+        conexion.exec_driver_sql(CLAVES)
+        nuevas.append("busqueda_claves")
+    for nombre, cuerpo in TRIGGERS.items():
+        if nombre not in existentes:
+            conexion.exec_driver_sql(f"CREATE TRIGGER {nombre} {cuerpo}")
+
+    if nuevas:
+        reconstruir(conexion)
+        logger.info(f"🔎 Índice de búsqueda creado: {', '.join(nuevas)}")
+
+
+def desinstalar(conexion: Connection) -> None:
+    """
+    Elimina las tablas FTS5, sus claves y sus triggers.
+
+    Args:
+        conexion (Connection): Conexión con la base de datos, dentro de una transacción.
+    """
+    if not soporta_busqueda(conexion):
+        return
+    for nombre in TRIGGERS:
+        conexion.exec_driver_sql(f"DROP TRIGGER IF EXISTS {nombre}")
+    for nombre in TABLAS:
+        conexion.exec_driver_sql(f"DROP TABLE IF EXISTS {nombre}")
+    conexion.exec_driver_sql("DROP TABLE IF EXISTS busqueda_claves")
+
+
+def reconstruir(conexion: Connection) -> None:
+    """
+    Vuelve a llenar el índice a partir de las tablas del catálogo y lo compacta.
+
+    Args:
+        conexion (Connection): Conexión con la base de datos, dentro de una transacción.
+    """
+    if not soporta_busqueda(conexion):
+        return
+    for sentencia in _RECONSTRUIR:
+        conexion.exec_driver_sql(sentencia)
+    for nombre in TABLAS:
+        conexion.exec_driver_sql(f"INSERT INTO {nombre} ({nombre}) VALUES ('optimize')")
+
+
+def crear_con_tablas(target, connection: Connection, **kw) -> None:
+    """Manejador del evento `after_create` de los metadatos: instala el índice tras `create_all`."""
+    instalar(connection)
+
+
+def expresion_fts(texto: str, columnas: Iterable[str] = ()) -> Optional[str]:
+    """
+    Convierte el texto introducido por el usuario en una consulta FTS5: cada palabra
+    como prefijo y todas obligatorias. La sintaxis FTS5 del texto se descarta.
+
+    Args:
+        texto (str): Texto a buscar.
+        columnas (Iterable[str]): Columnas a las que se limita la búsqueda; todas si se omite.
+
+    Returns:
+        Optional[str]: La consulta, o None si el texto no tiene ninguna palabra.
+    """
+    palabras = re.findall(r"\w+", texto or "")
+    if not palabras:
+        return None
+    expresion = " ".join(f'"{palabra}"*' for palabra in palabras)
+    columnas = list(columnas)
+    return f"{{{' '.join(columnas)}}} : ({expresion})" if columnas else expresion
+
+
+def coincidencias(tabla: sa.Table, expresion: str) -> sa.Select:
+    """
+    Args:
+        tabla (sa.Table): Tabla FTS5 en la que buscar.
+        expresion (str): Consulta FTS5, como la de `expresion_fts`.
+
+    Returns:
+        sa.Select: Consulta con el 'id' de cada fila coincidente y su 'rango' BM25
+            (menor es más relevante).
+    """
+    referencia = sa.literal_column(tabla.name)
+    return (
+        sa.select(tabla.c.id, sa.func.bm25(referencia, *PESOS[tabla.name]).label("rango"))
+        .select_from(tabla)
+        .where(referencia.op("MATCH")(expresion))
+    )
@@ -0,0 +1,126 @@
+"""
+Conversión de las filas del ORM a entidades del dominio.
+
+Las listas de IDs relacionados (autores de un libro, libros de un autor o de una
+serie) se cargan con una consulta por página de resultados, no por fila, y las
+entidades se construyen con `model_construct`: los datos ya se validaron al guardarse.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.domain.entities import Autor, Libro, Serie
+from app.infrastructure.database.models.autor_model import AutorModel
+from app.infrastructure.database.models.libro_model import LibroModel, libros_autores
+from app.infrastructure.database.models.serie_model import SerieModel
+
+# IDs por consulta IN, por debajo del límite de parámetros de SQLite
+LOTE_IDS = 500
+
+
+def _agrupar(session, clave, valor, ids: Iterable[UUID]) -> Dict[UUID, List[UUID]]:
+    grupos: Dict[UUID, List[UUID]] = defaultdict(list)
+    ids = list(dict.fromkeys(ids))
+    for inicio in range(0, len(ids), LOTE_IDS):
+        filas = session.execute(select(clave, valor).where(clave.in_(ids[inicio:inicio + LOTE_IDS])))
+        for k, v in filas:
+            grupos[k].append(v)
+    return grupos
+
+
+def libro_a_entidad(modelo: LibroModel, autores: List[UUID]) -> Libro:
+    """
+    Args:
+        modelo (LibroModel): La fila del libro.
+        autores (List[UUID]): Los IDs de sus autores.
+
+    Returns:
+        Libro: La entidad, sin volver a validarla.
+    """
+    return Libro.model_construct(
+        id=modelo.id,
+        titulo=modelo.titulo,
+        autores=autores,
+        path=modelo.path,
+        formato=modelo.formato,
+        portada_hash=modelo.portada_hash,
+        isbn=modelo.isbn,
+        fecha_publicacion=modelo.fecha_publicacion,
+        editorial=modelo.editorial,
+        serie_id=modelo.serie_id,
+        descripcion=modelo.descripcion,
+        paginas=modelo.paginas,
+        year=modelo.year,
+        hash_parcial=modelo.hash_parcial,
+        hash_contenido=modelo.hash_contenido,
+    )
+
+
+def libros_a_entidades(session, modelos: Sequence[LibroModel]) -> List[Libro]:
+    """
+    Convierte una página de libros, con los IDs de sus autores leídos en una sola consulta.
+
+    Args:
+        session: La sesión de la base de datos.
+        modelos (Sequence[LibroModel]): Las filas de los libros.
+
+    Returns:
+        List[Libro]: Las entidades, en el mismo orden.
+    """
+    autores = _agrupar(session, libros_autores.c.libro_id, libros_autores.c.autor_id, (m.id for m in modelos))
+    return [libro_a_entidad(m, autores.get(m.id, [])) for m in modelos]
+
+
+def autores_a_entidades(session, modelos: Sequence[AutorModel]) -> List[Autor]:
+    """
+    Convierte una página de autores, con los IDs de sus libros leídos en una sola consulta.
+
+    Args:
+        session: La sesión de la base de datos.
+        modelos (Sequence[AutorModel]): Las filas de los autores.
+
+    Returns:
+        List[Autor]: Las entidades, en el mismo orden.
+    """
+    libros = _agrupar(session, libros_autores.c.autor_id, libros_autores.c.libro_id, (m.id for m in modelos))
+    return [
+        Autor.model_construct(
+            id=m.id,
+            nombre=m.nombre,
+            foto_hash=m.foto_hash,
+            biografia=m.biografia,
+            fecha_nacimiento=m.fecha_nacimiento,
+            fecha_muerte=m.fecha_muerte,
+            nacionalidad=m.nacionalidad,
+            redes_sociales=m.redes_sociales,
+            libros=libros.get(m.id, []),
+        )
+        for m in modelos
+    ]
+
+
+def series_a_entidades(session, modelos: Sequence[SerieModel]) -> List[Serie]:
+    """
+    Convierte una página de series, con los IDs de sus libros leídos en una sola consulta.
+
+    Args:
+        session: La sesión de la base de datos.
+        modelos (Sequence[SerieModel]): Las filas de las series.
+
+    Returns:
+        List[Serie]: Las entidades, en el mismo orden.
+    """
+    libros = _agrupar(session, LibroModel.serie_id, LibroModel.id, (m.id for m in modelos))
+    return [
+        Serie.model_construct(
+            id=m.id,
+            nombre=m.nombre,
+            autor_ids=[m.autor_id],
+            libros=libros.get(m.id, []),
+            descripcion=m.descripcion,
+            portada_hash=m.portada_hash,
+        )
+        for m in modelos
+    ]
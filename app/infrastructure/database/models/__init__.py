@@ -1,3 +1,4 @@
+from app.infrastructure.database.models.archivo_escaneado_model import ArchivoEscaneadoModel
 from app.infrastructure.database.models.autor_model import AutorModel
 from app.infrastructure.database.models.libro_model import LibroModel, libros_autores
 from app.infrastructure.database.models.marcador_model import MarcadorModel
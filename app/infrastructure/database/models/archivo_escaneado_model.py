@@ -0,0 +1,21 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import Enum
+
+from app.infrastructure.database.db_config import db
+from app.infrastructure.database.extensions import GUID
+from app.domain.enums import ResultadoEscaneo
+
+class ArchivoEscaneadoModel(db.Model):
+    """Manifiesto del escáner: firma de cada archivo en el último escaneo."""
+    __tablename__ = "archivos_escaneados"
+
+    id = db.Column(GUID(), primary_key=True, default=uuid.uuid4)
+    path = db.Column(db.Text, nullable=False, unique=True)
+    tamano = db.Column(db.BigInteger, nullable=False)
+    mtime_ns = db.Column(db.BigInteger, nullable=False)
+    inodo = db.Column(db.BigInteger, nullable=False)
+    resultado = db.Column(Enum(ResultadoEscaneo, name="resultado_escaneo_enum"), nullable=False)
+    # En las copias (DUPLICADO), el libro del que son copia
+    libro_id = db.Column(GUID(), db.ForeignKey("libros.id", ondelete="SET NULL"), nullable=True, index=True)
+    fecha_escaneo = db.Column(db.DateTime, default=datetime.utcnow)
@@ -7,7 +7,7 @@ class AutorModel(db.Model):
     __tablename__ = "autores"
 
     id = db.Column(GUID(), primary_key=True, default=uuid.uuid4)
-    nombre = db.Column(db.String(255), nullable=False)
+    nombre = db.Column(db.String(255), nullable=False, index=True)
     foto_hash = db.Column(db.String(255), nullable=True)
     biografia = db.Column(db.Text)
     fecha_nacimiento = db.Column(db.Date)
@@ -20,3 +20,4 @@ class AutorModel(db.Model):
         secondary="libros_autores",
         back_populates="autores"
     )
+    series = db.relationship("SerieModel", back_populates="autor")
@@ -10,18 +10,20 @@ class LibroModel(db.Model):
     __tablename__ = "libros"
 
     id = db.Column(GUID(), primary_key=True, default=uuid.uuid4)
-    titulo = db.Column(db.String(255), nullable=False)
-    path = db.Column(db.Text, nullable=False)
+    titulo = db.Column(db.String(255), nullable=False, index=True)
+    path = db.Column(db.Text, nullable=False, unique=True, index=True)
     formato = db.Column(Enum(Formato, name="formato_enum"), nullable=False)
     portada_hash = db.Column(db.String(64), nullable=False)
-    isbn = db.Column(db.String(13))
+    isbn = db.Column(db.String(13), index=True)
     fecha_publicacion = db.Column(db.Date)
     editorial = db.Column(db.String(255))
     descripcion = db.Column(db.Text)
     paginas = db.Column(db.Integer)
     year = db.Column(db.Integer)
+    hash_parcial = db.Column(db.String(64), index=True)
+    hash_contenido = db.Column(db.String(64), index=True)
 
-    serie_id = db.Column(db.Uuid, db.ForeignKey("series.id"), nullable=True)
+    serie_id = db.Column(GUID(), db.ForeignKey("series.id"), nullable=True, index=True)
     serie = db.relationship("SerieModel", back_populates="libros")
 
     autores = db.relationship(
@@ -33,6 +35,8 @@ class LibroModel(db.Model):
 # Tabla intermedia para relación N:M entre libros y autores
 libros_autores = db.Table(
     "libros_autores",
-    db.Column("libro_id", db.Uuid, db.ForeignKey("libros.id"), primary_key=True),
-    db.Column("autor_id", db.Uuid, db.ForeignKey("autores.id"), primary_key=True)
+    db.Column("libro_id", GUID(), db.ForeignKey("libros.id"), primary_key=True),
+    db.Column("autor_id", GUID(), db.ForeignKey("autores.id"), primary_key=True),
+    # La clave primaria ya cubre las búsquedas por libro; este índice, las de por autor
+    db.Index("ix_libros_autores_autor_id", "autor_id")
 )
@@ -5,6 +5,10 @@ import uuid
 
 class MarcadorModel(db.Model):
     __tablename__ = "marcadores"
+    __table_args__ = (
+        # Marcadores de un usuario en un libro, ya ordenados por página
+        db.Index("ix_marcadores_usuario_libro_pagina", "usuario_id", "libro_id", "pagina"),
+    )
 
     id = db.Column(GUID(), primary_key=True, default=uuid.uuid4)
     usuario_id = db.Column(GUID(), db.ForeignKey("usuarios.id"), nullable=False)
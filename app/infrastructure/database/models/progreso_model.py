@@ -8,6 +8,10 @@ from app.domain.enums import Estatus
 
 class ProgresoModel(db.Model):
     __tablename__ = "progresos"
+    __table_args__ = (
+        # Un único progreso por usuario y libro
+        db.Index("ix_progresos_usuario_libro", "usuario_id", "libro_id", unique=True),
+    )
 
     id = db.Column(GUID(), primary_key=True, default=uuid.uuid4)
     usuario_id = db.Column(GUID(), db.ForeignKey("usuarios.id"), nullable=False)
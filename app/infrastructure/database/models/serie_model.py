@@ -1,12 +1,13 @@
 import uuid
 from app.infrastructure.database.db_config import db
+from app.infrastructure.database.extensions import GUID
 
 class SerieModel(db.Model):
     __tablename__ = "series"
 
-    id = db.Column(db.Uuid, primary_key=True, default=uuid.uuid4)
-    autor_id = db.Column(db.Uuid, db.ForeignKey("autores.id"), nullable=False)
-    nombre = db.Column(db.String(255), nullable=False)
+    id = db.Column(GUID(), primary_key=True, default=uuid.uuid4)
+    autor_id = db.Column(GUID(), db.ForeignKey("autores.id"), nullable=False, index=True)
+    nombre = db.Column(db.String(255), nullable=False, index=True)
     descripcion = db.Column(db.Text)
     portada_hash = db.Column(db.String(255))
     
@@ -0,0 +1,64 @@
+"""
+Opciones del engine de SQLAlchemy según el motor de base de datos.
+
+- SQLite en archivo: el perfil de `perfil_sqlite` (WAL, PRAGMA y pool de lectores).
+- PostgreSQL y MariaDB: pool de conexiones configurable (tamaño, desborde, espera,
+  reciclado y comprobación de la conexión antes de usarla, que evita los errores
+  tras un reinicio del servidor o un cierre por inactividad).
+- PostgreSQL con psycopg2: los executemany de UPDATE y DELETE se agrupan con
+  `execute_batch`, además de los INSERT de varias filas (`insertmanyvalues`), en
+  lugar de una ida y vuelta al servidor por fila. psycopg 3 ya los envía en modo
+  pipeline.
+
+Los recorridos completos (`iterar_todos` de los repositorios) usan `yield_per`, que
+en PostgreSQL y MariaDB abre un cursor del lado del servidor: las filas llegan por
+lotes en lugar de cargarse todas en memoria.
+"""
+from typing import Mapping, Optional
+
+from sqlalchemy.engine import make_url
+
+from app.infrastructure.database.perfil_sqlite import PerfilSQLite, es_sqlite_en_archivo
+
+
+def perfil_sqlite(uri: Optional[str], config: Mapping) -> Optional[PerfilSQLite]:
+    """
+    Returns:
+        Optional[PerfilSQLite]: El perfil de SQLite de la configuración, o None si la
+        URI no es de una base de datos SQLite en archivo.
+    """
+    if not es_sqlite_en_archivo(uri):
+        return None
+    return PerfilSQLite.desde_config(config)
+
+
+def opciones_engine(uri: Optional[str], config: Mapping) -> dict:
+    """
+    Opciones de `create_engine` (SQLALCHEMY_ENGINE_OPTIONS) para la URI.
+
+    Args:
+        uri (Optional[str]): URI de la base de datos.
+        config (Mapping): Configuración de Flask con las claves `DB_*` y `SQLITE_*` de AppConfig.
+
+    Returns:
+        dict: Las opciones; vacío para SQLite en memoria.
+    """
+    if not uri:
+        return {}
+    url = make_url(uri)
+    if url.get_backend_name() == "sqlite":
+        perfil = perfil_sqlite(uri, config)
+        return perfil.opciones_engine() if perfil else {}
+
+    opciones = {
+        "pool_size": config.get("DB_POOL_SIZE", 10),
+        "max_overflow": config.get("DB_MAX_OVERFLOW", 20),
+        "pool_timeout": config.get("DB_POOL_TIMEOUT", 30),
+        "pool_recycle": config.get("DB_POOL_RECYCLE", 1800),
+        "pool_pre_ping": config.get("DB_POOL_PRE_PING", True),
+        "insertmanyvalues_page_size": config.get("DB_EXECUTEMANY_PAGE_SIZE", 1000),
+    }
+    if url.get_backend_name() == "postgresql" and url.get_driver_name() == "psycopg2":
+        opciones["executemany_mode"] = "values_plus_batch"
+        opciones["executemany_batch_page_size"] = config.get("DB_EXECUTEMANY_PAGE_SIZE", 1000)
+    return opciones
@@ -0,0 +1,48 @@
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+def paginar(
+    consulta: Query,
+    modelo,
+    ordenes: Dict[str, object],
+    despues_de: Optional[UUID],
+    limite: int,
+    orden: str = "id"
+) -> Query:
+    """
+    Aplica a una consulta la paginación por clave (keyset): ordena por la columna
+    elegida y el ID, y continúa tras la fila `despues_de`. Al no usar OFFSET, cada
+    página cuesta lo mismo esté donde esté del catálogo.
+
+    Args:
+        consulta (Query): Consulta sobre el modelo.
+        modelo: Modelo de la tabla; debe tener columna `id`.
+        ordenes (Dict[str, object]): Columnas (no nulas) por las que se puede ordenar, por nombre.
+        despues_de (Optional[UUID]): ID de la última fila de la página anterior; None para la primera.
+        limite (int): Filas máximas de la página.
+        orden (str): Nombre de la columna de orden.
+
+    Returns:
+        Query: La consulta de la página.
+
+    Raises:
+        ValueError: Si el orden no está permitido o la fila `despues_de` ya no existe.
+    """
+    if orden not in ordenes:
+        raise ValueError(f"Orden no válido: {orden}. Opciones: {', '.join(ordenes)}")
+    columna = ordenes[orden]
+
+    if despues_de is not None:
+        if orden == "id":
+            consulta = consulta.filter(modelo.id > despues_de)
+        else:
+            fila = consulta.session.query(columna).filter(modelo.id == despues_de).first()
+            if fila is None:
+                raise ValueError(f"No existe la fila {despues_de} desde la que continuar")
+            consulta = consulta.filter(or_(columna > fila[0], and_(columna == fila[0], modelo.id > despues_de)))
+
+    criterios = [modelo.id] if orden == "id" else [columna, modelo.id]
+    return consulta.order_by(*criterios).limit(max(1, limite))
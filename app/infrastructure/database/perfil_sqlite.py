@@ -0,0 +1,182 @@
+"""
+Perfil de SQLite para producción.
+
+Con los valores por defecto de SQLite (diario de rollback, synchronous=FULL y sin
+espera ante bloqueos), un escaneo en curso deja fuera a los lectores y dos
+actualizaciones simultáneas fallan con "database is locked". Este perfil:
+
+- Activa el modo WAL: los lectores leen la última versión confirmada mientras el
+  escritor trabaja, sin bloquearse entre sí.
+- Baja `synchronous` a NORMAL: con WAL solo se sincroniza el disco en los
+  checkpoints, y una caída del sistema puede perder la última transacción, pero
+  nunca corromper la base de datos.
+- Amplía la caché de páginas, mapea el archivo en memoria (`mmap_size`) y guarda
+  las tablas temporales de los ORDER BY/GROUP BY grandes en memoria.
+- Fija un `busy_timeout`, para que una conexión espere al bloqueo en lugar de fallar.
+- Serializa las escrituras: SQLite admite un solo escritor, así que las transacciones
+  que escriben esperan su turno en un cerrojo del proceso (sin consumir el reintento
+  de SQLite), mientras las lecturas usan el resto de conexiones del pool.
+"""
+from dataclasses import dataclass
+from typing import List, Optional
+import threading
+import logging
+
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+SYNCHRONOUS = ("OFF", "NORMAL", "FULL", "EXTRA")
+TEMP_STORE = ("DEFAULT", "FILE", "MEMORY")
+
+# Sentencias que abren una transacción de escritura
+ESCRITURAS = ("INSERT", "UPDATE", "DELETE", "REPLACE", "CREATE", "DROP", "ALTER")
+
+# Clave en `info` de la conexión cuando tiene el turno de escritura
+_CLAVE_ESCRITOR = "escritor_sqlite"
+
+
+def es_sqlite_en_archivo(uri: Optional[str]) -> bool:
+    """Indica si la URI es de una base de datos SQLite en disco (no en memoria)."""
+    if not uri:
+        return False
+    url = make_url(uri)
+    return url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:")
+
+
+@dataclass(frozen=True)
+class PerfilSQLite:
+    """
+    Ajustes de SQLite de cada conexión y del pool.
+
+    Attributes:
+        wal (bool): Usar el diario WAL en lugar del de rollback.
+        synchronous (str): OFF, NORMAL, FULL o EXTRA.
+        cache_mb (int): Caché de páginas por conexión, en MB.
+        mmap_mb (int): Parte del archivo mapeada en memoria, en MB (0 = sin mmap).
+        temp_store (str): DEFAULT, FILE o MEMORY.
+        busy_timeout (float): Segundos que se espera a un bloqueo antes de fallar.
+        lectores (int): Conexiones del pool, compartidas por las lecturas.
+        escritor_unico (bool): Serializar las transacciones que escriben.
+    """
+    wal: bool = True
+    synchronous: str = "NORMAL"
+    cache_mb: int = 64
+    mmap_mb: int = 256
+    temp_store: str = "MEMORY"
+    busy_timeout: float = 30
+    lectores: int = 8
+    escritor_unico: bool = True
+
+    def __post_init__(self):
+        if self.synchronous.upper() not in SYNCHRONOUS:
+            raise ValueError(f"synchronous no válido: {self.synchronous}. Opciones: {', '.join(SYNCHRONOUS)}")
+        if self.temp_store.upper() not in TEMP_STORE:
+            raise ValueError(f"temp_store no válido: {self.temp_store}. Opciones: {', '.join(TEMP_STORE)}")
+
+    @classmethod
+    def desde_config(cls, config) -> "PerfilSQLite":
+        """
+        Args:
+            config: Configuración de Flask con las claves `SQLITE_*` de AppConfig.
+
+        Returns:
+            PerfilSQLite: El perfil, con los valores por defecto para las claves que falten.
+        """
+        por_defecto = cls()
+        return cls(
+            wal=config.get("SQLITE_WAL", por_defecto.wal),
+            synchronous=config.get("SQLITE_SYNCHRONOUS", por_defecto.synchronous),
+            cache_mb=config.get("SQLITE_CACHE_MB", por_defecto.cache_mb),
+            mmap_mb=config.get("SQLITE_MMAP_MB", por_defecto.mmap_mb),
+            temp_store=config.get("SQLITE_TEMP_STORE", por_defecto.temp_store),
+            busy_timeout=config.get("SQLITE_BUSY_TIMEOUT", por_defecto.busy_timeout),
+            lectores=config.get("SQLITE_READ_POOL", por_defecto.lectores),
+            escritor_unico=config.get("SQLITE_SINGLE_WRITER", por_defecto.escritor_unico),
+        )
+
+    def pragmas(self) -> List[str]:
+        """Las sentencias PRAGMA que se ejecutan al abrir cada conexión."""
+        return [
+            f"PRAGMA journal_mode={'WAL' if self.wal else 'DELETE'}",
+            f"PRAGMA synchronous={self.synchronous.upper()}",
+            # Valor negativo: tamaño en KiB en lugar de en páginas
+            f"PRAGMA cache_size={-int(self.cache_mb) * 1024}",
+            f"PRAGMA mmap_size={int(self.mmap_mb) * 1024 * 1024}",
+            f"PRAGMA temp_store={self.temp_store.upper()}",
+            f"PRAGMA busy_timeout={int(self.busy_timeout * 1000)}",
+        ]
+
+    def opciones_engine(self) -> dict:
+        """Opciones de `create_engine` (SQLALCHEMY_ENGINE_OPTIONS) del pool de conexiones."""
+        return {
+            "pool_size": max(1, self.lectores),
+            "max_overflow": 0,
+            "pool_timeout": self.busy_timeout,
+            "connect_args": {"timeout": self.busy_timeout},
+        }
+
+
+class EscritorUnico:
+    """
+    Turno de escritura del proceso: una conexión lo toma al ejecutar su primera
+    escritura y lo devuelve al confirmar, deshacer o volver al pool.
+    """
+    def __init__(self, espera: float):
+        self.espera = espera
+        self._cerrojo = threading.Lock()
+
+    def instalar(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._antes_de_ejecutar)
+        event.listen(engine, "commit", self._al_terminar)
+        event.listen(engine, "rollback", self._al_terminar)
+        event.listen(engine.pool, "reset", self._al_devolver)
+        event.listen(engine.pool, "invalidate", self._al_devolver)
+
+    def _antes_de_ejecutar(self, conexion, cursor, sentencia, parametros, contexto, executemany):
+        info = conexion.info
+        if info.get(_CLAVE_ESCRITOR) or not sentencia.lstrip().upper().startswith(ESCRITURAS):
+            return
+        if self._cerrojo.acquire(timeout=self.espera):
+            info[_CLAVE_ESCRITOR] = True
+        else:
+            # SQLite vuelve a esperar con su busy_timeout y, si no, informa del bloqueo
+            logger.warning(f"⏳ Sin turno de escritura tras {self.espera}s; se continúa sin él")
+
+    def _al_terminar(self, conexion):
+        # El evento llega justo antes del COMMIT/ROLLBACK: si otro escritor empieza en
+        # ese instante, lo cubre el busy_timeout
+        self._liberar(conexion.info)
+
+    def _al_devolver(self, conexion_dbapi, registro, estado):
+        self._liberar(registro.info)
+
+    def _liberar(self, info: dict) -> None:
+        if info.pop(_CLAVE_ESCRITOR, False):
+            self._cerrojo.release()
+
+
+def aplicar(engine: Engine, perfil: PerfilSQLite) -> None:
+    """
+    Aplica el perfil a un engine de SQLite: los PRAGMA en cada conexión nueva y, si
+    está activado, el escritor único.
+
+    Args:
+        engine (Engine): El engine, con las opciones de `perfil.opciones_engine()`.
+        perfil (PerfilSQLite): El perfil a aplicar.
+    """
+    pragmas = perfil.pragmas()
+
+    def al_conectar(conexion_dbapi, registro):
+        cursor = conexion_dbapi.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    event.listen(engine, "connect", al_conectar)
+    if perfil.escritor_unico:
+        EscritorUnico(perfil.busy_timeout).instalar(engine)
+    logger.info(f"🗄️ Perfil de SQLite aplicado: {', '.join(p.split(' ', 1)[1] for p in pragmas)}")
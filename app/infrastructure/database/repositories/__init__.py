@@ -1,4 +1,6 @@
+from app.infrastructure.database.repositories.sqlalchemy_archivo_escaneado_repository import SQLAlchemyArchivoEscaneadoRepository
 from app.infrastructure.database.repositories.sqlalchemy_autor_repository import SQLAlchemyAutorRepository
+from app.infrastructure.database.repositories.sqlalchemy_busqueda_repository import SQLAlchemyBusquedaRepository
 from app.infrastructure.database.repositories.sqlalchemy_libro_repository import SQLAlchemyLibroRepository
 from app.infrastructure.database.repositories.sqlalchemy_marcador_repository import SQLAlchemyMarcadorRepository
 from app.infrastructure.database.repositories.sqlalchemy_progreso_repository import SQLAlchemyProgresoRepository
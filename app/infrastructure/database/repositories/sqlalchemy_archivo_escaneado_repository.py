@@ -0,0 +1,106 @@
+from typing import List, Optional
+from uuid import UUID
+import os
+
+from app.domain.entities import ArchivoEscaneado
+from app.domain.repositories import ArchivoEscaneadoRepository
+from app.infrastructure.database.models.archivo_escaneado_model import ArchivoEscaneadoModel
+from app.infrastructure.database.unit_of_work import confirmar
+
+class SQLAlchemyArchivoEscaneadoRepository(ArchivoEscaneadoRepository):
+    def __init__(self, session):
+        self.session = session
+
+    def guardar(self, archivo: ArchivoEscaneado) -> None:
+        """
+        Guarda o actualiza la entrada del manifiesto de un archivo.
+
+        Args:
+            archivo (ArchivoEscaneado): La entrada a guardar.
+        """
+        modelo = self.session.query(ArchivoEscaneadoModel).filter_by(path=archivo.path).first()
+        if not modelo:
+            modelo = ArchivoEscaneadoModel(path=archivo.path)
+            self.session.add(modelo)
+
+        modelo.tamano = archivo.tamano
+        modelo.mtime_ns = archivo.mtime_ns
+        modelo.inodo = archivo.inodo
+        modelo.resultado = archivo.resultado
+        modelo.libro_id = archivo.libro_id
+        modelo.fecha_escaneo = archivo.fecha_escaneo
+        confirmar(self.session)
+
+    def obtener_por_path(self, path: str) -> Optional[ArchivoEscaneado]:
+        """
+        Obtiene la entrada del manifiesto de un archivo.
+
+        Args:
+            path (str): La ruta del archivo.
+
+        Returns:
+            Optional[ArchivoEscaneado]: La entrada encontrada o None si el archivo no se ha escaneado.
+        """
+        modelo = self.session.query(ArchivoEscaneadoModel).filter_by(path=path).first()
+        return self._a_entidad(modelo) if modelo else None
+
+    def eliminar_por_path(self, path: str) -> None:
+        """
+        Elimina la entrada del manifiesto de un archivo.
+
+        Args:
+            path (str): La ruta del archivo.
+        """
+        self.session.query(ArchivoEscaneadoModel).filter_by(path=path).delete()
+        confirmar(self.session)
+
+    def listar_por_prefijo(self, prefijo: str) -> List[ArchivoEscaneado]:
+        """
+        Obtiene las entradas de los archivos contenidos en un directorio.
+
+        Args:
+            prefijo (str): La ruta del directorio.
+
+        Returns:
+            List[ArchivoEscaneado]: Las entradas cuya ruta está dentro del directorio.
+        """
+        resultados = (
+            self.session.query(ArchivoEscaneadoModel)
+            .filter(ArchivoEscaneadoModel.path.startswith(prefijo.rstrip(os.sep) + os.sep, autoescape=True))
+            .all()
+        )
+        return [self._a_entidad(r) for r in resultados]
+
+    def listar_por_libro(self, libro_id: UUID) -> List[ArchivoEscaneado]:
+        """
+        Obtiene las entradas de los archivos de un libro: el suyo y sus copias.
+
+        Args:
+            libro_id (UUID): El ID del libro.
+
+        Returns:
+            List[ArchivoEscaneado]: Las entradas que apuntan al libro.
+        """
+        resultados = self.session.query(ArchivoEscaneadoModel).filter_by(libro_id=libro_id).all()
+        return [self._a_entidad(r) for r in resultados]
+
+    def listar_todos(self) -> List[ArchivoEscaneado]:
+        """
+        Obtiene el manifiesto completo.
+
+        Returns:
+            List[ArchivoEscaneado]: Todas las entradas del manifiesto.
+        """
+        resultados = self.session.query(ArchivoEscaneadoModel).all()
+        return [self._a_entidad(r) for r in resultados]
+
+    def _a_entidad(self, modelo: ArchivoEscaneadoModel) -> ArchivoEscaneado:
+        return ArchivoEscaneado(
+            path=modelo.path,
+            tamano=modelo.tamano,
+            mtime_ns=modelo.mtime_ns,
+            inodo=modelo.inodo,
+            resultado=modelo.resultado,
+            libro_id=modelo.libro_id,
+            fecha_escaneo=modelo.fecha_escaneo
+        )
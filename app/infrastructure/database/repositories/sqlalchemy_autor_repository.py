@@ -1,12 +1,20 @@
 from uuid import UUID
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import insert, select
 
-from domain.entities.autor import Autor
-from domain.repositories.autor_repository import AutorRepository
-from infrastructure.database.models.autor_model import AutorModel
+from app.domain.entities.autor import Autor
+from app.domain.repositories.autor_repository import AutorRepository
+from app.infrastructure.database.models.autor_model import AutorModel
+from app.infrastructure.database.paginacion import paginar
+from app.infrastructure.database.mappers import autores_a_entidades
+from app.infrastructure.database.unit_of_work import confirmar, en_unidad_de_trabajo
+from app.infrastructure.database.indice_busqueda import autores_fts, coincidencias, expresion_fts, soporta_busqueda
 
 class SQLAlchemyAutorRepository(AutorRepository):
+    # Columnas por las que se puede ordenar al paginar
+    ORDENES = {"id": AutorModel.id, "nombre": AutorModel.nombre}
+
     def __init__(self, session):
         self.session = session
 
@@ -17,19 +25,32 @@ class SQLAlchemyAutorRepository(AutorRepository):
         Args:
             autor (Autor): El autor a guardar.
         """
-        modelo = AutorModel(
-            id=autor.id,
-            nombre=autor.nombre,
-            foto_path=autor.foto_hash,
-            biografia=autor.biografia,
-            fecha_nacimiento=autor.fecha_nacimiento,
-            fecha_muerte=autor.fecha_muerte,
-            nacionalidad=autor.nacionalidad,
-            redes_sociales=autor.redes_sociales,
-            libros=autor.libros
-        )
-        self.session.add(modelo)
-        self.session.commit()
+        self.guardar_lote([autor])
+
+    def guardar_lote(self, autores: List[Autor]) -> None:
+        """
+        Guarda varios autores con una inserción múltiple, en una sola transacción.
+
+        Args:
+            autores (List[Autor]): Los autores a guardar.
+        """
+        if not autores:
+            return
+
+        self.session.execute(insert(AutorModel), [
+            {
+                "id": autor.id,
+                "nombre": autor.nombre,
+                "foto_hash": autor.foto_hash,
+                "biografia": autor.biografia,
+                "fecha_nacimiento": autor.fecha_nacimiento,
+                "fecha_muerte": autor.fecha_muerte,
+                "nacionalidad": autor.nacionalidad,
+                "redes_sociales": autor.redes_sociales
+            }
+            for autor in autores
+        ])
+        confirmar(self.session)
 
     def obtener_por_id(self, id: UUID) -> Optional[Autor]:
         """
@@ -42,11 +63,12 @@ class SQLAlchemyAutorRepository(AutorRepository):
             Optional[Autor]: El autor encontrado o None si no se encuentra.
         """
         modelo = self.session.get(AutorModel, id)
-        return Autor(**modelo.__dict__) if modelo else None
+        return autores_a_entidades(self.session, [modelo])[0] if modelo else None
 
     def buscar_por_nombre(self, nombre: str) -> List[Autor]:
         """
-        Busca autores por nombre.
+        Busca autores por las palabras (o prefijos) de su nombre, sin distinguir
+        mayúsculas ni acentos, ordenados por relevancia.
 
         Args:
             nombre (str): El nombre del autor.
@@ -54,12 +76,35 @@ class SQLAlchemyAutorRepository(AutorRepository):
         Returns:
             List[Autor]: Una lista de autores que coinciden con el nombre.
         """
+        if not soporta_busqueda(self.session):
+            resultados = (
+                self.session.query(AutorModel)
+                .filter(AutorModel.nombre.ilike(f"%{nombre}%"))
+                .all()
+            )
+            return autores_a_entidades(self.session, resultados)
+
+        expresion = expresion_fts(nombre)
+        if expresion is None:
+            return []
+        encontrados = coincidencias(autores_fts, expresion).subquery()
         resultados = (
             self.session.query(AutorModel)
-            .filter(AutorModel.nombre.ilike(f"%{nombre}%"))
+            .join(encontrados, encontrados.c.id == AutorModel.id)
+            .order_by(encontrados.c.rango)
             .all()
         )
-        return [Autor(**r.__dict__) for r in resultados]
+        return autores_a_entidades(self.session, resultados)
+
+    def listar_nombres(self) -> List[Dict]:
+        """
+        Obtiene el ID y el nombre de todos los autores, sin cargar el resto de columnas.
+
+        Returns:
+            List[Dict]: Diccionarios con 'id' y 'nombre'.
+        """
+        resultados = self.session.query(AutorModel.id, AutorModel.nombre).all()
+        return [{"id": r.id, "nombre": r.nombre} for r in resultados]
 
     def listar_todos(self) -> List[Autor]:
         """
@@ -69,7 +114,28 @@ class SQLAlchemyAutorRepository(AutorRepository):
             List[Autor]: Una lista de todos los autores.
         """
         resultados = self.session.query(AutorModel).all()
-        return [Autor(**r.__dict__) for r in resultados]
+        return autores_a_entidades(self.session, resultados)
+
+    def actualizar_campos(self, id: UUID, campos: Dict) -> bool:
+        """
+        Actualiza en el sitio algunas columnas de un autor.
+
+        Args:
+            id (UUID): El ID del autor.
+            campos (Dict): Columnas y sus nuevos valores.
+
+        Returns:
+            bool: True si el autor existe, False en caso contrario.
+        """
+        try:
+            actualizados = self.session.query(AutorModel).filter_by(id=id).update(campos)
+            confirmar(self.session)
+        except Exception:
+            if en_unidad_de_trabajo(self.session):
+                raise
+            self.session.rollback()
+            raise
+        return actualizados > 0
 
     def eliminar(self, id: UUID) -> Optional[bool]:
         """
@@ -80,10 +146,42 @@ class SQLAlchemyAutorRepository(AutorRepository):
         """
         try:
             self.session.query(AutorModel).filter_by(id=id).delete()
-            self.session.commit()
+            confirmar(self.session)
             return True
         except Exception as e:
+            if en_unidad_de_trabajo(self.session):
+                raise
             self.session.rollback()
             return False
-        finally:
-            self.session.close()
\ No newline at end of file
+
+    def listar_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Autor]:
+        """
+        Obtiene una página de autores, paginando por clave en lugar de por desplazamiento.
+
+        Args:
+            despues_de (Optional[UUID]): ID del último autor de la página anterior; None para la primera.
+            limite (int): Autores máximos de la página.
+            orden (str): Columna de orden: 'id' o 'nombre'.
+
+        Returns:
+            List[Autor]: Los autores de la página.
+        """
+        resultados = paginar(self.session.query(AutorModel), AutorModel, self.ORDENES, despues_de, limite, orden).all()
+        return autores_a_entidades(self.session, resultados)
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Autor]:
+        """
+        Recorre todos los autores sin cargarlos a la vez en memoria: las filas se leen
+        del cursor por lotes (con un cursor de servidor en PostgreSQL).
+
+        Args:
+            tamano_lote (int): Filas leídas de cada vez.
+
+        Yields:
+            Autor: Cada autor, por orden de ID.
+        """
+        resultado = self.session.execute(
+            select(AutorModel).order_by(AutorModel.id).execution_options(yield_per=tamano_lote)
+        ).scalars()
+        for modelos in resultado.partitions():
+            yield from autores_a_entidades(self.session, modelos)
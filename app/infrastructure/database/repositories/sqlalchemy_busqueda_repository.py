@@ -0,0 +1,108 @@
+from typing import List, Optional
+
+import sqlalchemy as sa
+
+from app.domain.entities import ResultadoBusqueda
+from app.domain.enums import TipoResultado
+from app.domain.repositories import BusquedaRepository
+from app.infrastructure.database.models.libro_model import LibroModel
+from app.infrastructure.database.models.autor_model import AutorModel
+from app.infrastructure.database.models.serie_model import SerieModel
+from app.infrastructure.database.unit_of_work import confirmar
+from app.infrastructure.database.indice_busqueda import (
+    autores_fts,
+    coincidencias,
+    expresion_fts,
+    libros_fts,
+    reconstruir,
+    series_fts,
+    soporta_busqueda,
+)
+
+# Tabla FTS5 y columna con el texto a mostrar de cada tipo de resultado
+FUENTES = {
+    TipoResultado.LIBRO: (libros_fts, libros_fts.c.titulo),
+    TipoResultado.AUTOR: (autores_fts, autores_fts.c.nombre),
+    TipoResultado.SERIE: (series_fts, series_fts.c.nombre),
+}
+
+# Modelo y columna con el texto de cada tipo, para las bases de datos sin FTS5
+MODELOS = {
+    TipoResultado.LIBRO: (LibroModel, LibroModel.titulo),
+    TipoResultado.AUTOR: (AutorModel, AutorModel.nombre),
+    TipoResultado.SERIE: (SerieModel, SerieModel.nombre),
+}
+
+class SQLAlchemyBusquedaRepository(BusquedaRepository):
+    def __init__(self, session):
+        self.session = session
+
+    def buscar(self, consulta: str, tipos: Optional[List[TipoResultado]] = None, limite: int = 20) -> List[ResultadoBusqueda]:
+        """
+        Busca a la vez libros (por título, autores, serie y descripción), autores y series.
+
+        Args:
+            consulta (str): Palabras a buscar; la última puede estar incompleta.
+            tipos (Optional[List[TipoResultado]]): Tipos de resultado; todos si se omite.
+            limite (int): Resultados máximos.
+
+        Returns:
+            List[ResultadoBusqueda]: Los resultados agrupados por tipo, en el orden de `tipos`,
+            y dentro de cada tipo del más al menos relevante. La relevancia solo es comparable
+            entre resultados del mismo tipo.
+        """
+        tipos = tipos or list(TipoResultado)
+        if not soporta_busqueda(self.session):
+            return self._buscar_sin_indice(consulta, tipos, limite)
+
+        expresion = expresion_fts(consulta)
+        if expresion is None:
+            return []
+
+        # BM25 depende de las estadísticas de cada tabla FTS5, así que los rangos de tipos
+        # distintos no se comparan: cada tipo se ordena por separado y el límite se reparte
+        # tomando por turnos el mejor resultado pendiente de cada uno
+        consultas = []
+        for orden, tipo in enumerate(tipos):
+            tabla, texto = FUENTES[tipo]
+            encontrados = coincidencias(tabla, expresion).add_columns(texto.label("texto")).subquery()
+            consultas.append(sa.select(
+                sa.literal(tipo.value).label("tipo"),
+                sa.literal(orden).label("orden"),
+                encontrados.c.id,
+                encontrados.c.texto,
+                encontrados.c.rango,
+                sa.func.row_number().over(order_by=encontrados.c.rango).label("puesto"),
+            ))
+
+        union = sa.union_all(*consultas).subquery()
+        filas = self.session.execute(
+            sa.select(union.c.tipo, union.c.orden, union.c.id, union.c.texto, union.c.rango, union.c.puesto)
+            .order_by(union.c.puesto, union.c.orden)
+            .limit(limite)
+        ).all()
+        return [
+            ResultadoBusqueda(tipo=TipoResultado(f.tipo), id=f.id, titulo=f.texto, relevancia=-f.rango)
+            for f in sorted(filas, key=lambda f: (f.orden, f.puesto))
+        ]
+
+    def _buscar_sin_indice(self, consulta: str, tipos: List[TipoResultado], limite: int) -> List[ResultadoBusqueda]:
+        consulta = (consulta or "").strip()
+        if not consulta:
+            return []
+
+        resultados = []
+        for tipo in tipos:
+            modelo, texto = MODELOS[tipo]
+            filas = self.session.query(modelo.id, texto).filter(texto.ilike(f"%{consulta}%")).limit(limite).all()
+            resultados.extend(
+                ResultadoBusqueda(tipo=tipo, id=id, titulo=titulo, relevancia=0.0) for id, titulo in filas
+            )
+        return resultados[:limite]
+
+    def reconstruir(self) -> None:
+        """
+        Vuelve a generar el índice de búsqueda a partir del catálogo.
+        """
+        reconstruir(self.session.connection())
+        confirmar(self.session)
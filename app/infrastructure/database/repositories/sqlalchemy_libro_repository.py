@@ -1,11 +1,22 @@
-from domain.entities.libro import Libro
-from domain.repositories.libro_repository import LibroRepository
-from infrastructure.database.models.libro_model import LibroModel, libros_autores
+from app.domain.entities.libro import Libro
+from app.domain.repositories.libro_repository import LibroRepository
+from app.infrastructure.database.models.libro_model import LibroModel, libros_autores
+from app.infrastructure.database.models.progreso_model import ProgresoModel
+from app.infrastructure.database.models.marcador_model import MarcadorModel
+from app.infrastructure.database.models.archivo_escaneado_model import ArchivoEscaneadoModel
+from app.infrastructure.database.paginacion import paginar
+from app.infrastructure.database.mappers import libros_a_entidades
+from app.infrastructure.database.unit_of_work import confirmar, en_unidad_de_trabajo
+from app.infrastructure.database.indice_busqueda import coincidencias, expresion_fts, libros_fts, soporta_busqueda
 
 from uuid import UUID
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
+from sqlalchemy import insert, select
 
 class SQLAlchemyLibroRepository(LibroRepository):
+    # Columnas por las que se puede ordenar al paginar
+    ORDENES = {"id": LibroModel.id, "titulo": LibroModel.titulo}
+
     def __init__(self, session):
         self.session = session
 
@@ -16,30 +27,82 @@ class SQLAlchemyLibroRepository(LibroRepository):
         Args:
             libro (Libro): El libro a guardar.
         """
-        modelo = LibroModel(
-            id=libro.id,
-            titulo=libro.titulo,
-            path=libro.path,
-            formato=libro.formato.value,
-            portada_hash=libro.portada_hash,
-            isbn=libro.isbn,
-            fecha_publicacion=libro.fecha_publicacion,
-            editorial=libro.editorial,
-            descripcion=libro.descripcion,
-            paginas=libro.paginas,
-            year=libro.year,
-            serie_id=libro.serie_id
-        )
-        self.session.add(modelo)
-        self.session.commit()
+        self.guardar_lote([libro])
+
+    def guardar_lote(self, libros: List[Libro]) -> None:
+        """
+        Guarda varios libros y su relación con los autores con una inserción
+        múltiple por tabla, en una sola transacción.
+
+        Args:
+            libros (List[Libro]): Los libros a guardar.
+        """
+        if not libros:
+            return
+
+        self.session.execute(insert(LibroModel), [
+            {
+                "id": libro.id,
+                "titulo": libro.titulo,
+                "path": libro.path,
+                "formato": libro.formato,
+                "portada_hash": libro.portada_hash,
+                "isbn": libro.isbn,
+                "fecha_publicacion": libro.fecha_publicacion,
+                "editorial": libro.editorial,
+                "descripcion": libro.descripcion,
+                "paginas": libro.paginas,
+                "year": libro.year,
+                "serie_id": libro.serie_id,
+                "hash_parcial": libro.hash_parcial,
+                "hash_contenido": libro.hash_contenido
+            }
+            for libro in libros
+        ])
 
         # Relación autores (N:M)
-        for autor_id in libro.autores:
-            self.session.execute(libros_autores.insert().values(
-                libro_id=libro.id,
-                autor_id=autor_id
-            ))
-        self.session.commit()
+        relaciones = [
+            {"libro_id": libro.id, "autor_id": autor_id}
+            for libro in libros
+            for autor_id in dict.fromkeys(libro.autores)
+        ]
+        if relaciones:
+            self.session.execute(libros_autores.insert(), relaciones)
+        confirmar(self.session)
+
+    def actualizar(self, libro: Libro) -> bool:
+        """
+        Sustituye en el sitio los datos de un libro y su relación con los autores,
+        conservando su ID (y con él sus progresos y marcadores).
+
+        Args:
+            libro (Libro): El libro, con el ID del que se actualiza.
+
+        Returns:
+            bool: True si el libro existe, False en caso contrario.
+        """
+        actualizados = self.session.query(LibroModel).filter_by(id=libro.id).update({
+            "titulo": libro.titulo,
+            "path": libro.path,
+            "formato": libro.formato,
+            "portada_hash": libro.portada_hash,
+            "isbn": libro.isbn,
+            "fecha_publicacion": libro.fecha_publicacion,
+            "editorial": libro.editorial,
+            "descripcion": libro.descripcion,
+            "paginas": libro.paginas,
+            "year": libro.year,
+            "serie_id": libro.serie_id,
+            "hash_parcial": libro.hash_parcial,
+            "hash_contenido": libro.hash_contenido
+        })
+        if actualizados:
+            self.session.execute(libros_autores.delete().where(libros_autores.c.libro_id == libro.id))
+            relaciones = [{"libro_id": libro.id, "autor_id": autor_id} for autor_id in dict.fromkeys(libro.autores)]
+            if relaciones:
+                self.session.execute(libros_autores.insert(), relaciones)
+        confirmar(self.session)
+        return actualizados > 0
 
     def obtener_por_id(self, id: UUID) -> Optional[Libro]:
         """
@@ -52,7 +115,7 @@ class SQLAlchemyLibroRepository(LibroRepository):
             Optional[Libro]: El libro encontrado o None si no se encuentra.
         """
         modelo = self.session.get(LibroModel, id)
-        return Libro(**modelo.__dict__) if modelo else None
+        return libros_a_entidades(self.session, [modelo])[0] if modelo else None
 
     def buscar_por_autor(self, autor_id: UUID) -> List[Libro]:
         """
@@ -70,7 +133,7 @@ class SQLAlchemyLibroRepository(LibroRepository):
             .filter(libros_autores.c.autor_id == autor_id)
             .all()
         )
-        return [Libro(**r.__dict__) for r in resultados]
+        return libros_a_entidades(self.session, resultados)
 
     def buscar_por_serie(self, serie_id: UUID) -> List[Libro]:
         """
@@ -87,24 +150,83 @@ class SQLAlchemyLibroRepository(LibroRepository):
             .filter_by(serie_id=serie_id)
             .all()
         )
-        return [Libro(**r.__dict__) for r in resultados]
+        return libros_a_entidades(self.session, resultados)
+
+    def listar_huellas(self) -> List[Dict]:
+        """
+        Obtiene la ruta y las huellas de contenido de los libros que las tienen.
+
+        Returns:
+            List[Dict]: Diccionarios con 'id', 'path', 'hash_parcial' y 'hash_contenido'.
+        """
+        resultados = (
+            self.session.query(LibroModel.id, LibroModel.path, LibroModel.hash_parcial, LibroModel.hash_contenido)
+            .filter(LibroModel.hash_parcial.isnot(None))
+            .all()
+        )
+        return [
+            {"id": r.id, "path": r.path, "hash_parcial": r.hash_parcial, "hash_contenido": r.hash_contenido}
+            for r in resultados
+        ]
+
+    def actualizar_path(self, id: UUID, path: str) -> None:
+        """
+        Actualiza la ruta del archivo de un libro.
+
+        Args:
+            id (UUID): El ID del libro.
+            path (str): La nueva ruta del archivo.
+        """
+        self.session.query(LibroModel).filter_by(id=id).update({"path": path})
+        confirmar(self.session)
+
+    def actualizar_campos(self, id: UUID, campos: Dict) -> bool:
+        """
+        Actualiza en el sitio algunas columnas de un libro.
+
+        Args:
+            id (UUID): El ID del libro.
+            campos (Dict): Columnas y sus nuevos valores.
+
+        Returns:
+            bool: True si el libro existe, False en caso contrario.
+        """
+        try:
+            actualizados = self.session.query(LibroModel).filter_by(id=id).update(campos)
+            confirmar(self.session)
+        except Exception:
+            if en_unidad_de_trabajo(self.session):
+                raise
+            self.session.rollback()
+            raise
+        return actualizados > 0
 
     def eliminar(self, id: UUID) -> Optional[bool]:
         """
-        Elimina un libro por su ID.
+        Elimina un libro por su ID, junto con su relación con los autores y los progresos
+        y marcadores de lectura que apuntan a él.
 
         Args:
             id (UUID): El ID del libro.
         """
         try:
+            # El borrado masivo no pasa por las relaciones del ORM y SQLite no aplica las
+            # claves foráneas: las filas que dependen del libro se borran o desvinculan
+            # aparte, en la misma transacción, antes que el libro
+            self.session.execute(libros_autores.delete().where(libros_autores.c.libro_id == id))
+            self.session.query(ProgresoModel).filter_by(libro_id=id).delete(synchronize_session=False)
+            self.session.query(MarcadorModel).filter_by(libro_id=id).delete(synchronize_session=False)
+            self.session.query(ArchivoEscaneadoModel).filter_by(libro_id=id).update(
+                {ArchivoEscaneadoModel.libro_id: None}, synchronize_session=False
+            )
             self.session.query(LibroModel).filter_by(id=id).delete()
-            self.session.commit()
+            confirmar(self.session)
             return True
-        except Exception as e:
+        except Exception:
+            if en_unidad_de_trabajo(self.session):
+                raise
             self.session.rollback()
             return False
-        finally:
-            self.session.close()
 
     def listar_todos(self) -> List[Libro]:
         """
@@ -114,11 +236,12 @@ class SQLAlchemyLibroRepository(LibroRepository):
             List[Libro]: Una lista de todos los libros.
         """
         resultados = self.session.query(LibroModel).all()
-        return [Libro(**r.__dict__) for r in resultados]
+        return libros_a_entidades(self.session, resultados)
     
     def buscar_por_titulo(self, titulo: str) -> List[Libro]:
         """
-        Busca libros por título.
+        Busca libros por las palabras (o prefijos) de su título, sin distinguir
+        mayúsculas ni acentos, ordenados por relevancia.
 
         Args:
             titulo (str): El título del libro.
@@ -126,9 +249,54 @@ class SQLAlchemyLibroRepository(LibroRepository):
         Returns:
             List[Libro]: Una lista de libros que coinciden con el título.
         """
+        if not soporta_busqueda(self.session):
+            resultados = (
+                self.session.query(LibroModel)
+                .filter(LibroModel.titulo.ilike(f"%{titulo}%"))
+                .all()
+            )
+            return libros_a_entidades(self.session, resultados)
+
+        expresion = expresion_fts(titulo, columnas=["titulo"])
+        if expresion is None:
+            return []
+        encontrados = coincidencias(libros_fts, expresion).subquery()
         resultados = (
             self.session.query(LibroModel)
-            .filter(LibroModel.titulo.ilike(f"%{titulo}%"))
+            .join(encontrados, encontrados.c.id == LibroModel.id)
+            .order_by(encontrados.c.rango)
             .all()
         )
-        return [Libro(**r.__dict__) for r in resultados]
+        return libros_a_entidades(self.session, resultados)
+
+    def listar_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Libro]:
+        """
+        Obtiene una página de libros, paginando por clave en lugar de por desplazamiento.
+
+        Args:
+            despues_de (Optional[UUID]): ID del último libro de la página anterior; None para la primera.
+            limite (int): Libros máximos de la página.
+            orden (str): Columna de orden: 'id' o 'titulo'.
+
+        Returns:
+            List[Libro]: Los libros de la página.
+        """
+        resultados = paginar(self.session.query(LibroModel), LibroModel, self.ORDENES, despues_de, limite, orden).all()
+        return libros_a_entidades(self.session, resultados)
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Libro]:
+        """
+        Recorre todos los libros sin cargarlos a la vez en memoria: las filas se leen
+        del cursor por lotes (con un cursor de servidor en PostgreSQL).
+
+        Args:
+            tamano_lote (int): Filas leídas de cada vez.
+
+        Yields:
+            Libro: Cada libro, por orden de ID.
+        """
+        resultado = self.session.execute(
+            select(LibroModel).order_by(LibroModel.id).execution_options(yield_per=tamano_lote)
+        ).scalars()
+        for modelos in resultado.partitions():
+            yield from libros_a_entidades(self.session, modelos)
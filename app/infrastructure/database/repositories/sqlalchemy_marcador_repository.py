@@ -1,12 +1,19 @@
 from uuid import UUID
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime
 
-from domain.entities import Marcador
-from domain.repositories import MarcadorRepository
-from infrastructure.database.models.marcador_model import MarcadorModel
+from app.domain.entities import Marcador
+from app.domain.repositories import MarcadorRepository
+from app.infrastructure.database.models.marcador_model import MarcadorModel
+from app.infrastructure.database.paginacion import paginar
 
 class SQLAlchemyMarcadorRepository(MarcadorRepository):
+    # Columnas por las que se puede ordenar al paginar
+    ORDENES = {"id": MarcadorModel.id}
+
+    # Orden de los marcadores de un usuario en un libro (índice ix_marcadores_usuario_libro_pagina)
+    ORDENES_POR_LIBRO = {"pagina": MarcadorModel.pagina}
+
     def __init__(self, session):
         self.session = session
 
@@ -59,6 +66,38 @@ class SQLAlchemyMarcadorRepository(MarcadorRepository):
         )
         return [Marcador(**r.__dict__) for r in resultados]
 
+    def obtener_por_usuario_y_libro(
+        self,
+        usuario_id: UUID,
+        libro_id: UUID,
+        desde_pagina: Optional[int] = None,
+        hasta_pagina: Optional[int] = None,
+        despues_de: Optional[UUID] = None,
+        limite: int = 100
+    ) -> List[Marcador]:
+        """
+        Obtiene una página de los marcadores de un usuario en un libro, por orden de página
+        del libro y paginando por clave.
+
+        Args:
+            usuario_id (UUID): El ID del usuario.
+            libro_id (UUID): El ID del libro.
+            desde_pagina (Optional[int]): Primera página del libro a incluir.
+            hasta_pagina (Optional[int]): Última página del libro a incluir.
+            despues_de (Optional[UUID]): ID del último marcador de la página anterior; None para la primera.
+            limite (int): Marcadores máximos de la página.
+
+        Returns:
+            List[Marcador]: Los marcadores, ordenados por página.
+        """
+        consulta = self.session.query(MarcadorModel).filter_by(usuario_id=usuario_id, libro_id=libro_id)
+        if desde_pagina is not None:
+            consulta = consulta.filter(MarcadorModel.pagina >= desde_pagina)
+        if hasta_pagina is not None:
+            consulta = consulta.filter(MarcadorModel.pagina <= hasta_pagina)
+        resultados = paginar(consulta, MarcadorModel, self.ORDENES_POR_LIBRO, despues_de, limite, "pagina").all()
+        return [Marcador(**r.__dict__) for r in resultados]
+
     def obtener_por_libro(self, libro_id: UUID) -> List[Marcador]:
         """
         Obtiene marcadores por libro.
@@ -104,4 +143,34 @@ class SQLAlchemyMarcadorRepository(MarcadorRepository):
             self.session.rollback()
             return False
         finally:
-            self.session.close()
\ No newline at end of file
+            self.session.close()
+
+    def listar_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Marcador]:
+        """
+        Obtiene una página de marcadores, paginando por clave en lugar de por desplazamiento.
+
+        Args:
+            despues_de (Optional[UUID]): ID del último marcador de la página anterior; None para la primera.
+            limite (int): Marcadores máximos de la página.
+            orden (str): Columna de orden: 'id'.
+
+        Returns:
+            List[Marcador]: Los marcadores de la página.
+        """
+        resultados = paginar(self.session.query(MarcadorModel), MarcadorModel, self.ORDENES, despues_de, limite, orden).all()
+        return [Marcador(**r.__dict__) for r in resultados]
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Marcador]:
+        """
+        Recorre todos los marcadores sin cargarlos a la vez en memoria: las filas se leen
+        del cursor por lotes (con un cursor de servidor en PostgreSQL).
+
+        Args:
+            tamano_lote (int): Filas leídas de cada vez.
+
+        Yields:
+            Marcador: Cada marcador, por orden de ID.
+        """
+        consulta = self.session.query(MarcadorModel).order_by(MarcadorModel.id).yield_per(tamano_lote)
+        for r in consulta:
+            yield Marcador(**r.__dict__)
@@ -1,33 +1,107 @@
-import uuid
 from uuid import UUID
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime
 
-from domain.entities import Progreso
-from domain.repositories import ProgresoRepository
-from infrastructure.database.models.progreso_model import ProgresoModel
+from sqlalchemy import case, or_
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from app.domain.entities import Progreso
+from app.domain.repositories import ProgresoRepository
+from app.infrastructure.database.models.progreso_model import ProgresoModel
+from app.infrastructure.database.paginacion import paginar
+from app.infrastructure.database.unit_of_work import confirmar, en_unidad_de_trabajo
+
+# Sentencia INSERT con ON CONFLICT de cada dialecto
+INSERT_CON_CONFLICTO = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}
+
+# Columnas que un upsert sobrescribe en el progreso existente
+COLUMNAS_ACTUALIZABLES = ("porcentaje", "estatus", "ultima_fecha")
 
 class SQLAlchemyProgresoRepository(ProgresoRepository):
+    # Columnas por las que se puede ordenar al paginar
+    ORDENES = {"id": ProgresoModel.id}
+
     def __init__(self, session):
         self.session = session
 
     def guardar(self, progreso: Progreso) -> None:
         """
-        Guarda un progreso en la base de datos.
+        Guarda el progreso de un usuario en un libro; si ya existe, lo actualiza.
 
         Args:
             progreso (Progreso): El progreso a guardar.
         """
-        modelo = ProgresoModel(
-            id=uuid.uuid4(),
-            usuario_id=progreso.usuario_id,
-            libro_id=progreso.libro_id,
-            porcentaje=progreso.porcentaje,
-            estatus=progreso.estatus,
-            ultima_fecha=progreso.ultima_fecha
+        self.guardar_lote([progreso])
+
+    def guardar_lote(self, progresos: List[Progreso]) -> None:
+        """
+        Guarda varios progresos con una sola sentencia (upsert por usuario y libro): inserta
+        los nuevos y actualiza los existentes, salvo que el guardado sea más reciente.
+
+        Args:
+            progresos (List[Progreso]): Los progresos, como mucho uno por usuario y libro.
+        """
+        if not progresos:
+            return
+
+        filas = [
+            {
+                "id": p.id,
+                "usuario_id": p.usuario_id,
+                "libro_id": p.libro_id,
+                "porcentaje": p.porcentaje,
+                "estatus": p.estatus,
+                "ultima_fecha": p.ultima_fecha,
+            }
+            for p in progresos
+        ]
+        dialecto = self.session.get_bind().dialect.name
+        try:
+            if dialecto in INSERT_CON_CONFLICTO:
+                insertar = INSERT_CON_CONFLICTO[dialecto](ProgresoModel)
+                sentencia = insertar.on_conflict_do_update(
+                    index_elements=[ProgresoModel.usuario_id, ProgresoModel.libro_id],
+                    set_={columna: insertar.excluded[columna] for columna in COLUMNAS_ACTUALIZABLES},
+                    # Con varios procesos escribiendo, un lote atrasado no pisa un progreso más nuevo
+                    where=or_(
+                        ProgresoModel.ultima_fecha.is_(None),
+                        ProgresoModel.ultima_fecha <= insertar.excluded.ultima_fecha
+                    )
+                )
+                self.session.execute(sentencia, filas)
+            elif dialecto in ("mysql", "mariadb"):
+                insertar = mysql.insert(ProgresoModel)
+                vigente = or_(
+                    ProgresoModel.ultima_fecha.is_(None),
+                    ProgresoModel.ultima_fecha <= insertar.inserted.ultima_fecha
+                )
+                # Sin WHERE en ON DUPLICATE KEY UPDATE, cada columna se condiciona por separado. MySQL
+                # asigna en orden y con los valores ya actualizados: ultima_fecha tiene que ir la última
+                sentencia = insertar.on_duplicate_key_update([
+                    (columna, case((vigente, insertar.inserted[columna]), else_=ProgresoModel.__table__.c[columna]))
+                    for columna in COLUMNAS_ACTUALIZABLES
+                ])
+                self.session.execute(sentencia, filas)
+            else:
+                for fila in filas:
+                    self._guardar_fila(fila)
+            confirmar(self.session)
+        except Exception:
+            if not en_unidad_de_trabajo(self.session):
+                self.session.rollback()
+            raise
+
+    def _guardar_fila(self, fila: dict) -> None:
+        modelo = (
+            self.session.query(ProgresoModel)
+            .filter_by(usuario_id=fila["usuario_id"], libro_id=fila["libro_id"])
+            .first()
         )
-        self.session.add(modelo)
-        self.session.commit()
+        if not modelo:
+            modelo = ProgresoModel(id=fila["id"], usuario_id=fila["usuario_id"], libro_id=fila["libro_id"])
+            self.session.add(modelo)
+        for columna in COLUMNAS_ACTUALIZABLES:
+            setattr(modelo, columna, fila[columna])
 
     def obtener_por_usuario_y_libro(self, usuario_id: UUID, libro_id: UUID) -> Optional[Progreso]:
         """
@@ -109,4 +183,34 @@ class SQLAlchemyProgresoRepository(ProgresoRepository):
             .filter_by(usuario_id=usuario_id)
             .all()
         )
-        return [Progreso(**r.__dict__) for r in resultados]
\ No newline at end of file
+        return [Progreso(**r.__dict__) for r in resultados]
+
+    def listar_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Progreso]:
+        """
+        Obtiene una página de progresos, paginando por clave en lugar de por desplazamiento.
+
+        Args:
+            despues_de (Optional[UUID]): ID del último progreso de la página anterior; None para la primera.
+            limite (int): Progresos máximos de la página.
+            orden (str): Columna de orden: 'id'.
+
+        Returns:
+            List[Progreso]: Los progresos de la página.
+        """
+        resultados = paginar(self.session.query(ProgresoModel), ProgresoModel, self.ORDENES, despues_de, limite, orden).all()
+        return [Progreso(**r.__dict__) for r in resultados]
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Progreso]:
+        """
+        Recorre todos los progresos sin cargarlos a la vez en memoria: las filas se leen
+        del cursor por lotes (con un cursor de servidor en PostgreSQL).
+
+        Args:
+            tamano_lote (int): Filas leídas de cada vez.
+
+        Yields:
+            Progreso: Cada progreso, por orden de ID.
+        """
+        consulta = self.session.query(ProgresoModel).order_by(ProgresoModel.id).yield_per(tamano_lote)
+        for r in consulta:
+            yield Progreso(**r.__dict__)
@@ -1,12 +1,20 @@
-from domain.entities import Serie
-from domain.repositories import SerieRepository
-from infrastructure.database.models.serie_model import SerieModel
-
-from typing import List, Optional
+from app.domain.entities import Serie
+from app.domain.repositories import SerieRepository
+from app.infrastructure.database.models.serie_model import SerieModel
+from app.infrastructure.database.paginacion import paginar
+from app.infrastructure.database.mappers import series_a_entidades
+from app.infrastructure.database.unit_of_work import confirmar
+from app.infrastructure.database.indice_busqueda import coincidencias, expresion_fts, series_fts, soporta_busqueda
+
+from typing import Dict, Iterator, List, Optional
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import insert, select
 from uuid import UUID
 
 class SQLAlchemySerieRepository(SerieRepository):
+    # Columnas por las que se puede ordenar al paginar
+    ORDENES = {"id": SerieModel.id, "nombre": SerieModel.nombre}
+
     def __init__(self, session):
         self.session = session
 
@@ -17,16 +25,30 @@ class SQLAlchemySerieRepository(SerieRepository):
         Args:
             serie (Serie): La serie a guardar.
         """
-        modelo = SerieModel(
-            id=serie.id,
-            nombre=serie.nombre,
-            descripcion=serie.descripcion,
-            portada_hash=serie.portada_hash,
-            autor_id=serie.autor_id,
-            libros=serie.libros
-        )
-        self.session.add(modelo)
-        self.session.commit()
+        self.guardar_lote([serie])
+
+    def guardar_lote(self, series: List[Serie]) -> None:
+        """
+        Guarda varias series con una inserción múltiple, en una sola transacción.
+
+        Args:
+            series (List[Serie]): Las series a guardar.
+        """
+        if not series:
+            return
+
+        self.session.execute(insert(SerieModel), [
+            {
+                "id": serie.id,
+                "nombre": serie.nombre,
+                "descripcion": serie.descripcion,
+                "portada_hash": serie.portada_hash,
+                # El modelo guarda solo el autor principal
+                "autor_id": serie.autor_ids[0] if serie.autor_ids else None
+            }
+            for serie in series
+        ])
+        confirmar(self.session)
 
     def obtener_por_id(self, id: UUID) -> Optional[Serie]:
         """
@@ -39,11 +61,12 @@ class SQLAlchemySerieRepository(SerieRepository):
             Optional[Serie]: La serie encontrada o None si no se encuentra.
         """
         modelo = self.session.get(SerieModel, id)
-        return Serie(**modelo.__dict__) if modelo else None
+        return series_a_entidades(self.session, [modelo])[0] if modelo else None
 
     def buscar_por_nombre(self, nombre: str) -> List[Serie]:
         """
-        Busca series por nombre.
+        Busca series por las palabras (o prefijos) de su nombre, sin distinguir
+        mayúsculas ni acentos, ordenadas por relevancia.
 
         Args:
             nombre (str): El nombre de la serie.
@@ -51,13 +74,36 @@ class SQLAlchemySerieRepository(SerieRepository):
         Returns:
             List[Serie]: Una lista de series que coinciden con el nombre.
         """
+        if not soporta_busqueda(self.session):
+            resultados = (
+                self.session.query(SerieModel)
+                .filter(SerieModel.nombre.ilike(f"%{nombre}%"))
+                .all()
+            )
+            return series_a_entidades(self.session, resultados)
+
+        expresion = expresion_fts(nombre, columnas=["nombre"])
+        if expresion is None:
+            return []
+        encontrados = coincidencias(series_fts, expresion).subquery()
         resultados = (
             self.session.query(SerieModel)
-            .filter(SerieModel.nombre.ilike(f"%{nombre}%"))
+            .join(encontrados, encontrados.c.id == SerieModel.id)
+            .order_by(encontrados.c.rango)
             .all()
         )
-        return [Serie(**r.__dict__) for r in resultados]
+        return series_a_entidades(self.session, resultados)
     
+    def listar_nombres(self) -> List[Dict]:
+        """
+        Obtiene el ID y el nombre de todas las series, sin cargar el resto de columnas.
+
+        Returns:
+            List[Dict]: Diccionarios con 'id' y 'nombre'.
+        """
+        resultados = self.session.query(SerieModel.id, SerieModel.nombre).all()
+        return [{"id": r.id, "nombre": r.nombre} for r in resultados]
+
     def buscar_por_autor(self, autor_id: UUID) -> List[Serie]:
         """
         Busca series por autor.
@@ -73,7 +119,7 @@ class SQLAlchemySerieRepository(SerieRepository):
             .filter_by(autor_id=autor_id)
             .all()
         )
-        return [Serie(**r.__dict__) for r in resultados]
+        return series_a_entidades(self.session, resultados)
 
     def eliminar(self, id: UUID) -> None:
         """
@@ -83,7 +129,7 @@ class SQLAlchemySerieRepository(SerieRepository):
             id (UUID): El ID de la serie.
         """
         self.session.query(SerieModel).filter_by(id=id).delete()
-        self.session.commit()
+        confirmar(self.session)
 
     def listar_todos(self) -> List[Serie]:
         """
@@ -93,4 +139,36 @@ class SQLAlchemySerieRepository(SerieRepository):
             List[Serie]: Una lista de todas las series.
         """
         resultados = self.session.query(SerieModel).all()
-        return [Serie(**r.__dict__) for r in resultados]
+        return series_a_entidades(self.session, resultados)
+
+    def listar_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Serie]:
+        """
+        Obtiene una página de series, paginando por clave en lugar de por desplazamiento.
+
+        Args:
+            despues_de (Optional[UUID]): ID de la última serie de la página anterior; None para la primera.
+            limite (int): Series máximas de la página.
+            orden (str): Columna de orden: 'id' o 'nombre'.
+
+        Returns:
+            List[Serie]: Las series de la página.
+        """
+        resultados = paginar(self.session.query(SerieModel), SerieModel, self.ORDENES, despues_de, limite, orden).all()
+        return series_a_entidades(self.session, resultados)
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Serie]:
+        """
+        Recorre todos los series sin cargarlos a la vez en memoria: las filas se leen
+        del cursor por lotes (con un cursor de servidor en PostgreSQL).
+
+        Args:
+            tamano_lote (int): Filas leídas de cada vez.
+
+        Yields:
+            Serie: Cada serie, por orden de ID.
+        """
+        resultado = self.session.execute(
+            select(SerieModel).order_by(SerieModel.id).execution_options(yield_per=tamano_lote)
+        ).scalars()
+        for modelos in resultado.partitions():
+            yield from series_a_entidades(self.session, modelos)
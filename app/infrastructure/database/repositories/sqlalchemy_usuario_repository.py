@@ -2,9 +2,9 @@ from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 
-from domain.entities.usuario import Usuario
-from domain.repositories.usuario_repository import UsuarioRepository
-from infrastructure.database.models.usuario_model import UsuarioModel
+from app.domain.entities.usuario import Usuario
+from app.domain.repositories.usuario_repository import UsuarioRepository
+from app.infrastructure.database.models.usuario_model import UsuarioModel
 
 
 class SQLAlchemyUsuarioRepository(UsuarioRepository):
@@ -57,7 +57,7 @@ class SQLAlchemyUsuarioRepository(UsuarioRepository):
         modelo = self.session.query(UsuarioModel).filter_by(email=email).first()
         return Usuario(**modelo.__dict__) if modelo else None
 
-    def obtener_todos(self) -> List[Usuario]:
+    def listar_todos(self) -> List[Usuario]:
         """
         Obtiene una lista de todos los usuarios.
 
@@ -0,0 +1,72 @@
+from typing import Callable
+
+from app.domain.repositories import UnitOfWork
+
+# Clave en `session.info` con la profundidad de las unidades de trabajo abiertas
+_CLAVE_PROFUNDIDAD = "unidad_de_trabajo"
+# Clave en `session.info` con las acciones pendientes del final de la unidad de trabajo
+_CLAVE_PENDIENTES = "al_terminar"
+
+
+def en_unidad_de_trabajo(session) -> bool:
+    """Indica si la sesión tiene una unidad de trabajo abierta."""
+    return session.info.get(_CLAVE_PROFUNDIDAD, 0) > 0
+
+
+def confirmar(session) -> None:
+    """
+    Confirma la transacción de la sesión o, dentro de una unidad de trabajo, solo
+    vuelca los cambios para que la unidad los confirme al terminar.
+    """
+    if en_unidad_de_trabajo(session):
+        session.flush()
+    else:
+        session.commit()
+
+
+def al_terminar(session, accion: Callable[[], None]) -> None:
+    """
+    Ejecuta una acción cuando termina la transacción de la sesión.
+
+    Dentro de una unidad de trabajo la acción espera a que la unidad confirme o deshaga
+    los cambios; fuera de ella se ejecuta al momento, porque `confirmar` ya confirmó.
+    """
+    if en_unidad_de_trabajo(session):
+        session.info.setdefault(_CLAVE_PENDIENTES, []).append(accion)
+    else:
+        accion()
+
+
+class SQLAlchemyUnitOfWork(UnitOfWork):
+    """
+    Unidad de trabajo sobre una sesión de SQLAlchemy.
+
+    Puede anidarse y reutilizarse: solo el bloque más externo confirma o deshace. Con
+    la sesión con ámbito de Flask-SQLAlchemy, cada hilo tiene su propia unidad de trabajo.
+    """
+    def __init__(self, session):
+        self.session = session
+
+    def __enter__(self) -> "SQLAlchemyUnitOfWork":
+        self.session.info[_CLAVE_PROFUNDIDAD] = self.session.info.get(_CLAVE_PROFUNDIDAD, 0) + 1
+        return self
+
+    def __exit__(self, tipo, valor, traza) -> None:
+        profundidad = self.session.info[_CLAVE_PROFUNDIDAD] - 1
+        self.session.info[_CLAVE_PROFUNDIDAD] = profundidad
+        if profundidad:
+            return
+
+        try:
+            if tipo is not None:
+                self.session.rollback()
+                return
+            try:
+                self.session.commit()
+            except Exception:
+                self.session.rollback()
+                raise
+        finally:
+            # Se ejecutan también al deshacer: durante la unidad pudo leerse lo no confirmado
+            for accion in self.session.info.pop(_CLAVE_PENDIENTES, []):
+                accion()
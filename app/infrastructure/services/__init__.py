@@ -4,6 +4,7 @@ from app.infrastructure.services.marcador_service_impl import MarcadorServiceImp
 from app.infrastructure.services.progreso_service_impl import ProgresoServiceImpl
 from app.infrastructure.services.serie_service_impl import SerieServiceImpl
 from app.infrastructure.services.usuario_service_impl import UsuarioServiceImpl
+from app.infrastructure.services.busqueda_service_impl import BusquedaServiceImpl
 
 __all___ = [
     "AutorServiceImpl",
@@ -11,5 +12,6 @@ __all___ = [
     "MarcadorServiceImpl",
     "ProgresoServiceImpl",
     "SerieServiceImpl",
-    "UsuarioServiceImpl"
+    "UsuarioServiceImpl",
+    "BusquedaServiceImpl"
 ]
\ No newline at end of file
@@ -1,15 +1,17 @@
 from uuid import uuid4, UUID
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 from datetime import date
 
 from app.domain.services import AutorService
 from app.domain.entities import Autor
 from app.domain.exceptions import MetadatosIncompletos, AutorNoValido, AutorNoEncontrado
 from app.infrastructure.database.repositories.sqlalchemy_autor_repository import SQLAlchemyAutorRepository
+from app.infrastructure.cache import CacheEntidades
 
 class AutorServiceImpl(AutorService):
-    def __init__(self, autor_repo: SQLAlchemyAutorRepository):
+    def __init__(self, autor_repo: SQLAlchemyAutorRepository, cache: Optional[CacheEntidades] = None):
         self.repo = autor_repo
+        self.cache = cache or CacheEntidades()
     
     def registrar_autor(
         self,
@@ -42,8 +44,16 @@ class AutorServiceImpl(AutorService):
             raise AutorNoValido(f"Error al crear el autor: {e}")
         return autor
     
+    def registrar_lote(self, autores: List[Autor]) -> None:
+        if not autores:
+            return
+        try:
+            self.repo.guardar_lote(autores)
+        except Exception as e:
+            raise AutorNoValido(f"Error al crear {len(autores)} autores: {e}")
+
     def obtener_por_id(self, autor_id: UUID) -> Autor:
-        autor = self.repo.obtener_por_id(autor_id)
+        autor = self.cache.obtener(Autor, autor_id, self.repo.obtener_por_id)
         if not autor:
             raise AutorNoEncontrado()
         return autor
@@ -54,24 +64,26 @@ class AutorServiceImpl(AutorService):
             raise AutorNoEncontrado()
         return autores
     
+    def listar_nombres(self) -> List[Dict]:
+        return self.repo.listar_nombres()
+
     def obtener_todos(self) -> List[Autor]:
         return self.repo.listar_todos()
     
     def editar_metadata_autor(self, autor_id, metadatos) -> Optional[bool]:
+        campos = {
+            campo: metadatos[campo]
+            for campo in ["nombre", "foto_hash", "biografia", "fecha_nacimiento", "fecha_muerte", "nacionalidad", "redes_sociales"]
+            if campo in metadatos
+        }
         try:
-            autor = self.repo.obtener_por_id(autor_id)
-            if not autor:
-                return False
-
-            for campo in ["nombre", "foto_hash", "biografia", "fecha_nacimiento", "fecha_muerte", "nacionalidad", "redes_sociales"]:
-                if campo in metadatos:
-                    setattr(autor, campo, metadatos[campo])
-
-            self.repo.guardar(autor)
-            return True
+            resultado = self.repo.actualizar_campos(autor_id, campos) if campos else self.repo.obtener_por_id(autor_id) is not None
         except Exception as e:
             return False
 
+        self.cache.invalidar(Autor, autor_id)
+        return resultado
+
     def buscar_o_crear_por_nombre(self, nombre) -> Autor:
         try:
             return self.buscar_por_nombre(nombre)[0]
@@ -79,4 +91,14 @@ class AutorServiceImpl(AutorService):
             return self.registrar_autor(nombre)
 
     def eliminar(self, autor_id: UUID) -> None:
-        self.repo.eliminar(autor_id)
\ No newline at end of file
+        self.repo.eliminar(autor_id)
+        self.cache.invalidar(Autor, autor_id)
+
+    def obtener_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Autor]:
+        return self.repo.listar_pagina(despues_de, limite, orden)
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Autor]:
+        return self.repo.iterar_todos(tamano_lote)
+
+    def estadisticas_cache(self) -> Dict[str, float]:
+        return self.cache.stats(Autor)
@@ -0,0 +1,23 @@
+from typing import List, Optional
+
+from app.domain.services import BusquedaService
+from app.domain.entities import ResultadoBusqueda
+from app.domain.enums import TipoResultado
+from app.infrastructure.database.repositories.sqlalchemy_busqueda_repository import SQLAlchemyBusquedaRepository
+
+class BusquedaServiceImpl(BusquedaService):
+    def __init__(self, busqueda_repo: SQLAlchemyBusquedaRepository):
+        self.repo = busqueda_repo
+
+    def buscar(
+            self,
+            consulta: str,
+            tipos: Optional[List[TipoResultado]] = None,
+            limite: int = 20
+    ) -> List[ResultadoBusqueda]:
+        if not consulta or not consulta.strip():
+            return []
+        return self.repo.buscar(consulta, tipos, max(1, limite))
+
+    def reconstruir_indice(self) -> None:
+        self.repo.reconstruir()
@@ -1,17 +1,19 @@
 from uuid import uuid4, UUID
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 
 from app.domain.services import LibroService
-from app.domain.entities import Libro
+from app.domain.entities import Autor, Libro, Serie
 from app.domain.enums import Formato
 from app.domain.exceptions import MetadatosIncompletos, LibroNoValido, LibroNoEncontrado
 from app.infrastructure.database.repositories.sqlalchemy_libro_repository import SQLAlchemyLibroRepository
+from app.infrastructure.cache import CacheEntidades
 
 class LibroServiceImpl(LibroService):
-    def __init__(self, libro_repo: SQLAlchemyLibroRepository):
+    def __init__(self, libro_repo: SQLAlchemyLibroRepository, cache: Optional[CacheEntidades] = None):
         self.repo = libro_repo
+        self.cache = cache or CacheEntidades()
 
-    def registrar_libro(
+    def preparar_libro(
         self,
         titulo: str,
         autores: List[UUID],
@@ -24,12 +26,14 @@ class LibroServiceImpl(LibroService):
         serie_id: Optional[UUID] = None,
         descripcion: Optional[str] = None,
         paginas: Optional[int] = None,
-        year: Optional[int] = None
+        year: Optional[int] = None,
+        hash_parcial: Optional[str] = None,
+        hash_contenido: Optional[str] = None
     ) -> Libro:
         if not titulo or not autores or not path or not formato or not portada_hash:
             raise MetadatosIncompletos()
 
-        libro = Libro(
+        return Libro(
             id=uuid4(),
             titulo=titulo,
             autores=autores,
@@ -42,7 +46,43 @@ class LibroServiceImpl(LibroService):
             serie_id=serie_id,
             descripcion=descripcion,
             paginas=paginas,
-            year=year
+            year=year,
+            hash_parcial=hash_parcial,
+            hash_contenido=hash_contenido
+        )
+
+    def registrar_libro(
+        self,
+        titulo: str,
+        autores: List[UUID],
+        path: str,
+        formato: Formato,
+        portada_hash: str,
+        isbn: Optional[str] = None,
+        fecha_publicacion: Optional[str] = None,
+        editorial: Optional[str] = None,
+        serie_id: Optional[UUID] = None,
+        descripcion: Optional[str] = None,
+        paginas: Optional[int] = None,
+        year: Optional[int] = None,
+        hash_parcial: Optional[str] = None,
+        hash_contenido: Optional[str] = None
+    ) -> Libro:
+        libro = self.preparar_libro(
+            titulo=titulo,
+            autores=autores,
+            path=path,
+            formato=formato,
+            portada_hash=portada_hash,
+            isbn=isbn,
+            fecha_publicacion=fecha_publicacion,
+            editorial=editorial,
+            serie_id=serie_id,
+            descripcion=descripcion,
+            paginas=paginas,
+            year=year,
+            hash_parcial=hash_parcial,
+            hash_contenido=hash_contenido
         )
 
         try:
@@ -50,10 +90,33 @@ class LibroServiceImpl(LibroService):
         except Exception as e:
             raise LibroNoValido(f"Error al crear el libro: {e}")
 
+        self._invalidar(libro)
         return libro
+
+    def registrar_lote(self, libros: List[Libro]) -> None:
+        if not libros:
+            return
+        try:
+            self.repo.guardar_lote(libros)
+        except Exception as e:
+            raise LibroNoValido(f"Error al crear {len(libros)} libros: {e}")
+        self._invalidar(*libros)
+    
+    def actualizar_libro(self, libro: Libro) -> bool:
+        anterior = self.repo.obtener_por_id(libro.id) if self.cache.activa else None
+        try:
+            actualizado = self.repo.actualizar(libro)
+        except Exception as e:
+            raise LibroNoValido(f"Error al actualizar el libro: {e}")
+
+        # El libro pudo cambiar de autores o de serie
+        self._invalidar(libro)
+        if anterior:
+            self._invalidar(anterior)
+        return actualizado
     
     def obtener_por_id(self, libro_id: UUID) -> Libro:
-        libro = self.repo.obtener_por_id(libro_id)
+        libro = self.cache.obtener(Libro, libro_id, self.repo.obtener_por_id)
         if not libro:
             raise LibroNoEncontrado()
         return libro
@@ -67,23 +130,57 @@ class LibroServiceImpl(LibroService):
     def buscar_por_serie(self, serie_id) -> List[Libro]:
         return self.repo.buscar_por_serie(serie_id)
 
+    def buscar_por_titulo(self, titulo: str) -> List[Libro]:
+        libros = self.repo.buscar_por_titulo(titulo)
+        if not libros:
+            raise LibroNoEncontrado()
+        return libros
+
     def obtener_todos(self) -> List[Libro]:
         return self.repo.listar_todos()
 
+    def listar_huellas(self) -> List[Dict]:
+        return self.repo.listar_huellas()
+
+    def actualizar_path(self, libro_id: UUID, path: str) -> None:
+        self.repo.actualizar_path(libro_id, path)
+        self.cache.invalidar(Libro, libro_id)
+
     def eliminar(self, libro_id: UUID) -> None:
+        libro = self.repo.obtener_por_id(libro_id) if self.cache.activa else None
         self.repo.eliminar(libro_id)
+        self.cache.invalidar(Libro, libro_id)
+        if libro:
+            self._invalidar(libro)
     
     def editar_metadata_libro(self, libro_id, metadatos) -> Optional[bool]:
+        campos = {
+            campo: metadatos[campo]
+            for campo in ["titulo", "descripcion", "paginas", "year", "serie_id", "portada_hash", "isbn", "editorial"]
+            if campo in metadatos
+        }
+        anterior = self.repo.obtener_por_id(libro_id) if self.cache.activa and "serie_id" in campos else None
         try:
-            libro = self.repo.obtener_por_id(libro_id)
-            if not libro:
-                return False
+            resultado = self.repo.actualizar_campos(libro_id, campos) if campos else self.repo.obtener_por_id(libro_id) is not None
+        except Exception as e:
+            return False
 
-            for campo in ["titulo", "descripcion", "paginas", "year", "serie_id", "portada_hash"]:
-                if campo in metadatos:
-                    setattr(libro, campo, metadatos[campo])
+        self.cache.invalidar(Libro, libro_id)
+        if anterior:
+            self.cache.invalidar(Serie, anterior.serie_id, campos["serie_id"])
+        return resultado
 
-            self.repo.guardar(libro)
-            return True
-        except Exception as e:
-            return False
\ No newline at end of file
+    def obtener_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Libro]:
+        return self.repo.listar_pagina(despues_de, limite, orden)
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Libro]:
+        return self.repo.iterar_todos(tamano_lote)
+
+    def estadisticas_cache(self) -> Dict[str, float]:
+        return self.cache.stats(Libro)
+
+    def _invalidar(self, *libros: Libro) -> None:
+        # Los autores y las series guardan la lista de IDs de sus libros
+        self.cache.invalidar(Libro, *(libro.id for libro in libros))
+        self.cache.invalidar(Autor, *{autor_id for libro in libros for autor_id in libro.autores})
+        self.cache.invalidar(Serie, *{libro.serie_id for libro in libros})
@@ -1,5 +1,5 @@
 from uuid import uuid4, UUID
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 from datetime import date
 
 from app.domain.services import MarcadorService
@@ -38,12 +38,16 @@ class MarcadorServiceImpl(MarcadorService):
             raise MarcadorInvalido(f"Error al crear el marcador: {e}")
         return marcador
     
-    def obtener_marcadores_por_usuario_y_libro(self, usuario_id, libro_id) -> List[Marcador]:
-        marcadores = []
-        for marcador in self.repo.obtener_por_usuario(usuario_id):
-            if marcador.libro_id == libro_id:
-                marcadores.append(marcador)
-        return marcadores
+    def obtener_marcadores_por_usuario_y_libro(
+            self,
+            usuario_id: UUID,
+            libro_id: UUID,
+            desde_pagina: Optional[int] = None,
+            hasta_pagina: Optional[int] = None,
+            despues_de: Optional[UUID] = None,
+            limite: int = 100
+        ) -> List[Marcador]:
+        return self.repo.obtener_por_usuario_y_libro(usuario_id, libro_id, desde_pagina, hasta_pagina, despues_de, limite)
     
     def obtener_marcador_por_id(self, marcador_id: UUID) -> Optional[Marcador]:
         return self.repo.obtener_por_id(marcador_id)
@@ -63,4 +67,10 @@ class MarcadorServiceImpl(MarcadorService):
         self.repo.eliminar(marcador_id)
     
     def listar_todos(self) -> List[Marcador]:
-        return self.repo.listar_todos()
\ No newline at end of file
+        return self.repo.listar_todos()
+
+    def listar_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Marcador]:
+        return self.repo.listar_pagina(despues_de, limite, orden)
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Marcador]:
+        return self.repo.iterar_todos(tamano_lote)
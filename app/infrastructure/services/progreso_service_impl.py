@@ -1,47 +1,44 @@
 from uuid import uuid4, UUID
-from typing import Optional, List, Dict
-from datetime import date
+from typing import Optional, List, Dict, Iterator
+from datetime import datetime
 
 
 from app.domain.services import ProgresoService
 from app.domain.entities import Progreso
 from app.domain.enums import Estatus
 from app.domain.exceptions import MetadatosIncompletos, ProgresoInvalido
+from app.infrastructure.database.buffer_progreso import BufferProgreso
 from app.infrastructure.database.repositories.sqlalchemy_progreso_repository import SQLAlchemyProgresoRepository
 
 class ProgresoServiceImpl(ProgresoService):
-    def __init__(self, progreso_repo: SQLAlchemyProgresoRepository):
+    def __init__(self, progreso_repo: SQLAlchemyProgresoRepository, buffer: Optional[BufferProgreso] = None):
         self.repo = progreso_repo
+        self.buffer = buffer
     
     def iniciar_lectura(self, usuario_id: UUID, libro_id: UUID) -> Progreso:
         if not usuario_id or not libro_id:
             raise MetadatosIncompletos()
         
+        return self.actualizar_progreso(usuario_id, libro_id, 0, Estatus.LEYENDO)
+    
+    def actualizar_progreso(self, usuario_id: UUID, libro_id: UUID, porcentaje: float, estatus: Estatus = None) -> Progreso:
+        if not 0 <= porcentaje <= 100:
+            raise ProgresoInvalido("Porcentaje fuera de rango")
+
+        anterior = self.obtener_progreso_por_usuario_y_libro(usuario_id, libro_id)
         progreso = Progreso(
-            id=uuid4(),
+            id=anterior.id if anterior else uuid4(),
             usuario_id=usuario_id,
             libro_id=libro_id,
-            fecha_inicio=date.today(),
-            estatus=Estatus.LEYENDO
+            porcentaje=porcentaje,
+            estatus=estatus or (Estatus.TERMINADO if porcentaje == 100 else Estatus.LEYENDO),
+            ultima_fecha=datetime.utcnow()
         )
 
-        try:
-            self.repo.guardar(progreso)
-        except Exception as e:
-            raise ProgresoInvalido(f"Error al iniciar la lectura: {e}")
-        
-        return progreso
-    
-    def actualizar_progreso(self, progreso_id: UUID, pagina_actual: int, estatus: Estatus) -> Progreso:
-        progreso = self.repo.obtener_por_id(progreso_id)
-        if not progreso:
-            raise ProgresoInvalido("Progreso no encontrado.")
-        
-        progreso.pagina_actual = pagina_actual
-        progreso.estatus = estatus
-        if estatus == Estatus.TERMINADO:
-            progreso.fecha_finalizacion = date.today()
-        
+        if self.buffer:
+            self.buffer.registrar(progreso)
+            return progreso
+
         try:
             self.repo.guardar(progreso)
         except Exception as e:
@@ -49,14 +46,35 @@ class ProgresoServiceImpl(ProgresoService):
         
         return progreso
     
+    def obtener_progreso(self, usuario_id: UUID, libro_id: UUID) -> Optional[Progreso]:
+        return self.obtener_progreso_por_usuario_y_libro(usuario_id, libro_id)
+
     def obtener_progreso_por_usuario_y_libro(self, usuario_id: UUID, libro_id: UUID) -> Optional[Progreso]:
+        if self.buffer:
+            progreso = self.buffer.obtener(usuario_id, libro_id)
+            if progreso:
+                return progreso
         return self.repo.obtener_por_usuario_y_libro(usuario_id, libro_id)
     
     def obtener_progresos_por_usuario(self, usuario_id: UUID) -> List[Progreso]:
-        return self.repo.obtener_por_usuario(usuario_id)
+        progresos = self.repo.obtener_por_usuario(usuario_id)
+        if not self.buffer:
+            return progresos
+
+        pendientes: Dict[UUID, Progreso] = {p.libro_id: p for p in self.buffer.obtener_por_usuario(usuario_id)}
+        combinados = [pendientes.pop(p.libro_id, p) for p in progresos]
+        return combinados + list(pendientes.values())
     
     def eliminar_progreso(self, progreso_id: UUID) -> None:
+        if self.buffer:
+            self.buffer.descartar(progreso_id)
         self.repo.eliminar(progreso_id)
     
     def obtener_todos(self) -> List[Progreso]:
-        return self.repo.listar_todos()
\ No newline at end of file
+        return self.repo.listar_todos()
+
+    def obtener_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Progreso]:
+        return self.repo.listar_pagina(despues_de, limite, orden)
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Progreso]:
+        return self.repo.iterar_todos(tamano_lote)
@@ -1,14 +1,16 @@
 from uuid import uuid4, UUID
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterator
 
 from app.domain.services import SerieService
-from app.domain.entities import Serie
+from app.domain.entities import Libro, Serie
 from app.domain.exceptions import MetadatosIncompletos, SerieInvalida, SerieNoEncontrada
 from app.infrastructure.database.repositories.sqlalchemy_serie_repository import SQLAlchemySerieRepository
+from app.infrastructure.cache import CacheEntidades
 
 class SerieServiceImpl(SerieService):
-    def __init__(self, serie_repo: SQLAlchemySerieRepository):
+    def __init__(self, serie_repo: SQLAlchemySerieRepository, cache: Optional[CacheEntidades] = None):
         self.repo = serie_repo
+        self.cache = cache or CacheEntidades()
 
     def registrar_serie(
             self,
@@ -33,10 +35,20 @@ class SerieServiceImpl(SerieService):
             self.repo.guardar(serie)
         except Exception as e:
             raise SerieInvalida(f"Error al crear la serie: {e}")
+        self.cache.invalidar(Libro, *serie.libros)
         return serie
     
+    def registrar_lote(self, series: List[Serie]) -> None:
+        if not series:
+            return
+        try:
+            self.repo.guardar_lote(series)
+        except Exception as e:
+            raise SerieInvalida(f"Error al crear {len(series)} series: {e}")
+        self.cache.invalidar(Libro, *(libro_id for serie in series for libro_id in serie.libros))
+
     def obtener_por_id(self, serie_id: UUID) -> Serie:
-        serie = self.repo.obtener_por_id(serie_id)
+        serie = self.cache.obtener(Serie, serie_id, self.repo.obtener_por_id)
         if not serie:
             raise SerieNoEncontrada()
         return serie
@@ -53,6 +65,9 @@ class SerieServiceImpl(SerieService):
             raise SerieNoEncontrada()
         return series
 
+    def listar_nombres(self) -> List[Dict]:
+        return self.repo.listar_nombres()
+
     def buscar_o_crear_por_nombre(self, nombre: str) -> Serie:
         try:
             return self.buscar_por_nombre(nombre)[0]
@@ -67,6 +82,8 @@ class SerieServiceImpl(SerieService):
 
             serie.libros.append(libro_id)
             self.repo.guardar(serie)
+            self.cache.invalidar(Serie, serie_id)
+            self.cache.invalidar(Libro, libro_id)
             return True
         except Exception as e:
             return False
@@ -79,9 +96,24 @@ class SerieServiceImpl(SerieService):
 
             serie.libros.remove(libro_id)
             self.repo.guardar(serie)
+            self.cache.invalidar(Serie, serie_id)
+            self.cache.invalidar(Libro, libro_id)
             return True
         except Exception as e:
             return False
         
     def eliminar_serie(self, serie_id) -> None:
-        self.repo.eliminar(serie_id)
\ No newline at end of file
+        serie = self.repo.obtener_por_id(serie_id) if self.cache.activa else None
+        self.repo.eliminar(serie_id)
+        self.cache.invalidar(Serie, serie_id)
+        if serie:
+            self.cache.invalidar(Libro, *serie.libros)
+
+    def obtener_pagina(self, despues_de: Optional[UUID] = None, limite: int = 100, orden: str = "id") -> List[Serie]:
+        return self.repo.listar_pagina(despues_de, limite, orden)
+
+    def iterar_todos(self, tamano_lote: int = 500) -> Iterator[Serie]:
+        return self.repo.iterar_todos(tamano_lote)
+
+    def estadisticas_cache(self) -> Dict[str, float]:
+        return self.cache.stats(Serie)
@@ -7,10 +7,12 @@ from app.domain.entities import Usuario
 from app.domain.enums import Rol
 from app.domain.exceptions import MetadatosIncompletos, UsuarioInvalido, UsuarioNoEncontrado
 from app.infrastructure.database.repositories.sqlalchemy_usuario_repository import SQLAlchemyUsuarioRepository
+from app.infrastructure.cache import CacheEntidades
 
 class UsuarioServiceImpl(UsuarioService):
-    def __init__(self, usuario_repo: SQLAlchemyUsuarioRepository):
+    def __init__(self, usuario_repo: SQLAlchemyUsuarioRepository, cache: Optional[CacheEntidades] = None):
         self.repo = usuario_repo
+        self.cache = cache or CacheEntidades()
 
     def registrar_usuario(self, username, password_hash, email, rol = Rol.LECTOR) -> Usuario:
         if not username or not password_hash or not email:
@@ -39,7 +41,7 @@ class UsuarioServiceImpl(UsuarioService):
         return usuario
     
     def obtener_por_id(self, usuario_id: str) -> Optional[Usuario]:
-        usuario = self.repo.obtener_por_id(usuario_id)
+        usuario = self.cache.obtener(Usuario, usuario_id, self.repo.obtener_por_id)
         if not usuario:
             raise UsuarioNoEncontrado()
         return usuario
@@ -49,6 +51,7 @@ class UsuarioServiceImpl(UsuarioService):
     
     def eliminar(self, usuario_id: str) -> None:
         self.repo.eliminar(usuario_id)
+        self.cache.invalidar(Usuario, usuario_id)
     
     def cambiar_rol(self, usuario_id: str, nuevo_rol: str) -> Optional[bool]:
         usuario = self.repo.obtener_por_id(usuario_id)
@@ -57,6 +60,7 @@ class UsuarioServiceImpl(UsuarioService):
         try:
             usuario.rol = nuevo_rol
             self.repo.guardar(usuario)
+            self.cache.invalidar(Usuario, usuario_id)
             return True
         except Exception as e:
             return False
@@ -68,6 +72,7 @@ class UsuarioServiceImpl(UsuarioService):
         try:
             usuario.password_hash = nueva_password
             self.repo.guardar(usuario)
+            self.cache.invalidar(Usuario, usuario_id)
         except Exception as e:
             raise
 
@@ -78,6 +83,7 @@ class UsuarioServiceImpl(UsuarioService):
         try:
             usuario.email = nuevo_email
             self.repo.guardar(usuario)
+            self.cache.invalidar(Usuario, usuario_id)
         except Exception as e:
             raise
     
@@ -88,5 +94,9 @@ class UsuarioServiceImpl(UsuarioService):
         try:
             usuario.username = nuevo_username
             self.repo.guardar(usuario)
+            self.cache.invalidar(Usuario, usuario_id)
         except Exception as e:
-            raise
\ No newline at end of file
+            raise
+
+    def estadisticas_cache(self) -> Dict[str, float]:
+        return self.cache.stats(Usuario)
@@ -0,0 +1,188 @@
+"""
+Planes de consulta (EXPLAIN QUERY PLAN) y tiempos de las búsquedas más frecuentes de
+los repositorios sobre SQLite, sin y con los índices de las migraciones 3f2a9c1d7b10
+y 9a7c2e4b1f30.
+
+Crea una base de datos temporal con un catálogo sintético, elimina los índices,
+mide, los vuelve a crear y mide otra vez.
+
+Uso, desde la raíz del proyecto:
+
+    python -m benchmarks.query_plans --libros 20000 --repeticiones 200
+"""
+from pathlib import Path
+import argparse
+import tempfile
+import random
+import time
+import uuid
+import os
+
+
+# Índices que añaden las migraciones 3f2a9c1d7b10 y 9a7c2e4b1f30
+INDICES = [
+    "ix_libros_titulo",
+    "ix_libros_path",
+    "ix_libros_isbn",
+    "ix_libros_serie_id",
+    "ix_libros_autores_autor_id",
+    "ix_autores_nombre",
+    "ix_series_nombre",
+    "ix_series_autor_id",
+    "ix_progresos_usuario_libro",
+    "ix_marcadores_usuario_libro_pagina",
+]
+
+
+def _poblar(db, modelos, libros: int) -> dict:
+    from sqlalchemy import insert
+    from app.domain.enums import Formato, Rol, Estatus
+
+    LibroModel, AutorModel, SerieModel, ProgresoModel, MarcadorModel, UsuarioModel, libros_autores = modelos
+    usuarios = [uuid.uuid4() for _ in range(max(10, libros // 200))]
+    autores = [uuid.uuid4() for _ in range(max(10, libros // 5))]
+    series = [uuid.uuid4() for _ in range(max(10, libros // 20))]
+    ids = [uuid.uuid4() for _ in range(libros)]
+
+    db.session.execute(insert(UsuarioModel), [
+        {"id": u, "username": f"usuario{i}", "password_hash": "x", "email": f"u{i}@ejemplo.org", "rol": Rol.LECTOR}
+        for i, u in enumerate(usuarios)
+    ])
+    db.session.execute(insert(AutorModel), [{"id": a, "nombre": f"Autor {i}"} for i, a in enumerate(autores)])
+    db.session.execute(insert(SerieModel), [
+        {"id": s, "nombre": f"Serie {i}", "autor_id": random.choice(autores)} for i, s in enumerate(series)
+    ])
+    db.session.execute(insert(LibroModel), [
+        {
+            "id": l,
+            "titulo": f"Libro {i}",
+            "path": f"/biblioteca/{i % 97}/libro_{i}.epub",
+            "formato": Formato.EPUB,
+            "portada_hash": "sin_portada",
+            "isbn": f"978{i:010d}",
+            "serie_id": random.choice(series) if i % 3 == 0 else None,
+        }
+        for i, l in enumerate(ids)
+    ])
+    db.session.execute(libros_autores.insert(), [{"libro_id": l, "autor_id": random.choice(autores)} for l in ids])
+    lecturas = {(random.choice(usuarios), random.choice(ids)) for _ in range(libros)}
+    db.session.execute(insert(ProgresoModel), [
+        {"id": uuid.uuid4(), "usuario_id": u, "libro_id": l, "porcentaje": 50.0, "estatus": Estatus.LEYENDO}
+        for u, l in lecturas
+    ])
+    db.session.execute(insert(MarcadorModel), [
+        {"id": uuid.uuid4(), "usuario_id": u, "libro_id": l, "pagina": p, "cita": "..."}
+        for u, l in lecturas for p in range(5)
+    ])
+    db.session.commit()
+    return {"usuarios": usuarios, "autores": autores, "series": series, "libros": ids, "lecturas": list(lecturas)}
+
+
+def _consultas(modelos, datos: dict) -> dict:
+    from sqlalchemy import select
+
+    LibroModel, AutorModel, SerieModel, ProgresoModel, MarcadorModel, _, libros_autores = modelos
+    n = len(datos["libros"])
+
+    def lectura():
+        return random.choice(datos["lecturas"])
+
+    return {
+        "libro por ruta": lambda: select(LibroModel).where(
+            LibroModel.path == (lambda i: f"/biblioteca/{i % 97}/libro_{i}.epub")(random.randrange(n))),
+        "libro por ISBN": lambda: select(LibroModel).where(LibroModel.isbn == f"978{random.randrange(n):010d}"),
+        "libro por título": lambda: select(LibroModel).where(LibroModel.titulo == f"Libro {random.randrange(n)}"),
+        "libros de una serie": lambda: select(LibroModel).where(LibroModel.serie_id == random.choice(datos["series"])),
+        "libros de un autor": lambda: select(LibroModel).join(libros_autores).where(
+            libros_autores.c.autor_id == random.choice(datos["autores"])),
+        "autor por nombre": lambda: select(AutorModel).where(AutorModel.nombre == f"Autor {random.randrange(len(datos['autores']))}"),
+        "serie por nombre": lambda: select(SerieModel).where(SerieModel.nombre == f"Serie {random.randrange(len(datos['series']))}"),
+        "progreso de usuario y libro": lambda: (lambda u, l: select(ProgresoModel).where(
+            ProgresoModel.usuario_id == u, ProgresoModel.libro_id == l))(*lectura()),
+        "marcadores de usuario y libro": lambda: (lambda u, l: select(MarcadorModel).where(
+            MarcadorModel.usuario_id == u, MarcadorModel.libro_id == l))(*lectura()),
+        "marcadores de usuario y libro por página": lambda: (lambda u, l: select(MarcadorModel).where(
+            MarcadorModel.usuario_id == u, MarcadorModel.libro_id == l, MarcadorModel.pagina >= 2
+        ).order_by(MarcadorModel.pagina, MarcadorModel.id).limit(50))(*lectura()),
+    }
+
+
+def _medir(engine, consultas: dict, repeticiones: int) -> dict:
+    from sqlalchemy import event
+
+    capturadas = []
+
+    def capturar(conn, cursor, statement, parameters, context, executemany):
+        capturadas.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capturar)
+    resultados = {}
+    try:
+        with engine.connect() as conexion:
+            for nombre, construir in consultas.items():
+                inicio = time.perf_counter()
+                for _ in range(repeticiones):
+                    conexion.execute(construir()).fetchall()
+                milisegundos = (time.perf_counter() - inicio) * 1000 / repeticiones
+
+                sentencia, parametros = capturadas[-1]
+                plan = conexion.exec_driver_sql(f"EXPLAIN QUERY PLAN {sentencia}", parametros).fetchall()
+                resultados[nombre] = (milisegundos, " | ".join(fila[-1] for fila in plan))
+    finally:
+        event.remove(engine, "before_cursor_execute", capturar)
+    return resultados
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--libros", type=int, default=20000, help="Libros del catálogo sintético")
+    parser.add_argument("--repeticiones", type=int, default=200, help="Ejecuciones de cada consulta")
+    args = parser.parse_args()
+
+    ruta = Path(tempfile.mkdtemp()) / "query_plans.db"
+    os.environ["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{ruta}"
+    os.environ.setdefault("EXTRACTION_CACHE_PATH", "")
+    os.environ.setdefault("HTTP_CACHE_PATH", "")
+    os.environ["ENRICH_DEFERRED"] = "False"
+
+    from app.app_factory import create_app
+    from app.infrastructure.database.db_config import db
+    from app.infrastructure.database.models.libro_model import LibroModel, libros_autores
+    from app.infrastructure.database.models.autor_model import AutorModel
+    from app.infrastructure.database.models.serie_model import SerieModel
+    from app.infrastructure.database.models.progreso_model import ProgresoModel
+    from app.infrastructure.database.models.marcador_model import MarcadorModel
+    from app.infrastructure.database.models.usuario_model import UsuarioModel
+
+    random.seed(42)
+    application = create_app()
+    modelos = (LibroModel, AutorModel, SerieModel, ProgresoModel, MarcadorModel, UsuarioModel, libros_autores)
+    with application.app_context():
+        engine = db.engine
+        datos = _poblar(db, modelos, args.libros)
+        indices = [i for tabla in db.metadata.tables.values() for i in tabla.indexes if i.name in INDICES]
+        consultas = _consultas(modelos, datos)
+
+        for indice in indices:
+            indice.drop(engine)
+        with engine.begin() as conexion:
+            conexion.exec_driver_sql("ANALYZE")
+        antes = _medir(engine, consultas, args.repeticiones)
+
+        for indice in indices:
+            indice.create(engine)
+        with engine.begin() as conexion:
+            conexion.exec_driver_sql("ANALYZE")
+        despues = _medir(engine, consultas, args.repeticiones)
+
+    print(f"Catálogo sintético: {args.libros} libros; {args.repeticiones} ejecuciones por consulta\n")
+    for nombre in consultas:
+        ms_antes, plan_antes = antes[nombre]
+        ms_despues, plan_despues = despues[nombre]
+        print(f"{nombre}: {ms_antes:.3f} ms -> {ms_despues:.3f} ms (x{ms_antes / ms_despues:.1f})")
+        print(f"    antes:   {plan_antes}")
+        print(f"    después: {plan_despues}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Lecturas concurrentes durante una ingesta sobre SQLite, con la configuración por
+defecto (diario de rollback, synchronous=FULL, pool por defecto) y con el perfil de
+producción de `app.infrastructure.database.perfil_sqlite`.
+
+En un proceso, como en la aplicación, un hilo registra libros en lotes (como el
+escáner) y otros actualizan progresos de lectura en transacciones pequeñas. A la vez,
+varios procesos lectores (como los workers de un servidor web) consultan el catálogo.
+Se mide el tiempo de la ingesta, las lecturas completadas, su latencia, las
+actualizaciones de progreso y los errores "database is locked" de cada lado.
+
+Uso, desde la raíz del proyecto:
+
+    python -m benchmarks.sqlite_concurrencia --libros 20000 --lectores 4
+"""
+from pathlib import Path
+import multiprocessing
+import statistics
+import threading
+import argparse
+import tempfile
+import random
+import time
+import uuid
+import os
+
+
+def _engine(ruta: Path, perfil):
+    from sqlalchemy import create_engine
+    from app.infrastructure.database import perfil_sqlite
+
+    url = f"sqlite:///{ruta}"
+    if perfil is None:
+        return create_engine(url)
+    engine = create_engine(url, **perfil.opciones_engine())
+    perfil_sqlite.aplicar(engine, perfil)
+    return engine
+
+
+def _bloqueada(error: Exception) -> bool:
+    return "locked" in str(error) or "busy" in str(error)
+
+
+def _libro(i: int, id: uuid.UUID) -> dict:
+    from app.domain.enums import Formato
+
+    return {
+        "id": id, "titulo": f"Libro {i}", "path": f"/biblioteca/{i % 97}/libro_{i}.epub",
+        "formato": Formato.EPUB, "portada_hash": "sin_portada", "isbn": f"978{i:010d}",
+    }
+
+
+def _preparar(engine, args) -> dict:
+    from sqlalchemy import event, insert
+    from app.domain.enums import Rol, Estatus
+    from app.infrastructure.database.db_config import db
+    from app.infrastructure.database.indice_busqueda import crear_con_tablas
+    from app.infrastructure.database.models import AutorModel, LibroModel, ProgresoModel, UsuarioModel
+
+    if not event.contains(db.metadata, "after_create", crear_con_tablas):
+        event.listen(db.metadata, "after_create", crear_con_tablas)
+    db.metadata.create_all(engine)
+
+    random.seed(42)
+    usuarios = [uuid.uuid4() for _ in range(20)]
+    autores = [uuid.uuid4() for _ in range(max(10, args.libros // 5))]
+    # Catálogo inicial, para que los lectores tengan algo que leer desde el principio
+    iniciales = [uuid.uuid4() for _ in range(1000)]
+    progresos = [uuid.uuid4() for _ in range(len(usuarios) * 25)]
+
+    with engine.begin() as conexion:
+        conexion.execute(insert(UsuarioModel), [
+            {"id": u, "username": f"usuario{i}", "password_hash": "x", "email": f"u{i}@ejemplo.org", "rol": Rol.LECTOR}
+            for i, u in enumerate(usuarios)
+        ])
+        conexion.execute(insert(AutorModel), [{"id": a, "nombre": f"Autor {i}"} for i, a in enumerate(autores)])
+        conexion.execute(insert(LibroModel), [_libro(i, l) for i, l in enumerate(iniciales)])
+        conexion.execute(insert(ProgresoModel), [
+            {"id": p, "usuario_id": usuarios[i % len(usuarios)], "libro_id": iniciales[i],
+             "porcentaje": 0.0, "estatus": Estatus.LEYENDO}
+            for i, p in enumerate(progresos)
+        ])
+    return {"autores": autores, "iniciales": iniciales, "progresos": progresos}
+
+
+def _lector(ruta: Path, perfil, iniciales: list, terminado, resultados) -> None:
+    from sqlalchemy import func, select
+    from app.infrastructure.database.models import LibroModel
+
+    engine = _engine(ruta, perfil)
+    latencias = []
+    errores = 0
+    while not terminado.is_set():
+        inicio = time.perf_counter()
+        try:
+            with engine.connect() as conexion:
+                azar = random.random()
+                if azar < 0.45:
+                    conexion.execute(select(LibroModel).where(LibroModel.id == random.choice(iniciales))).all()
+                elif azar < 0.9:
+                    conexion.execute(select(LibroModel).order_by(LibroModel.titulo).limit(50)).all()
+                else:
+                    # Recorrido completo de la tabla, como un filtro sin índice
+                    conexion.execute(
+                        select(func.count()).select_from(LibroModel).where(LibroModel.path.like("%/7/%"))
+                    ).scalar()
+            latencias.append(time.perf_counter() - inicio)
+        except Exception as error:
+            if not _bloqueada(error):
+                raise
+            errores += 1
+    engine.dispose()
+    resultados.put((latencias, errores))
+
+
+def _ejecutar(ruta: Path, perfil, args) -> dict:
+    from sqlalchemy import insert, update
+    from app.infrastructure.database.models import LibroModel, ProgresoModel, libros_autores
+
+    engine = _engine(ruta, perfil)
+    datos = _preparar(engine, args)
+
+    contexto = multiprocessing.get_context("spawn")
+    terminado = contexto.Event()
+    resultados = contexto.Queue()
+    lectores = [
+        contexto.Process(target=_lector, args=(ruta, perfil, datos["iniciales"], terminado, resultados))
+        for _ in range(args.lectores)
+    ]
+    for lector in lectores:
+        lector.start()
+    time.sleep(2)  # Arranque de los procesos lectores
+
+    cerrojo = threading.Lock()
+    estadisticas = {"errores_escritura": 0, "progresos": 0}
+
+    def contar(clave: str) -> None:
+        with cerrojo:
+            estadisticas[clave] += 1
+
+    def ingesta():
+        inicio = time.perf_counter()
+        desde = len(datos["iniciales"])
+        for primero in range(desde, desde + args.libros, args.lote):
+            ids = [uuid.uuid4() for _ in range(args.lote)]
+            try:
+                with engine.begin() as conexion:
+                    conexion.execute(insert(LibroModel), [_libro(primero + i, l) for i, l in enumerate(ids)])
+                    conexion.execute(libros_autores.insert(), [
+                        {"libro_id": l, "autor_id": random.choice(datos["autores"])} for l in ids
+                    ])
+            except Exception as error:
+                if not _bloqueada(error):
+                    raise
+                contar("errores_escritura")
+        estadisticas["ingesta"] = time.perf_counter() - inicio
+        terminado.set()
+
+    def progreso():
+        while not terminado.is_set():
+            try:
+                with engine.begin() as conexion:
+                    conexion.execute(
+                        update(ProgresoModel)
+                        .where(ProgresoModel.id == random.choice(datos["progresos"]))
+                        .values(porcentaje=random.random() * 100)
+                    )
+                contar("progresos")
+            except Exception as error:
+                if not _bloqueada(error):
+                    raise
+                contar("errores_escritura")
+            time.sleep(0.005)
+
+    hilos = [threading.Thread(target=ingesta)] + [threading.Thread(target=progreso) for _ in range(args.escritores)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    estadisticas["latencias"] = []
+    estadisticas["errores_lectura"] = 0
+    for _ in lectores:
+        latencias, errores = resultados.get()
+        estadisticas["latencias"].extend(latencias)
+        estadisticas["errores_lectura"] += errores
+    for lector in lectores:
+        lector.join()
+    engine.dispose()
+    return estadisticas
+
+
+def _informe(nombre: str, e: dict) -> None:
+    latencias = sorted(e["latencias"]) or [0.0]
+    p99 = latencias[min(len(latencias) - 1, int(len(latencias) * 0.99))]
+    print(f"{nombre}:")
+    print(f"    ingesta:           {e['ingesta']:.2f} s")
+    print(f"    lecturas:          {len(e['latencias'])} ({len(e['latencias']) / e['ingesta']:.0f}/s)")
+    print(f"    latencia lectura:  p50 {statistics.median(latencias) * 1000:.2f} ms, p99 {p99 * 1000:.2f} ms")
+    print(f"    progresos:         {e['progresos']} ({e['progresos'] / e['ingesta']:.0f}/s)")
+    print(f"    errores 'locked':  {e['errores_lectura']} en lecturas, {e['errores_escritura']} en escrituras")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--libros", type=int, default=20000, help="Libros registrados durante la ingesta")
+    parser.add_argument("--lote", type=int, default=200, help="Libros por transacción de la ingesta")
+    parser.add_argument("--lectores", type=int, default=4, help="Procesos que leen el catálogo")
+    parser.add_argument("--escritores", type=int, default=2, help="Hilos que actualizan progresos")
+    args = parser.parse_args()
+
+    from app.infrastructure.database.perfil_sqlite import PerfilSQLite
+
+    directorio = Path(tempfile.mkdtemp())
+    perfiles = {
+        "por defecto": None,
+        "perfil de producción": PerfilSQLite(),
+    }
+    print(f"{args.libros} libros en lotes de {args.lote}; {args.lectores} procesos lectores y "
+          f"{args.escritores} hilos de progreso\n")
+    for i, (nombre, perfil) in enumerate(perfiles.items()):
+        ruta = directorio / f"concurrencia_{i}.db"
+        _informe(nombre, _ejecutar(ruta, perfil, args))
+        for sufijo in ("", "-wal", "-shm"):
+            if os.path.exists(f"{ruta}{sufijo}"):
+                os.remove(f"{ruta}{sufijo}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Índices en las columnas de búsqueda y unicidad de rutas y progresos
+
+Revision ID: 3f2a9c1d7b10
+Revises:
+Create Date: 2026-10-18 16:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import uuid
+
+
+# revision identifiers, used by Alembic.
+revision = '3f2a9c1d7b10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# (nombre, tabla, columnas, único)
+INDICES = [
+    ("ix_libros_titulo", "libros", ["titulo"], False),
+    ("ix_libros_path", "libros", ["path"], True),
+    ("ix_libros_isbn", "libros", ["isbn"], False),
+    ("ix_libros_serie_id", "libros", ["serie_id"], False),
+    ("ix_libros_autores_autor_id", "libros_autores", ["autor_id"], False),
+    ("ix_autores_nombre", "autores", ["nombre"], False),
+    ("ix_series_nombre", "series", ["nombre"], False),
+    ("ix_series_autor_id", "series", ["autor_id"], False),
+    ("ix_progresos_usuario_libro", "progresos", ["usuario_id", "libro_id"], True),
+    ("ix_marcadores_usuario_libro", "marcadores", ["usuario_id", "libro_id"], False),
+]
+
+# libros_autores usa el tipo Uuid (hexadecimal en SQLite, nativo en PostgreSQL)
+libros_autores = sa.table("libros_autores", sa.column("libro_id", sa.Uuid))
+
+
+def _indices_existentes(tabla):
+    # Las tablas creadas con db.create_all() a partir de los modelos ya tienen los índices
+    return {indice["name"] for indice in sa.inspect(op.get_bind()).get_indexes(tabla)}
+
+
+def _deduplicar_libros():
+    """
+    Deja un solo libro por ruta: el que apunta el manifiesto del escáner o, si no, el
+    primero. Los progresos y marcadores de los demás pasan al que se conserva.
+    """
+    conexion = op.get_bind()
+    rutas = conexion.execute(sa.text(
+        "SELECT path FROM libros GROUP BY path HAVING COUNT(*) > 1"
+    )).scalars().all()
+
+    for path in rutas:
+        ids = conexion.execute(
+            sa.text("SELECT id FROM libros WHERE path = :path ORDER BY id"), {"path": path}
+        ).scalars().all()
+        manifiesto = conexion.execute(
+            sa.text("SELECT libro_id FROM archivos_escaneados WHERE path = :path"), {"path": path}
+        ).scalar()
+        conservar = manifiesto if manifiesto in ids else ids[0]
+        sobrantes = [i for i in ids if i != conservar]
+
+        for tabla in ("progresos", "marcadores"):
+            conexion.execute(
+                sa.text(f"UPDATE {tabla} SET libro_id = :conservar WHERE libro_id IN :sobrantes")
+                .bindparams(sa.bindparam("sobrantes", expanding=True)),
+                {"conservar": conservar, "sobrantes": sobrantes}
+            )
+        conexion.execute(
+            libros_autores.delete().where(libros_autores.c.libro_id.in_([uuid.UUID(str(i)) for i in sobrantes]))
+        )
+        conexion.execute(
+            sa.text("DELETE FROM libros WHERE id IN :sobrantes").bindparams(sa.bindparam("sobrantes", expanding=True)),
+            {"sobrantes": sobrantes}
+        )
+
+
+def _deduplicar_progresos():
+    """Deja un solo progreso por usuario y libro: el más reciente."""
+    op.execute(
+        """
+        DELETE FROM progresos WHERE id IN (
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (
+                    PARTITION BY usuario_id, libro_id ORDER BY ultima_fecha DESC, id DESC
+                ) AS orden
+                FROM progresos
+            ) AS numerados
+            WHERE orden > 1
+        )
+        """
+    )
+
+
+def upgrade():
+    _deduplicar_libros()
+    _deduplicar_progresos()
+
+    for nombre, tabla, columnas, unico in INDICES:
+        if nombre not in _indices_existentes(tabla):
+            op.create_index(nombre, tabla, columnas, unique=unico)
+
+
+def downgrade():
+    for nombre, tabla, _, _ in reversed(INDICES):
+        if nombre in _indices_existentes(tabla):
+            op.drop_index(nombre, table_name=tabla)
@@ -0,0 +1,177 @@
+"""UUID binario de 16 bytes en todas las claves
+
+Revision ID: 5d9b3e6f0a21
+Revises: 8c4e1b7a2d55
+Create Date: 2026-10-18 19:40:00.000000
+
+"""
+from alembic import op
+from sqlalchemy.dialects import mysql
+import sqlalchemy as sa
+import uuid
+
+from app.infrastructure.database import indice_busqueda
+from app.infrastructure.database.extensions import GUID
+
+
+# revision identifiers, used by Alembic.
+revision = '5d9b3e6f0a21'
+down_revision = '8c4e1b7a2d55'
+branch_labels = None
+depends_on = None
+
+# Columnas UUID de cada tabla y su formato anterior: "guid" (CHAR(36) con guiones) o
+# "uuid" (tipo Uuid: 32 dígitos hexadecimales, o UUID nativo en PostgreSQL)
+COLUMNAS = {
+    "usuarios": {"id": "guid"},
+    "autores": {"id": "guid"},
+    "series": {"id": "uuid", "autor_id": "uuid"},
+    "libros": {"id": "guid", "serie_id": "uuid"},
+    "libros_autores": {"libro_id": "uuid", "autor_id": "uuid"},
+    "marcadores": {"id": "guid", "usuario_id": "guid", "libro_id": "guid"},
+    "progresos": {"id": "guid", "usuario_id": "guid", "libro_id": "guid"},
+    "archivos_escaneados": {"id": "guid", "libro_id": "guid"},
+}
+
+# Filas convertidas por consulta en SQLite
+LOTE = 5000
+
+
+def _tipo_anterior(formato):
+    return sa.CHAR(36) if formato == "guid" else sa.Uuid()
+
+
+def _leer(valor):
+    if isinstance(valor, (bytes, bytearray, memoryview)):
+        return uuid.UUID(bytes=bytes(valor))
+    return uuid.UUID(str(valor))
+
+
+def _a_texto(valor, formato):
+    valor = _leer(valor)
+    return str(valor) if formato == "guid" else valor.hex
+
+
+def _a_binario(valor, formato):
+    return _leer(valor).bytes
+
+
+def _convertir_sqlite(conexion, tabla, columnas, convertir):
+    nombres = list(columnas)
+    asignaciones = ", ".join(f"{columna} = :v{i}" for i, columna in enumerate(nombres))
+    ultimo = 0
+    while True:
+        filas = conexion.execute(
+            sa.text(f"SELECT rowid, {', '.join(nombres)} FROM {tabla} WHERE rowid > :ultimo ORDER BY rowid LIMIT :lote"),
+            {"ultimo": ultimo, "lote": LOTE}
+        ).all()
+        if not filas:
+            return
+        cambios = []
+        for rowid, *valores in filas:
+            cambio = {"rowid": rowid}
+            for i, (valor, formato) in enumerate(zip(valores, columnas.values())):
+                cambio[f"v{i}"] = None if valor is None else convertir(valor, formato)
+            cambios.append(cambio)
+        conexion.execute(sa.text(f"UPDATE {tabla} SET {asignaciones} WHERE rowid = :rowid"), cambios)
+        ultimo = filas[-1][0]
+
+
+def _sqlite(a_binario):
+    # Los triggers del índice de búsqueda desaparecen al recrear las tablas
+    conexion = op.get_bind()
+    indice_busqueda.desinstalar(conexion)
+
+    for tabla, columnas in COLUMNAS.items():
+        # Primero los valores (SQLite admite cualquier valor en cualquier columna) y después
+        # el tipo declarado, porque al recrear la tabla se copian con CAST al tipo nuevo
+        _convertir_sqlite(conexion, tabla, columnas, _a_binario if a_binario else _a_texto)
+        with op.batch_alter_table(tabla, recreate="always") as batch:
+            for columna, formato in columnas.items():
+                anterior, nuevo = _tipo_anterior(formato), GUID()
+                if not a_binario:
+                    anterior, nuevo = nuevo, anterior
+                batch.alter_column(columna, existing_type=anterior, type_=nuevo)
+
+    if a_binario:
+        indice_busqueda.instalar(conexion)
+    # Al bajar de versión, el índice se vuelve a crear con la siguiente migración o con db.create_all()
+
+
+def _claves_foraneas():
+    inspector = sa.inspect(op.get_bind())
+    return [
+        (tabla, clave)
+        for tabla in COLUMNAS
+        for clave in inspector.get_foreign_keys(tabla)
+        if clave.get("name")
+    ]
+
+
+def _nulables():
+    inspector = sa.inspect(op.get_bind())
+    return {
+        (tabla, columna["name"]): columna["nullable"]
+        for tabla in COLUMNAS
+        for columna in inspector.get_columns(tabla)
+    }
+
+
+def _postgresql(a_binario, tabla, columna, formato, nulable):
+    if formato == "uuid":
+        return  # El tipo Uuid ya era nativo en PostgreSQL
+    if a_binario:
+        op.alter_column(tabla, columna, existing_type=sa.CHAR(36), type_=GUID(),
+                        existing_nullable=nulable, postgresql_using=f"{columna}::uuid")
+    else:
+        op.alter_column(tabla, columna, existing_type=GUID(), type_=sa.CHAR(36),
+                        existing_nullable=nulable, postgresql_using=f"{columna}::text")
+
+
+def _mysql(a_binario, tabla, columna, formato, nulable):
+    # Paso intermedio por VARBINARY(36) para que los valores no se trunquen
+    op.alter_column(tabla, columna, type_=mysql.VARBINARY(36), existing_nullable=nulable)
+    if a_binario:
+        op.execute(f"UPDATE {tabla} SET {columna} = UNHEX(REPLACE({columna}, '-', ''))")
+        op.alter_column(tabla, columna, type_=GUID(), existing_nullable=nulable)
+        return
+
+    hexadecimal = f"LOWER(HEX({columna}))"
+    if formato == "guid":
+        partes = [(1, 8), (9, 4), (13, 4), (17, 4), (21, 12)]
+        hexadecimal = "CONCAT_WS('-', " + ", ".join(f"SUBSTR({hexadecimal}, {i}, {n})" for i, n in partes) + ")"
+    op.execute(f"UPDATE {tabla} SET {columna} = {hexadecimal}")
+    op.alter_column(tabla, columna, type_=_tipo_anterior(formato), existing_nullable=nulable)
+
+
+def _migrar(a_binario):
+    dialecto = op.get_bind().dialect.name
+    if dialecto == "sqlite":
+        _sqlite(a_binario)
+        return
+
+    # Las claves foráneas impiden cambiar el tipo de las columnas que enlazan
+    claves = _claves_foraneas()
+    nulables = _nulables()
+    for tabla, clave in claves:
+        op.drop_constraint(clave["name"], tabla, type_="foreignkey")
+
+    convertir = _postgresql if dialecto == "postgresql" else _mysql
+    for tabla, columnas in COLUMNAS.items():
+        for columna, formato in columnas.items():
+            convertir(a_binario, tabla, columna, formato, nulables[(tabla, columna)])
+
+    for tabla, clave in claves:
+        op.create_foreign_key(
+            clave["name"], tabla, clave["referred_table"],
+            clave["constrained_columns"], clave["referred_columns"],
+            ondelete=clave.get("options", {}).get("ondelete")
+        )
+
+
+def upgrade():
+    _migrar(a_binario=True)
+
+
+def downgrade():
+    _migrar(a_binario=False)
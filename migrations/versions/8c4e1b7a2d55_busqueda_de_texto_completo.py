@@ -0,0 +1,26 @@
+"""Índice de búsqueda de texto completo (SQLite FTS5)
+
+Revision ID: 8c4e1b7a2d55
+Revises: 3f2a9c1d7b10
+Create Date: 2026-10-18 18:05:00.000000
+
+"""
+from alembic import op
+
+from app.infrastructure.database import indice_busqueda
+
+
+# revision identifiers, used by Alembic.
+revision = '8c4e1b7a2d55'
+down_revision = '3f2a9c1d7b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Crea las tablas FTS5 y sus triggers y las llena con el catálogo; sin efecto fuera de SQLite
+    indice_busqueda.instalar(op.get_bind())
+
+
+def downgrade():
+    indice_busqueda.desinstalar(op.get_bind())
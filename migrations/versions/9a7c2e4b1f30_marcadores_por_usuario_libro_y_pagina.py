@@ -0,0 +1,41 @@
+"""Índice de marcadores por usuario, libro y página
+
+Revision ID: 9a7c2e4b1f30
+Revises: 5d9b3e6f0a21
+Create Date: 2026-10-18 21:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a7c2e4b1f30'
+down_revision = '5d9b3e6f0a21'
+branch_labels = None
+depends_on = None
+
+# El índice nuevo sirve también las búsquedas por usuario y libro del anterior
+ANTERIOR = ("ix_marcadores_usuario_libro", ["usuario_id", "libro_id"])
+NUEVO = ("ix_marcadores_usuario_libro_pagina", ["usuario_id", "libro_id", "pagina"])
+
+
+def _indices_existentes():
+    # Las tablas creadas con db.create_all() a partir de los modelos ya tienen el índice nuevo
+    return {indice["name"] for indice in sa.inspect(op.get_bind()).get_indexes("marcadores")}
+
+
+def _cambiar(quitar, crear):
+    existentes = _indices_existentes()
+    if crear[0] not in existentes:
+        op.create_index(crear[0], "marcadores", crear[1])
+    if quitar[0] in existentes:
+        op.drop_index(quitar[0], table_name="marcadores")
+
+
+def upgrade():
+    _cambiar(quitar=ANTERIOR, crear=NUEVO)
+
+
+def downgrade():
+    _cambiar(quitar=NUEVO, crear=ANTERIOR)
@@ -0,0 +1,30 @@
+"""Claves estables del índice de búsqueda
+
+Revision ID: c6e2a8d4f913
+Revises: 9a7c2e4b1f30
+Create Date: 2026-10-19 10:20:00.000000
+
+"""
+from alembic import op
+
+from app.infrastructure.database import indice_busqueda
+
+
+# revision identifiers, used by Alembic.
+revision = 'c6e2a8d4f913'
+down_revision = '9a7c2e4b1f30'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Los triggers anteriores enlazaban por el rowid de las tablas del catálogo; se vuelven
+    # a crear con las claves de `busqueda_claves` y el índice se llena de nuevo
+    conexion = op.get_bind()
+    indice_busqueda.desinstalar(conexion)
+    indice_busqueda.instalar(conexion)
+
+
+def downgrade():
+    # El índice con claves estables también sirve al esquema anterior
+    pass
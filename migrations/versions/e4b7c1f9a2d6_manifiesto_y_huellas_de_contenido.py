@@ -0,0 +1,87 @@
+"""Manifiesto del escáner y huellas de contenido de los libros
+
+Revision ID: e4b7c1f9a2d6
+Revises: c6e2a8d4f913
+Create Date: 2026-10-19 12:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.infrastructure.database import indice_busqueda
+from app.infrastructure.database.extensions import GUID
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b7c1f9a2d6'
+down_revision = 'c6e2a8d4f913'
+branch_labels = None
+depends_on = None
+
+# Columnas de huella de los libros y sus índices
+HUELLAS = [
+    ("hash_parcial", "ix_libros_hash_parcial"),
+    ("hash_contenido", "ix_libros_hash_contenido"),
+]
+
+
+def _inspector():
+    return sa.inspect(op.get_bind())
+
+
+def _crear_manifiesto():
+    # A esta altura las claves ya son UUID binarios (5d9b3e6f0a21)
+    op.create_table(
+        "archivos_escaneados",
+        sa.Column("id", GUID(), primary_key=True),
+        sa.Column("path", sa.Text, nullable=False, unique=True),
+        sa.Column("tamano", sa.BigInteger, nullable=False),
+        sa.Column("mtime_ns", sa.BigInteger, nullable=False),
+        sa.Column("inodo", sa.BigInteger, nullable=False),
+        sa.Column(
+            "resultado",
+            sa.Enum("REGISTRADO", "DUPLICADO", "ERROR", name="resultado_escaneo_enum"),
+            nullable=False
+        ),
+        sa.Column("libro_id", GUID(), sa.ForeignKey("libros.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("fecha_escaneo", sa.DateTime),
+    )
+
+
+def upgrade():
+    # db.create_all() crea las tablas que faltan, pero no añade columnas a las que ya
+    # existen: solo se crea lo que falta
+    inspector = _inspector()
+    if not inspector.has_table("archivos_escaneados"):
+        _crear_manifiesto()
+    if "ix_archivos_escaneados_libro_id" not in {i["name"] for i in _inspector().get_indexes("archivos_escaneados")}:
+        op.create_index("ix_archivos_escaneados_libro_id", "archivos_escaneados", ["libro_id"])
+
+    columnas = {columna["name"] for columna in inspector.get_columns("libros")}
+    faltan = [columna for columna, _ in HUELLAS if columna not in columnas]
+    if faltan:
+        with op.batch_alter_table("libros") as batch:
+            for columna in faltan:
+                batch.add_column(sa.Column(columna, sa.String(64), nullable=True))
+
+    indices = {indice["name"] for indice in _inspector().get_indexes("libros")}
+    for columna, indice in HUELLAS:
+        if indice not in indices:
+            op.create_index(indice, "libros", [columna])
+
+
+def downgrade():
+    # El manifiesto se conserva: las revisiones anteriores (5d9b3e6f0a21) cuentan con él
+    indices = {indice["name"] for indice in _inspector().get_indexes("libros")}
+    for columna, indice in HUELLAS:
+        if indice in indices:
+            op.drop_index(indice, table_name="libros")
+
+    # En SQLite quitar columnas recrea la tabla, y los triggers del índice de búsqueda
+    # desaparecen con ella
+    conexion = op.get_bind()
+    indice_busqueda.desinstalar(conexion)
+    with op.batch_alter_table("libros") as batch:
+        for columna, _ in HUELLAS:
+            batch.drop_column(columna)
+    indice_busqueda.instalar(conexion)
@@ -0,0 +1,101 @@
+from typing import List
+from uuid import uuid4
+
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+from app.domain.entities import Progreso
+from app.infrastructure.database.buffer_progreso import BufferProgreso
+
+
+class RepoFalso:
+    """Guarda los lotes que recibe; falla con los libros de `borrados` o mientras `caido`."""
+    def __init__(self):
+        self.guardados: List[Progreso] = []
+        self.lotes: List[int] = []
+        self.borrados = set()
+        self.caido = False
+
+    def guardar_lote(self, progresos: List[Progreso]) -> None:
+        self.lotes.append(len(progresos))
+        if self.caido:
+            raise OperationalError("INSERT", {}, Exception("database is locked"))
+        if any(p.libro_id in self.borrados for p in progresos):
+            raise IntegrityError("INSERT", {}, Exception("FOREIGN KEY constraint failed"))
+        self.guardados.extend(progresos)
+
+
+def _progresos(n: int) -> List[Progreso]:
+    usuario_id = uuid4()
+    return [Progreso(usuario_id=usuario_id, libro_id=uuid4(), porcentaje=i) for i in range(n)]
+
+
+def _buffer(repo: RepoFalso, progresos: List[Progreso]) -> BufferProgreso:
+    buffer = BufferProgreso(repo)
+    for progreso in progresos:
+        buffer.registrar(progreso)
+    return buffer
+
+
+def test_un_lote_valido_se_guarda_en_una_escritura():
+    repo = RepoFalso()
+    buffer = _buffer(repo, _progresos(5))
+
+    assert buffer.vaciar() == 5
+    assert repo.lotes == [5]
+    assert buffer.pendientes() == 0
+
+
+def test_el_ultimo_progreso_de_cada_libro_sustituye_al_anterior():
+    repo = RepoFalso()
+    anterior = _progresos(1)[0]
+    ultimo = anterior.model_copy(update={"porcentaje": 80})
+    buffer = _buffer(repo, [anterior, ultimo])
+
+    assert buffer.obtener(ultimo.usuario_id, ultimo.libro_id).porcentaje == 80
+    assert buffer.vaciar() == 1
+    assert repo.guardados == [ultimo]
+
+
+def test_error_permanente_divide_el_lote_y_descarta_solo_el_progreso_roto():
+    repo = RepoFalso()
+    progresos = _progresos(8)
+    roto = progresos[5]
+    repo.borrados.add(roto.libro_id)
+    buffer = _buffer(repo, progresos)
+
+    assert buffer.vaciar() == 7
+    assert {p.id for p in repo.guardados} == {p.id for p in progresos if p is not roto}
+    assert buffer.pendientes() == 0
+    # Solo se dividen las mitades que contienen el progreso roto
+    assert repo.lotes == [8, 4, 4, 2, 1, 1, 2]
+
+
+def test_error_transitorio_reintenta_el_lote_entero():
+    repo = RepoFalso()
+    progresos = _progresos(4)
+    buffer = _buffer(repo, progresos)
+
+    repo.caido = True
+    assert buffer.vaciar() == 0
+    assert repo.lotes == [4]
+    assert buffer.pendientes() == 4
+    assert buffer.obtener(progresos[0].usuario_id, progresos[0].libro_id) == progresos[0]
+
+    repo.caido = False
+    assert buffer.vaciar() == 4
+    assert buffer.pendientes() == 0
+
+
+def test_un_reintento_no_pisa_un_progreso_registrado_despues():
+    repo = RepoFalso()
+    anterior = _progresos(1)[0]
+    buffer = _buffer(repo, [anterior])
+
+    repo.caido = True
+    buffer.vaciar()
+    nuevo = anterior.model_copy(update={"porcentaje": 90})
+    buffer.registrar(nuevo)
+
+    repo.caido = False
+    assert buffer.vaciar() == 1
+    assert repo.guardados == [nuevo]
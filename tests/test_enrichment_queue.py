@@ -0,0 +1,163 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.application.services.metadata import enrichment_queue
+from app.application.services.metadata.enrichment_queue import EnrichmentQueue, EstadoTrabajo, SinResultados
+from app.application.services.metadata.enrichment_worker import EnrichmentWorker
+from app.application.services.metadata.external.http_client import ProveedorNoDisponible
+
+
+class Reloj:
+    def __init__(self):
+        self.ahora = 1_000_000.0
+
+    def time(self) -> float:
+        return self.ahora
+
+    def avanzar(self, segundos: float) -> None:
+        self.ahora += segundos
+
+
+@pytest.fixture
+def reloj(monkeypatch):
+    reloj = Reloj()
+    monkeypatch.setattr(enrichment_queue, "time", SimpleNamespace(time=reloj.time))
+    return reloj
+
+
+@pytest.fixture
+def cola(tmp_path, reloj):
+    cola = EnrichmentQueue(tmp_path / "cola.db", max_intentos=3, espera_reintento=10, concesion=60)
+    yield cola
+    cola.cerrar()
+
+
+def _estado(cola: EnrichmentQueue, trabajo_id: int):
+    return cola._conectar().execute(
+        "SELECT estado, intentos FROM trabajos WHERE id = ?", (trabajo_id,)
+    ).fetchone()
+
+
+def test_reclamar_por_prioridad_y_antiguedad(cola, reloj):
+    normal, urgente, tardio = uuid4(), uuid4(), uuid4()
+    cola.encolar(normal, {"n": 1})
+    reloj.avanzar(1)
+    cola.encolar(tardio, {"n": 2})
+    cola.encolar(urgente, {"n": 3}, prioridad=5)
+
+    assert [t["libro_id"] for t in cola.reclamar(3)] == [urgente, normal, tardio]
+    assert cola.reclamar(3) == []
+
+
+def test_volver_a_encolar_conserva_la_mayor_prioridad(cola):
+    libro_id, otro = uuid4(), uuid4()
+    cola.encolar(libro_id, {"v": 1}, prioridad=5)
+    cola.encolar(otro, {}, prioridad=3)
+    cola.encolar(libro_id, {"v": 2}, prioridad=0)
+
+    trabajo = cola.reclamar()[0]
+    assert trabajo["libro_id"] == libro_id
+    assert trabajo["datos"] == {"v": 2}
+    assert cola.progreso()["total"] == 2
+
+
+def test_fallar_reprograma_con_espera_exponencial(cola, reloj):
+    cola.encolar(uuid4(), {})
+    trabajo = cola.reclamar()[0]
+
+    assert cola.fallar(trabajo["id"], "error de red")
+    assert _estado(cola, trabajo["id"]) == (EstadoTrabajo.PENDIENTE.value, 1)
+    reloj.avanzar(9)
+    assert cola.reclamar() == []
+    reloj.avanzar(1)
+    trabajo = cola.reclamar()[0]
+    assert trabajo["intentos"] == 1
+
+    assert cola.fallar(trabajo["id"], "error de red")
+    reloj.avanzar(19)
+    assert cola.reclamar() == []
+    reloj.avanzar(1)
+    assert cola.reclamar()[0]["intentos"] == 2
+
+
+def test_fallido_tras_agotar_los_intentos(cola, reloj):
+    cola.encolar(uuid4(), {})
+    for intento in range(3):
+        reloj.avanzar(1000)
+        trabajo = cola.reclamar()[0]
+        assert cola.fallar(trabajo["id"], "error") == (intento < 2)
+
+    assert _estado(cola, trabajo["id"]) == (EstadoTrabajo.FALLIDO.value, 3)
+    reloj.avanzar(1000)
+    assert cola.reclamar() == []
+
+    assert cola.reintentar_fallidos() == 1
+    trabajo = cola.reclamar()[0]
+    assert trabajo["intentos"] == 0
+
+
+def test_terminados_no_se_reclaman_ni_se_pueden_fallar(cola, reloj):
+    cola.encolar(uuid4(), {})
+    trabajo = cola.reclamar()[0]
+    cola.completar(trabajo["id"])
+
+    assert not cola.fallar(trabajo["id"], "tarde")
+    assert _estado(cola, trabajo["id"]) == (EstadoTrabajo.HECHO.value, 0)
+    reloj.avanzar(1000)
+    assert cola.reclamar() == []
+    assert cola.purgar_completados() == 1
+
+
+def test_sin_resultados_solo_se_reactiva_si_se_pide(cola):
+    cola.encolar(uuid4(), {})
+    trabajo = cola.reclamar()[0]
+    cola.completar(trabajo["id"], EstadoTrabajo.SIN_RESULTADOS)
+
+    assert cola.reintentar_fallidos() == 0
+    assert cola.reintentar_fallidos(sin_resultados=True) == 1
+    assert cola.reclamar()[0]["id"] == trabajo["id"]
+
+
+def test_concesion_vencida_permite_reclamar_de_nuevo(cola, reloj):
+    cola.encolar(uuid4(), {})
+    trabajo = cola.reclamar()[0]
+
+    reloj.avanzar(59)
+    assert cola.reclamar() == []
+    reloj.avanzar(1)
+    recuperado = cola.reclamar()[0]
+    assert recuperado["id"] == trabajo["id"]
+
+    cola.completar(recuperado["id"])
+    assert cola.progreso()[EstadoTrabajo.HECHO.value] == 1
+
+
+def test_worker_distingue_sin_resultados_de_proveedor_caido(cola):
+    hecho, desconocido, caido = uuid4(), uuid4(), uuid4()
+    for libro_id in (hecho, desconocido, caido):
+        cola.encolar(libro_id, {})
+
+    errores = {hecho: None, desconocido: SinResultados(), caido: ProveedorNoDisponible("sin respuesta")}
+    worker = EnrichmentWorker(cola, lambda trabajos: [errores[t["libro_id"]] for t in trabajos], lote=10)
+    assert worker.procesar_pendientes() == 3
+
+    estados = dict(cola._conectar().execute("SELECT libro_id, estado FROM trabajos").fetchall())
+    assert estados == {
+        str(hecho): EstadoTrabajo.HECHO.value,
+        str(desconocido): EstadoTrabajo.SIN_RESULTADOS.value,
+        str(caido): EstadoTrabajo.PENDIENTE.value,
+    }
+
+
+def test_worker_falla_todo_el_lote_si_procesar_lanza(cola):
+    cola.encolar(uuid4(), {})
+    cola.encolar(uuid4(), {})
+
+    def procesar(trabajos):
+        raise RuntimeError("base de datos caída")
+
+    EnrichmentWorker(cola, procesar, lote=10).procesar_pendientes()
+    assert cola.progreso()[EstadoTrabajo.PENDIENTE.value] == 2
+    assert {intentos for _, intentos in cola._conectar().execute("SELECT estado, intentos FROM trabajos")} == {1}
@@ -0,0 +1,116 @@
+from pathlib import Path
+
+from app.application.services.watcher.evento_archivo import EventoArchivo, TipoEvento
+from app.application.services.watcher.library_watcher import LoteEventos
+
+BIBLIOTECA = Path("/biblioteca")
+
+
+def _lote(*eventos: EventoArchivo) -> LoteEventos:
+    lote = LoteEventos({".epub", ".pdf"})
+    for evento in eventos:
+        lote.agregar(evento)
+    return lote
+
+
+def test_lote_vacio_es_falso():
+    assert not _lote()
+
+
+def test_varios_cambios_de_un_archivo_se_combinan():
+    libro = BIBLIOTECA / "libro.epub"
+    lote = _lote(
+        EventoArchivo(TipoEvento.CREADO, libro),
+        EventoArchivo(TipoEvento.MODIFICADO, libro),
+        EventoArchivo(TipoEvento.MODIFICADO, libro),
+    )
+    assert list(lote.cambiados) == [libro]
+    assert not lote.eliminados and not lote.movimientos
+
+
+def test_extensiones_no_soportadas_se_ignoran():
+    lote = _lote(
+        EventoArchivo(TipoEvento.CREADO, BIBLIOTECA / "notas.txt"),
+        EventoArchivo(TipoEvento.ELIMINADO, BIBLIOTECA / "portada.jpg"),
+    )
+    assert not lote
+
+
+def test_la_extension_no_distingue_mayusculas():
+    libro = BIBLIOTECA / "LIBRO.PDF"
+    assert list(_lote(EventoArchivo(TipoEvento.CREADO, libro)).cambiados) == [libro]
+
+
+def test_eliminar_descarta_el_cambio_pendiente():
+    libro = BIBLIOTECA / "libro.epub"
+    lote = _lote(EventoArchivo(TipoEvento.CREADO, libro), EventoArchivo(TipoEvento.ELIMINADO, libro))
+    assert not lote.cambiados
+    assert lote.eliminados == {libro}
+
+
+def test_volver_a_crear_anula_la_eliminacion():
+    libro = BIBLIOTECA / "libro.epub"
+    lote = _lote(EventoArchivo(TipoEvento.ELIMINADO, libro), EventoArchivo(TipoEvento.CREADO, libro))
+    assert not lote.eliminados
+    assert list(lote.cambiados) == [libro]
+
+
+def test_eliminar_un_directorio_se_registra_aunque_no_tenga_extension():
+    carpeta = BIBLIOTECA / "Autor"
+    lote = _lote(EventoArchivo(TipoEvento.ELIMINADO, carpeta, es_directorio=True))
+    assert lote.eliminados == {carpeta}
+
+
+def test_mover_un_archivo_modificado_lleva_el_cambio_a_la_ruta_nueva():
+    origen, destino = BIBLIOTECA / "a.epub", BIBLIOTECA / "b.epub"
+    lote = _lote(
+        EventoArchivo(TipoEvento.MODIFICADO, origen),
+        EventoArchivo(TipoEvento.MOVIDO, origen, destino),
+    )
+    assert list(lote.cambiados) == [destino]
+    assert lote.movimientos == [(origen, destino, False)]
+
+
+def test_mover_sobre_un_archivo_eliminado_lo_conserva():
+    origen, destino = BIBLIOTECA / "a.epub", BIBLIOTECA / "b.epub"
+    lote = _lote(
+        EventoArchivo(TipoEvento.ELIMINADO, destino),
+        EventoArchivo(TipoEvento.MOVIDO, origen, destino),
+    )
+    assert not lote.eliminados
+    assert lote.movimientos == [(origen, destino, False)]
+
+
+def test_renombrar_a_una_extension_ignorada_es_una_eliminacion():
+    libro = BIBLIOTECA / "libro.epub"
+    lote = _lote(
+        EventoArchivo(TipoEvento.MODIFICADO, libro),
+        EventoArchivo(TipoEvento.MOVIDO, libro, BIBLIOTECA / "libro.epub.bak"),
+    )
+    assert not lote.cambiados and not lote.movimientos
+    assert lote.eliminados == {libro}
+
+
+def test_completar_una_descarga_es_una_creacion():
+    libro = BIBLIOTECA / "libro.epub"
+    lote = _lote(EventoArchivo(TipoEvento.MOVIDO, BIBLIOTECA / "libro.epub.part", libro))
+    assert list(lote.cambiados) == [libro]
+    assert not lote.movimientos
+
+
+def test_mover_un_directorio_lleva_sus_cambios_pendientes():
+    origen, destino = BIBLIOTECA / "Autor", BIBLIOTECA / "Otro autor"
+    fuera = BIBLIOTECA / "suelto.epub"
+    lote = _lote(
+        EventoArchivo(TipoEvento.CREADO, origen / "Serie" / "libro.epub"),
+        EventoArchivo(TipoEvento.CREADO, fuera),
+        EventoArchivo(TipoEvento.MOVIDO, origen, destino, es_directorio=True),
+    )
+    assert set(lote.cambiados) == {destino / "Serie" / "libro.epub", fuera}
+    assert lote.movimientos == [(origen, destino, True)]
+
+
+def test_desbordamiento():
+    lote = _lote(EventoArchivo(TipoEvento.DESBORDADO, BIBLIOTECA))
+    assert lote.desbordado
+    assert lote
@@ -0,0 +1,107 @@
+from typing import Dict, List
+from uuid import uuid4
+
+import pytest
+
+from app.application.services.name_identity_map import NameIdentityMap, normalizar_nombre
+from app.domain.entities import Autor, Serie
+
+
+class ServicioFalso:
+    """Servicio de autores o series con `listar_nombres` y `registrar_lote`."""
+    def __init__(self, nombres: Dict[str, object] = None):
+        self.nombres = [{"id": id, "nombre": nombre} for nombre, id in (nombres or {}).items()]
+        self.lotes: List[list] = []
+
+    def listar_nombres(self) -> List[Dict]:
+        return self.nombres
+
+    def registrar_lote(self, entidades: list) -> None:
+        self.lotes.append(entidades)
+
+
+@pytest.fixture
+def marti():
+    return uuid4()
+
+
+@pytest.fixture
+def autores(marti):
+    return ServicioFalso({"José Martí": marti, "Ana María Matute": uuid4()})
+
+
+@pytest.fixture
+def series():
+    return ServicioFalso({"Episodios Nacionales": uuid4()})
+
+
+@pytest.fixture
+def mapa(autores, series):
+    mapa = NameIdentityMap(autores, series)
+    mapa.cargar()
+    return mapa
+
+
+@pytest.mark.parametrize("nombre", ["José Martí", "jose marti", "  JOSÉ   MARTÍ ", "José Martí"])
+def test_nombres_equivalentes_resuelven_al_mismo_autor(mapa, marti, nombre):
+    assert mapa.autor_id(nombre) == marti
+
+
+@pytest.mark.parametrize("nombre", ["Ana", "Ana María", "María Matute", "Martí", ""])
+def test_solo_coincidencias_exactas(mapa, nombre):
+    assert mapa.autor_id(nombre) is None
+
+
+def test_normalizar_nombre():
+    assert normalizar_nombre("  Gabriel  GARCÍA\tMárquez ") == "gabriel garcia marquez"
+    assert normalizar_nombre(None) == ""
+
+
+def test_preparar_crea_solo_los_que_faltan_una_vez(mapa, autores, series, marti):
+    mapa.preparar([
+        {"autores": ["José Martí", "Benito Pérez Galdós"], "serie": "Episodios Nacionales"},
+        {"autores": ["benito perez galdos"], "serie": "Torquemada"},
+        {"autores": [], "serie": "Sin autor"},
+    ])
+
+    assert len(autores.lotes) == 1
+    [galdos] = autores.lotes[0]
+    assert isinstance(galdos, Autor) and galdos.nombre == "Benito Pérez Galdós"
+    assert mapa.autor_id("BENITO PÉREZ GALDÓS") == galdos.id
+    assert mapa.autor_id("José Martí") == marti
+
+    # Las series sin autor no se crean; las nuevas se asocian al primer autor de su libro
+    assert len(series.lotes) == 1
+    [torquemada] = series.lotes[0]
+    assert isinstance(torquemada, Serie) and torquemada.autor_ids == [galdos.id]
+    assert mapa.serie_id("torquemada") == torquemada.id
+    assert mapa.serie_id("Sin autor") is None
+
+
+def test_preparar_sin_nombres_nuevos_no_escribe(mapa, autores, series):
+    mapa.preparar([{"autores": ["jose marti"], "serie": "episodios nacionales"}])
+    assert autores.lotes == [] and series.lotes == []
+
+
+def test_descartar_olvida_las_altas_de_un_lote_deshecho(mapa):
+    mapa.preparar([{"autores": ["Emilia Pardo Bazán"], "serie": "Los pazos"}])
+    mapa.descartar()
+
+    assert mapa.autor_id("Emilia Pardo Bazán") is None
+    assert mapa.serie_id("Los pazos") is None
+    assert mapa.autor_id("José Martí") is not None
+
+
+def test_confirmar_conserva_las_altas(mapa):
+    mapa.preparar([{"autores": ["Rosalía de Castro"]}])
+    mapa.confirmar()
+    mapa.descartar()
+
+    assert mapa.autor_id("rosalia de castro") is not None
+
+
+def test_preparar_carga_el_mapa_si_hace_falta(autores, series, marti):
+    mapa = NameIdentityMap(autores, series)
+    mapa.preparar([{"autores": ["José Martí"]}])
+    assert mapa.autor_id("José Martí") == marti
+    assert autores.lotes == []